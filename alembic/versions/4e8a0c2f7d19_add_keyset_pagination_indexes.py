@@ -0,0 +1,31 @@
+"""add keyset pagination indexes
+
+Revision ID: 4e8a0c2f7d19
+Revises: b7d3e1a94c52
+Create Date: 2026-10-16 11:02:17.504113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8a0c2f7d19'
+down_revision: Union[str, None] = 'b7d3e1a94c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_categories_sequence_id', 'categories', ['sequence', 'id'], unique=False)
+    op.create_index('ix_products_sequence_id', 'products', ['sequence', 'id'], unique=False)
+    op.create_index('ix_skus_sequence_id', 'skus', ['sequence', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_skus_sequence_id', table_name='skus')
+    op.drop_index('ix_products_sequence_id', table_name='products')
+    op.drop_index('ix_categories_sequence_id', table_name='categories')
@@ -0,0 +1,49 @@
+"""add trigram search indexes
+
+Revision ID: 9c1f5b7e2a64
+Revises: 4e8a0c2f7d19
+Create Date: 2026-10-16 13:40:52.118302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1f5b7e2a64'
+down_revision: Union[str, None] = '4e8a0c2f7d19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs searched with ILIKE '%term%'
+TRIGRAM_COLUMNS = [
+    ('skus', 'name'),
+    ('products', 'name'),
+    ('categories', 'name'),
+    ('suppliers', 'name'),
+    ('suppliers', 'email'),
+    ('suppliers', 'contact'),
+    ('attributes', 'name'),
+    ('attributes', 'code'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'ix_{table}_{column}_trgm',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
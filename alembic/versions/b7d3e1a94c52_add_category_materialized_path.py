@@ -0,0 +1,67 @@
+"""add category materialized path
+
+Revision ID: b7d3e1a94c52
+Revises: 30f9c89c648b
+Create Date: 2026-10-16 09:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e1a94c52'
+down_revision: Union[str, None] = '30f9c89c648b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('categories', sa.Column('ancestor_ids', postgresql.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False))
+    op.add_column('categories', sa.Column('ancestor_names', postgresql.ARRAY(sa.String(length=100)), server_default=sa.text("'{}'"), nullable=False))
+    op.add_column('categories', sa.Column('ancestor_slugs', postgresql.ARRAY(sa.String(length=100)), server_default=sa.text("'{}'"), nullable=False))
+    op.add_column('categories', sa.Column('root_category_type', sa.String(length=100), nullable=True))
+
+    # Backfill the materialized path of the existing categories
+    op.execute("""
+        WITH RECURSIVE paths AS (
+            SELECT c.id,
+                   ARRAY[]::INTEGER[] AS ancestor_ids,
+                   ARRAY[]::VARCHAR[] AS ancestor_names,
+                   ARRAY[]::VARCHAR[] AS ancestor_slugs,
+                   ct.name::VARCHAR AS root_category_type
+            FROM categories c
+            JOIN category_types ct ON ct.id = c.category_type_id
+            WHERE c.parent_id IS NULL
+            UNION ALL
+            SELECT c.id,
+                   p.ancestor_ids || parent.id,
+                   p.ancestor_names || parent.name,
+                   p.ancestor_slugs || parent.slug,
+                   p.root_category_type
+            FROM categories c
+            JOIN paths p ON p.id = c.parent_id
+            JOIN categories parent ON parent.id = c.parent_id
+        )
+        UPDATE categories
+        SET ancestor_ids = paths.ancestor_ids,
+            ancestor_names = paths.ancestor_names,
+            ancestor_slugs = paths.ancestor_slugs,
+            root_category_type = paths.root_category_type
+        FROM paths
+        WHERE categories.id = paths.id
+    """)
+
+    op.create_index('ix_categories_ancestor_ids', 'categories', ['ancestor_ids'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_ancestor_ids', table_name='categories', postgresql_using='gin')
+    op.drop_column('categories', 'root_category_type')
+    op.drop_column('categories', 'ancestor_slugs')
+    op.drop_column('categories', 'ancestor_names')
+    op.drop_column('categories', 'ancestor_ids')
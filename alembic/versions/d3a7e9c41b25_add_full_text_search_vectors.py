@@ -0,0 +1,69 @@
+"""add full text search vectors
+
+Revision ID: d3a7e9c41b25
+Revises: 9c1f5b7e2a64
+Create Date: 2026-10-16 15:12:08.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7e9c41b25'
+down_revision: Union[str, None] = '9c1f5b7e2a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NAME_DESCRIPTION_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('categories', 'products'):
+        op.add_column(table, sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(NAME_DESCRIPTION_SEARCH_VECTOR, persisted=True),
+            nullable=True
+        ))
+    op.add_column('skus', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), nullable=True
+    ))
+
+    # SKU vectors include attribute values, so they are filled here and
+    # maintained by the application afterwards
+    op.execute(
+        """
+        UPDATE skus SET search_vector =
+            setweight(to_tsvector('simple', coalesce(skus.name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(skus.description, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce((
+                SELECT string_agg(sku_attribute_value.value, ' ')
+                FROM sku_attribute_value
+                WHERE sku_attribute_value.sku_id = skus.id
+            ), '')), 'C')
+        """
+    )
+
+    for table in ('categories', 'products', 'skus'):
+        op.create_index(
+            f'ix_{table}_search_vector',
+            table,
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('skus', 'products', 'categories'):
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
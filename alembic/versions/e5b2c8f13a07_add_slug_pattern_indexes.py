@@ -0,0 +1,45 @@
+"""add slug pattern indexes
+
+Revision ID: e5b2c8f13a07
+Revises: d3a7e9c41b25
+Create Date: 2026-10-16 23:12:41.630215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c8f13a07'
+down_revision: Union[str, None] = 'd3a7e9c41b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose taken slugs bulk inserts look up with LIKE 'prefix%'; the
+# unique index on slug cannot serve prefix matches under a non-C collation
+SLUG_TABLES = [
+    'skus',
+    'products',
+    'categories',
+    'category_types',
+    'suppliers',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SLUG_TABLES:
+        op.create_index(
+            f'ix_{table}_slug_pattern',
+            table,
+            ['slug'],
+            unique=False,
+            postgresql_ops={'slug': 'varchar_pattern_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(SLUG_TABLES):
+        op.drop_index(f'ix_{table}_slug_pattern', table_name=table)
@@ -1,28 +1,51 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.session import get_db
 from app.core.security import verify_token
-from app.models import Users, Role
+from app.models import Role
 from app.repositories.user_repository import user_repository
 
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user, with only what authorization checks need."""
+    id: int
+    role: Role
+    is_active: bool
+
+
+# Principals by user id; UserService invalidates an entry when it changes
+# the user, other processes see the change after the TTL at the latest
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> Users:
+) -> Principal:
     """
     Get current authenticated user from JWT token.
 
+    The user is looked up in the database only when it is not in
+    principal_cache, so most requests need no query to authenticate.
+
     Args:
         credentials: HTTP Bearer token credentials
         db: Database session
 
     Returns:
-        Users: Current authenticated user
+        Principal: Current authenticated user
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -44,16 +67,25 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
 
-    user = await user_repository.get(db, id=user_id_int)
-    if user is None or not user.is_active:
+    principal = principal_cache.get(user_id_int)
+    if principal is None:
+        user = await user_repository.get(db, id=user_id_int)
+        if user is None:
+            raise credentials_exception
+        principal = Principal(
+            id=user.id, role=user.role, is_active=user.is_active
+        )
+        principal_cache.set(user_id_int, principal)
+
+    if not principal.is_active:
         raise credentials_exception
 
-    return user
+    return principal
 
 
 async def get_current_admin_user(
-    current_user: Users = Depends(get_current_user)
-) -> Users:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Get current user and ensure they have ADMIN role.
     Used for admin-only endpoints.
@@ -67,8 +99,8 @@ async def get_current_admin_user(
 
 
 async def get_current_manager_or_admin_user(
-    current_user: Users = Depends(get_current_user)
-) -> Users:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Get current user and ensure they have ADMIN, MANAGER, or SYSTEM role.
     Used for management-level endpoints.
@@ -81,7 +113,9 @@ async def get_current_manager_or_admin_user(
     return current_user
 
 
-def check_resource_ownership(current_user: Users, resource_created_by: int) -> bool:
+def check_resource_ownership(
+    current_user: Principal, resource_created_by: int
+) -> bool:
     """
     Check if user can modify a resource based on ownership and role.
 
@@ -105,7 +139,7 @@ def check_resource_ownership(current_user: Users, resource_created_by: int) -> b
     return current_user.id == resource_created_by
 
 
-def require_resource_ownership(current_user: Users, resource_created_by: int):
+def require_resource_ownership(current_user: Principal, resource_created_by: int):
     """
     Raise exception if user doesn't have permission to modify resource.
 
@@ -9,13 +9,14 @@ from app.schemas.attribute_schema import (
     AttributeCreate,
     AttributeUpdate
 )
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -30,6 +31,13 @@ async def get_attributes(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     code: Optional[str] = Query(None, description="Filter by code (partial match)"),
     data_type: Optional[str] = Query(
@@ -43,7 +51,7 @@ async def get_attributes(
 
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100, max: 1000)
-    - **name**: Filter by name (partial match)
+    - **name**: Filter by name (partial match, most relevant first)
     - **code**: Filter by code (partial match)
     - **data_type**: Filter by data type (TEXT, NUMBER, BOOLEAN, DATE)
     - **is_active**: Filter by active status (true/false)
@@ -55,7 +63,9 @@ async def get_attributes(
         name=name,
         code=code,
         data_type=data_type,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -65,7 +75,9 @@ async def get_attributes(
         data=attributes,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor,
+        ranked=name is not None
     )
 
 
@@ -77,7 +89,7 @@ async def get_attributes(
 async def create_attribute(
     attribute_create: AttributeCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new attribute.
@@ -126,7 +138,7 @@ async def update_attribute(
     attribute_id: int,
     attribute_update: AttributeUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing attribute.
@@ -153,7 +165,7 @@ async def update_attribute(
 async def delete_attribute(
     attribute_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete an attribute.
@@ -10,8 +10,7 @@ from app.core.security import (
 )
 from app.services.user_service import user_service
 from app.schemas.user_schema import UserLogin, Token, TokenRefresh
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 security = HTTPBearer()
@@ -112,7 +111,7 @@ async def refresh_token(
     status_code=status.HTTP_200_OK
 )
 async def logout(
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     User logout endpoint.
@@ -1,5 +1,5 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.session import get_db
@@ -10,13 +10,15 @@ from app.schemas.category_schema import (
     CategoryUpdate
 )
 from app.schemas.product_schema import ProductResponse
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.utils.etag import ConditionalRequest
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -27,10 +29,18 @@ router = APIRouter()
     status_code=status.HTTP_200_OK
 )
 async def get_categories(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(
         None, description="Filter by name (partial match)"
     ),
@@ -46,6 +56,7 @@ async def get_categories(
     is_active: Optional[bool] = Query(
         None, description="Filter by active status"
     ),
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -53,11 +64,14 @@ async def get_categories(
 
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100, max: 1000)
-    - **name**: Filter by name (partial match)
+    - **name**: Filter by name (partial match, most relevant first)
     - **slug**: Filter by slug (exact match)
     - **category_type_id**: Filter by category type ID
     - **parent_id**: Filter by parent ID
     - **is_active**: Filter by active status (true/false)
+
+    The response carries an ETag; a request whose If-None-Match has it gets
+    304 Not Modified without the page being loaded.
     """
 
     categories, total = await category_service.get_categories_with_filter(
@@ -68,8 +82,12 @@ async def get_categories(
         slug=slug,
         category_type_id=category_type_id,
         parent_id=parent_id,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor,
+        conditional=conditional
     )
+    conditional.set_etag(response)
 
     # Calculate page number (1-based)
     page = (skip // limit) + 1
@@ -78,7 +96,9 @@ async def get_categories(
         data=categories,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor,
+        ranked=name is not None
     )
 
 
@@ -90,7 +110,7 @@ async def get_categories(
 async def create_category(
     category_create: CategoryCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new category.
@@ -118,21 +138,27 @@ async def create_category(
 )
 async def get_category(
     category_id: int,
+    response: Response,
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get a specific category by ID.
 
+    Answers 304 Not Modified without loading the category when If-None-Match
+    has its current ETag.
+
     - **category_id**: The ID of the category to retrieve
     """
     category = await category_service.get_category_by_id(
-        db=db, category_id=category_id
+        db=db, category_id=category_id, conditional=conditional
     )
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Category with id {category_id} not found"
         )
+    conditional.set_etag(response)
     return create_single_item_response(data=category)
 
 
@@ -145,7 +171,7 @@ async def update_category(
     category_id: int,
     category_update: CategoryUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing category.
@@ -180,7 +206,7 @@ async def update_category(
 async def delete_category(
     category_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a category.
@@ -205,6 +231,13 @@ async def get_category_children(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -218,7 +251,9 @@ async def get_category_children(
         db=db,
         parent_id=category_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -228,7 +263,8 @@ async def get_category_children(
         data=children,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
 
 
@@ -243,6 +279,13 @@ async def get_category_products(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -256,7 +299,9 @@ async def get_category_products(
         db=db,
         category_id=category_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -266,5 +311,6 @@ async def get_category_products(
         data=products,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
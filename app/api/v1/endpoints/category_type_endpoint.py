@@ -10,13 +10,14 @@ from app.schemas.category_type_schema import (
     CategoryTypeUpdate
 )
 from app.schemas.category_schema import CategoryResponse
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -31,6 +32,13 @@ async def get_category_types(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(None, description="Filter by name (exact match)"),
     slug: Optional[str] = Query(None, description="Filter by slug (exact match)"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
@@ -45,7 +53,9 @@ async def get_category_types(
     - **is_active**: Filter by active status (true/false)
     """
     category_types, total = await category_type_service.get_category_types_with_filter(
-        db=db, skip=skip, limit=limit, name=name, slug=slug, is_active=is_active
+        db=db, skip=skip, limit=limit, name=name, slug=slug, is_active=is_active,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -55,7 +65,8 @@ async def get_category_types(
         data=category_types,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
 
 
@@ -67,7 +78,7 @@ async def get_category_types(
 async def create_category_type(
     category_type_create: CategoryTypeCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new category type.
@@ -114,7 +125,7 @@ async def update_category_type(
     category_type_id: int,
     category_type_update: CategoryTypeUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing category type.
@@ -139,7 +150,7 @@ async def update_category_type(
 async def delete_category_type(
     category_type_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a category type.
@@ -164,6 +175,13 @@ async def get_categories_by_type(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -177,7 +195,9 @@ async def get_categories_by_type(
         db=db,
         category_type_id=category_type_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -187,5 +207,6 @@ async def get_categories_by_type(
         data=categories,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
@@ -9,13 +9,14 @@ from app.schemas.pricelist_schema import (
     PricelistCreate,
     PricelistUpdate
 )
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -30,6 +31,13 @@ async def get_pricelists(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     code: Optional[str] = Query(None, description="Filter by code (partial match)"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
@@ -50,7 +58,9 @@ async def get_pricelists(
         limit=limit,
         name=name,
         code=code,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -60,7 +70,8 @@ async def get_pricelists(
         data=pricelists,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
 
 
@@ -72,7 +83,7 @@ async def get_pricelists(
 async def create_pricelist(
     pricelist_create: PricelistCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new pricelist.
@@ -120,7 +131,7 @@ async def update_pricelist(
     pricelist_id: int,
     pricelist_update: PricelistUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing pricelist.
@@ -146,7 +157,7 @@ async def update_pricelist(
 async def delete_pricelist(
     pricelist_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a pricelist.
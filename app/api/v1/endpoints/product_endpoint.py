@@ -1,25 +1,34 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter, Depends, HTTPException, Query, Request, Response, status
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.session import get_db
 from app.services.product_service import product_service
+from app.services.import_service import import_service
 from app.schemas.product_schema import (
     ProductResponse,
     ProductCreate,
     ProductUpdate
 )
 from app.schemas.sku_schema import SkuResponse
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.import_schema import ImportResult
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.utils.etag import ConditionalRequest
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
+# Bulk operations, mounted on the manager router
+bulk_router = APIRouter()
+
 
 @router.get(
     "/",
@@ -27,10 +36,18 @@ router = APIRouter()
     status_code=status.HTTP_200_OK
 )
 async def get_products(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(
         None, description="Filter by name (partial match)"
     ),
@@ -46,6 +63,7 @@ async def get_products(
     is_active: Optional[bool] = Query(
         None, description="Filter by active status"
     ),
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -53,11 +71,14 @@ async def get_products(
 
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100, max: 1000)
-    - **name**: Filter by name (partial match)
+    - **name**: Filter by name (partial match, most relevant first)
     - **slug**: Filter by slug (exact match)
     - **category_id**: Filter by category ID
     - **supplier_id**: Filter by supplier ID
     - **is_active**: Filter by active status (true/false)
+
+    The response carries an ETag; a request whose If-None-Match has it gets
+    304 Not Modified without the page being loaded.
     """
 
     products, total = await product_service.get_products_with_filter(
@@ -68,8 +89,12 @@ async def get_products(
         slug=slug,
         category_id=category_id,
         supplier_id=supplier_id,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor,
+        conditional=conditional
     )
+    conditional.set_etag(response)
 
     # Calculate page number (1-based)
     page = (skip // limit) + 1
@@ -78,7 +103,9 @@ async def get_products(
         data=products,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor,
+        ranked=name is not None
     )
 
 
@@ -90,7 +117,7 @@ async def get_products(
 async def create_product(
     product_create: ProductCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new product.
@@ -115,6 +142,52 @@ async def create_product(
     return create_single_item_response(data=product)
 
 
+@bulk_router.post(
+    "/import",
+    response_model=SingleItemResponse[ImportResult],
+    status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            }
+        }
+    }
+)
+async def import_products(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Import products with their SKUs from an NDJSON body.
+
+    The body holds one product per line, in the product create format with an
+    extra `skus` list of SKUs in the SKU create format (without `product_id`).
+    It is read as a stream and imported in chunks, each validated with the
+    same rules as the create endpoints and committed on its own, so bodies of
+    any size are imported with bounded memory.
+
+    A line that fails validation is rejected together with its SKUs; the other
+    lines are still imported.
+
+    **Result:**
+    - `lines`: Number of non-blank lines read
+    - `products_created` / `skus_created`: Number of created rows
+    - `failed`: Number of rejected lines
+    - `chunks`: Number of chunks imported
+    - `errors`: Line number and error of rejected lines, in line order
+    - `errors_truncated`: Whether more lines failed than errors are reported
+    """
+    result = await import_service.import_products(
+        db=db, chunks=request.stream(), created_by=current_user.id
+    )
+    return create_single_item_response(data=result)
+
+
 @router.get(
     "/{product_id}",
     response_model=SingleItemResponse[ProductResponse],
@@ -122,21 +195,27 @@ async def create_product(
 )
 async def get_product(
     product_id: int,
+    response: Response,
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get a specific product by ID.
 
+    Answers 304 Not Modified without loading the product when If-None-Match
+    has its current ETag.
+
     - **product_id**: The ID of the product to retrieve
     """
     product = await product_service.get_product_by_id(
-        db=db, product_id=product_id
+        db=db, product_id=product_id, conditional=conditional
     )
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with id {product_id} not found"
         )
+    conditional.set_etag(response)
     return create_single_item_response(data=product)
 
 
@@ -149,7 +228,7 @@ async def update_product(
     product_id: int,
     product_update: ProductUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing product.
@@ -189,7 +268,7 @@ async def update_product(
 async def delete_product(
     product_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a product.
@@ -214,6 +293,13 @@ async def get_product_skus(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -227,7 +313,9 @@ async def get_product_skus(
         db=db,
         product_id=product_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -237,5 +325,6 @@ async def get_product_skus(
         data=skus,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
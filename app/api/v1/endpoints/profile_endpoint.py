@@ -10,8 +10,7 @@ from app.schemas.user_schema import (
 )
 from app.schemas.base import SingleItemResponse
 from app.utils.response_helpers import create_single_item_response
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -22,7 +21,8 @@ router = APIRouter()
     status_code=status.HTTP_200_OK
 )
 async def get_my_profile(
-    current_user: Users = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get current user's profile.
@@ -30,7 +30,8 @@ async def get_my_profile(
     **Requires authentication** (enforced at router level).
     All authenticated users can view their own profile.
     """
-    return create_single_item_response(data=current_user)
+    user = await user_service.get_user_by_id(db=db, user_id=current_user.id)
+    return create_single_item_response(data=user)
 
 
 @router.put(
@@ -41,7 +42,7 @@ async def get_my_profile(
 async def update_my_profile(
     user_update: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update current user's profile.
@@ -83,7 +84,7 @@ async def update_my_profile(
 async def change_my_password(
     password_change: UserChangePassword,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Change current user's password.
@@ -0,0 +1,57 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.session import get_db
+from app.services.search_service import search_service
+from app.schemas.search_schema import SearchHit, SearchType
+from app.schemas.base import MultipleItemsResponse
+from app.utils.response_helpers import create_multiple_items_response
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=MultipleItemsResponse[SearchHit],
+    status_code=status.HTTP_200_OK
+)
+async def search(
+    q: str = Query(
+        ..., min_length=1, max_length=200,
+        description="Search terms (web search syntax: \"quoted phrase\", or, -not)"
+    ),
+    types: Optional[List[SearchType]] = Query(
+        None, description="Entity types to search (default: all)"
+    ),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of records to return"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Full-text search across categories, products and SKUs.
+
+    Names weigh more than descriptions, which weigh more than SKU attribute
+    values. Hits of all types are returned together, most relevant first.
+
+    - **q**: Search terms
+    - **types**: Entity types to search (category, product, sku)
+    - **skip**: Number of records to skip (default: 0)
+    - **limit**: Maximum number of records to return (default: 100, max: 1000)
+    """
+    hits, total = await search_service.search(
+        db, q, types=types, skip=skip, limit=limit
+    )
+
+    # Calculate page number (1-based)
+    page = (skip // limit) + 1
+
+    return create_multiple_items_response(
+        data=hits,
+        page=page,
+        limit=limit,
+        total=total,
+        ranked=True
+    )
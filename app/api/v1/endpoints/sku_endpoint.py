@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.session import get_db
@@ -7,18 +9,27 @@ from app.services.sku_service import sku_service
 from app.schemas.sku_schema import (
     SkuResponse,
     SkuCreate,
-    SkuUpdate
+    SkuUpdate,
+    SkuBulkCreate,
+    SkuBulkResult
+)
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode, ExportFormat
 )
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
 from app.utils.response_helpers import (
     create_single_item_response,
-    create_multiple_items_response
+    create_serialized_single_item_response,
+    create_serialized_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.utils.etag import ConditionalRequest
+from app.utils.serialization import sku_serializer
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
+# Bulk operations, mounted on the manager router
+bulk_router = APIRouter()
+
 
 @router.get(
     "/",
@@ -30,6 +41,13 @@ async def get_skus(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(
         None, description="Filter by name (partial match)"
     ),
@@ -45,12 +63,13 @@ async def get_skus(
     is_active: Optional[bool] = Query(
         None, description="Filter by active status"
     ),
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get SKUs with optional filtering and pagination.
     This endpoint supports filtering by:
-    - **name**: Partial match on SKU name
+    - **name**: Partial match on SKU name, most relevant first
     - **slug**: Exact match on SKU slug
     - **sku_number**: Exact match on SKU number
     - **product_id**: Filter by product ID
@@ -58,6 +77,8 @@ async def get_skus(
 
     Results are paginated using skip and limit parameters.
     Each SKU includes its full hierarchical path, price details, and attribute values.
+    The response carries an ETag; a request whose If-None-Match has it gets
+    304 Not Modified without the page being loaded.
     """
     skus, total = await sku_service.get_skus_with_filter(
         db,
@@ -67,17 +88,74 @@ async def get_skus(
         slug=slug,
         sku_number=sku_number,
         product_id=product_id,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor,
+        conditional=conditional
     )
 
     # Calculate page number (1-based)
     page = (skip // limit) + 1
 
-    return create_multiple_items_response(
-        data=skus,
+    response = create_serialized_multiple_items_response(
+        items=skus,
+        data=sku_serializer.serialize_many(skus),
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor,
+        ranked=name is not None
+    )
+    conditional.set_etag(response)
+    return response
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {}
+            },
+            "description": "SKU export file"
+        }
+    }
+)
+async def export_skus(
+    format: ExportFormat = Query(
+        ExportFormat.NDJSON, description="Export file format: ndjson or csv"
+    ),
+    updated_since: Optional[datetime] = Query(
+        None, description="Only export SKUs updated at or after this time"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Export all SKUs as a streamed file, ordered by ID.
+
+    Each SKU comes with its product, category, full path, price details and
+    attribute values. The file is streamed while it is read from the
+    database, so exports of any size use constant memory.
+
+    - **format**: `ndjson` (one JSON object per line) or `csv` (price details
+      and attribute values as JSON columns)
+    - **updated_since**: Only SKUs updated at or after this time, for
+      incremental exports
+    """
+    media_type = (
+        "text/csv" if format == ExportFormat.CSV else "application/x-ndjson"
+    )
+    return StreamingResponse(
+        sku_service.export_skus(
+            db, export_format=format, updated_since=updated_since
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="skus.{format.value}"'
+        }
     )
 
 
@@ -89,7 +167,7 @@ async def get_skus(
 async def create_sku(
     sku_create: SkuCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new SKU.
@@ -118,7 +196,38 @@ async def create_sku(
     sku = await sku_service.create_sku(
         db=db, sku_create=sku_create, created_by=current_user.id
     )
-    return create_single_item_response(data=sku)
+    return create_serialized_single_item_response(
+        sku_serializer.serialize(sku), status_code=status.HTTP_201_CREATED
+    )
+
+
+@bulk_router.post(
+    "/bulk",
+    response_model=SingleItemResponse[SkuBulkResult],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_skus_bulk(
+    sku_bulk: SkuBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Create up to 1000 SKUs at once.
+
+    Every item is validated with the same rules as the create endpoint, but
+    names, products, attributes and pricelists are checked for the whole batch
+    at once. Valid items are created together in a single transaction; items
+    that fail validation are skipped and reported with their error.
+
+    **Result:**
+    - `created` / `failed`: Number of created and rejected items
+    - `items`: One result per item in request order, with the id, slug and
+      sku_number of created SKUs or the error of rejected ones
+    """
+    result = await sku_service.create_skus_bulk(
+        db=db, sku_bulk=sku_bulk, created_by=current_user.id
+    )
+    return create_single_item_response(data=result)
 
 
 @router.get(
@@ -128,6 +237,7 @@ async def create_sku(
 )
 async def get_sku(
     sku_id: int,
+    conditional: ConditionalRequest = Depends(ConditionalRequest.from_request),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -138,14 +248,23 @@ async def get_sku(
     - Full hierarchical path from category to SKU
     - All price details with pricelist information
     - All attribute values with attribute metadata
+
+    Answers 304 Not Modified without loading the SKU when If-None-Match has
+    its current ETag.
     """
-    sku = await sku_service.get_sku_by_id(db=db, sku_id=sku_id)
+    sku = await sku_service.get_sku_by_id(
+        db=db, sku_id=sku_id, conditional=conditional
+    )
     if not sku:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"SKU with id {sku_id} not found"
         )
-    return create_single_item_response(data=sku)
+    response = create_serialized_single_item_response(
+        sku_serializer.serialize(sku)
+    )
+    conditional.set_etag(response)
+    return response
 
 
 @router.put(
@@ -157,7 +276,7 @@ async def update_sku(
     sku_id: int,
     sku_update: SkuUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing SKU.
@@ -187,7 +306,7 @@ async def update_sku(
         updated_by=current_user.id,
         current_user=current_user
     )
-    return create_single_item_response(data=sku)
+    return create_serialized_single_item_response(sku_serializer.serialize(sku))
 
 
 @router.delete(
@@ -197,7 +316,7 @@ async def update_sku(
 async def delete_sku(
     sku_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a SKU.
@@ -10,13 +10,14 @@ from app.schemas.supplier_schema import (
     SupplierUpdate
 )
 from app.schemas.product_schema import ProductResponse
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -31,6 +32,13 @@ async def get_suppliers(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     name: Optional[str] = Query(
         None, description="Filter by name (partial match)"
     ),
@@ -56,7 +64,7 @@ async def get_suppliers(
 
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100, max: 1000)
-    - **name**: Filter by name (partial match)
+    - **name**: Filter by name (partial match, most relevant first)
     - **slug**: Filter by slug (exact match)
     - **company_type**: Filter by company type (INDIVIDUAL, PT, CV, UD)
     - **email**: Filter by email (partial match)
@@ -73,7 +81,9 @@ async def get_suppliers(
         company_type=company_type,
         email=email,
         contact=contact,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -83,7 +93,9 @@ async def get_suppliers(
         data=suppliers,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor,
+        ranked=name is not None
     )
 
 
@@ -95,7 +107,7 @@ async def get_suppliers(
 async def create_supplier(
     supplier_create: SupplierCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Create a new supplier.
@@ -151,7 +163,7 @@ async def update_supplier(
     supplier_id: int,
     supplier_update: SupplierUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Update an existing supplier.
@@ -185,7 +197,7 @@ async def update_supplier(
 async def delete_supplier(
     supplier_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a supplier.
@@ -210,6 +222,13 @@ async def get_supplier_products(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -223,7 +242,9 @@ async def get_supplier_products(
         db=db,
         supplier_id=supplier_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -233,5 +254,6 @@ async def get_supplier_products(
         data=products,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
@@ -9,13 +9,14 @@ from app.schemas.user_schema import (
     UserCreate,
     UserUpdate
 )
-from app.schemas.base import SingleItemResponse, MultipleItemsResponse
+from app.schemas.base import (
+    SingleItemResponse, MultipleItemsResponse, CountMode
+)
 from app.utils.response_helpers import (
     create_single_item_response,
     create_multiple_items_response
 )
-from app.api.v1.dependencies.auth import get_current_user
-from app.models import Users
+from app.api.v1.dependencies.auth import Principal, get_current_user
 
 router = APIRouter()
 
@@ -30,6 +31,13 @@ async def get_users(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of records to return"
     ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count mode: exact or estimated from table statistics"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor, used instead of skip"
+    ),
     username: Optional[str] = Query(
         None, description="Filter by username (partial match)"
     ),
@@ -68,7 +76,9 @@ async def get_users(
         email=email,
         name=name,
         role=role,
-        is_active=is_active
+        is_active=is_active,
+        count_mode=count,
+        cursor=cursor
     )
 
     # Calculate page number (1-based)
@@ -78,7 +88,8 @@ async def get_users(
         data=users,
         page=page,
         limit=limit,
-        total=total
+        total=total,
+        cursor=cursor
     )
 
 
@@ -90,7 +101,7 @@ async def get_users(
 async def create_user(
     user_create: UserCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)  # Need user ID for created_by
+    current_user: Principal = Depends(get_current_user)  # Need user ID for created_by
 ):
     """
     Create a new user.
@@ -143,7 +154,7 @@ async def update_user(
     user_id: int,
     user_update: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Users = Depends(get_current_user)  # Need user ID for updated_by
+    current_user: Principal = Depends(get_current_user)  # Need user ID for updated_by
 ):
     """
     Update user by ID.
@@ -10,7 +10,8 @@ from app.api.v1.endpoints import (
     pricelist_endpoint,
     supplier_endpoint,
     product_endpoint,
-    sku_endpoint
+    sku_endpoint,
+    search_endpoint
 )
 from app.api.v1.dependencies.auth import (
     get_current_user,
@@ -108,12 +109,30 @@ protected_router.include_router(
     tags=["skus"]
 )
 
+protected_router.include_router(
+    search_endpoint.router,
+    prefix="/search",
+    tags=["search"]
+)
+
 # ============================================================================
 # MANAGER ENDPOINTS (ADMIN, MANAGER, SYSTEM roles only)
 # ============================================================================
 
-# Future: Add bulk operations, advanced reports, etc. here if needed
-# These would be operations that bypass ownership checks
+# Bulk operations - these bypass ownership checks
+manager_router.include_router(
+    product_endpoint.bulk_router,
+    prefix="/products",
+    tags=["products"]
+)
+
+manager_router.include_router(
+    sku_endpoint.bulk_router,
+    prefix="/skus",
+    tags=["skus"]
+)
+
+# Future: Add advanced reports, etc. here if needed
 
 # ============================================================================
 # ADMIN ENDPOINTS (ADMIN role only)
@@ -0,0 +1,96 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    In-process cache whose entries expire after a time to live, evicting the
+    least recently used entry once it is full.
+
+    The cache is per process and is meant to be used from the event loop, so
+    it takes no locks. Hits and misses are counted for monitoring.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries, 0 disables the cache
+            ttl: Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(
+        self,
+        key: Hashable,
+        is_valid: Optional[Callable[[Any], bool]] = None
+    ) -> Optional[Any]:
+        """
+        Get the value of a key.
+
+        Args:
+            key: Key to look up
+            is_valid: Check of the cached value; a value failing it is
+                dropped and counted as a miss, like an expired one
+
+        Returns:
+            The cached value, or None if the key is missing, expired or
+            invalid
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic() or (
+            is_valid is not None and not is_valid(value)
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Cache a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Key to cache the value under
+            value: Value to cache
+            ttl: Seconds this entry stays valid, instead of the cache's ttl
+        """
+        if self.maxsize <= 0:
+            return
+        expires_in = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + expires_in, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the entry of a key, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit and miss counters and the number of entries."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,6 +8,37 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # How long table row estimates (pg_class.reltuples) are reused
+    COUNT_ESTIMATE_TTL_SECONDS: int = 60
+    # Lines of an NDJSON import validated and inserted per transaction
+    IMPORT_CHUNK_SIZE: int = 500
+    # Longest accepted NDJSON import line, bounds the buffered bytes
+    IMPORT_MAX_LINE_BYTES: int = 1048576
+    # Per-line errors kept in an import report
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+    # Rows fetched from the server-side cursor per batch of an export
+    EXPORT_BATCH_SIZE: int = 1000
+    # Authenticated users (id, role, active status) kept in memory per process
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    # How long a cached authenticated user is trusted without a lookup
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    # Verified JWT payloads kept in memory per process, until the token expires
+    TOKEN_CACHE_SIZE: int = 4096
+    # Threads hashing and verifying passwords, bounds concurrent argon2 work
+    PASSWORD_HASH_WORKERS: int = 4
+    # argon2id cost of new password hashes; hashes made with other values are
+    # rehashed on the next successful login
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    # Distinct names whose slug is memoised per process
+    SLUG_CACHE_SIZE: int = 4096
+    # Serialized SKU responses kept in memory per process, each reused until
+    # the SKU or a row it shows changes
+    SKU_RESPONSE_CACHE_SIZE: int = 10000
+    SKU_RESPONSE_CACHE_TTL_SECONDS: int = 3600
+    # Render JSON responses with orjson instead of the json module
+    FAST_JSON_RESPONSES: bool = True
     BACKEND_CORS_ORIGINS: List[str]
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
@@ -1,7 +1,7 @@
 from typing import Dict, Any, Optional, List, Union
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -119,6 +119,17 @@ class InternalServerException(BaseAPIException):
         )
 
 
+class NotModifiedException(Exception):
+    """
+    Exception raised when a conditional GET matches the current entity tag.
+
+    It is answered with an empty 304 Not Modified, not an error body.
+    """
+    def __init__(self, etag: str):
+        self.etag = etag
+        super().__init__(etag)
+
+
 def format_error_response(
     code: str,
     message: str,
@@ -188,9 +199,24 @@ async def validation_exception_handler(
     )
 
 
+async def not_modified_exception_handler(
+    request: Request,
+    exc: NotModifiedException
+) -> Response:
+    """Answer a matching conditional GET with 304 Not Modified."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": exc.etag}
+    )
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with the FastAPI app."""
     app.add_exception_handler(BaseAPIException, base_exception_handler)
+    app.add_exception_handler(
+        NotModifiedException,
+        not_modified_exception_handler
+    )
     app.add_exception_handler(
         StarletteHTTPException,
         http_exception_handler
@@ -1,12 +1,16 @@
 from datetime import datetime
-from typing import Any, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 import re
 
 from sqlalchemy import (
     event, String, Integer, Boolean, DateTime, Float, Text, Numeric, Enum,
-    CheckConstraint
+    CheckConstraint, bindparam, func, inspect, literal_column, select, update
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import (
+    PASSIVE_NO_INITIALIZE, get_history, set_committed_value
 )
-from sqlalchemy.orm.attributes import get_history
 
 from app.core.base import Base
 from app.models.category_type_model import CategoryTypes
@@ -17,8 +21,10 @@ from app.models.sku_model import Skus
 from app.models.user_model import Users
 from app.models.attribute_model import Attributes
 from app.models.pricelist_model import Pricelists
-from app.core.security import hash_password
-from slugify import slugify
+from app.models.sku_attribute_value_model import SkuAttributeValue
+from app.core.security import HashedPassword, hash_password
+from app.utils.search import SKU_SEARCH_VECTOR
+from app.utils.slug import make_code, make_slug
 
 
 # Validation patterns configuration
@@ -29,6 +35,33 @@ VALIDATION_PATTERNS = {
     'non_negative': ['sequence']  # Same as original
 }
 
+STARTS_WITH_LETTER = re.compile(r'^[A-Za-z]')
+GENERAL_STRING = re.compile(r'^[A-Za-z0-9\s_-]+$')
+
+
+# Column derived from the name of each model by the 'set' listeners
+# (_set_slug, _set_code), with the function deriving it
+NAME_DERIVED_COLUMNS: Dict[type, Tuple[str, Callable[[str], str]]] = {
+    CategoryTypes: ('slug', make_slug),
+    Categories: ('slug', make_slug),
+    Suppliers: ('slug', make_slug),
+    Products: ('slug', make_slug),
+    Skus: ('slug', make_slug),
+    Attributes: ('code', make_code),
+    Pricelists: ('code', make_code),
+}
+
+# Validates one column value of a target: (target, value) -> None
+ColumnValidator = Callable[[Any, Any], None]
+
+# Column key, its validator and the columns whose change requires validating it
+ValidationPlan = List[Tuple[str, ColumnValidator, Tuple[str, ...]]]
+
+
+def _matches_pattern(column_key: str, kind: str) -> bool:
+    """Check whether a column name matches a VALIDATION_PATTERNS kind."""
+    return any(pattern in column_key.lower() for pattern in VALIDATION_PATTERNS[kind])
+
 
 class BaseValidator:
     """Base validator class with common functionality."""
@@ -39,66 +72,66 @@ class StringValidator(BaseValidator):
     """Handles validation for String and Text columns"""
 
     @staticmethod
-    def validate(target, column, value: str) -> str:
-        """Validate string column value"""
+    def compile(column) -> ColumnValidator:
+        """Build the validator of a string column value"""
         column_key = column.key
+        nullable = column.nullable is True
+
+        if _matches_pattern(column_key, 'email'):
+            def check(target, value: str) -> None:
+                if '@' not in value:
+                    raise ValueError(f"Column '{column_key}' must contain '@'.")
+                if '@' in [value[0], value[-1]]:
+                    raise ValueError(
+                        f"Column '{column_key}' must not start or end with '@'"
+                    )
+                setattr(target, column_key, value.lower())
+        elif _matches_pattern(column_key, 'phone'):
+            def check(target, value: str) -> None:
+                if not value.isdigit():
+                    raise ValueError(
+                        f"Column '{column_key}' must contain only digits."
+                    )
+        elif isinstance(column.type, Text):
+            check = None
+        else:
+            def check(target, value: str) -> None:
+                if not STARTS_WITH_LETTER.match(value):
+                    raise ValueError(
+                        f"Column '{column_key}' must start with a letter."
+                    )
+                if not GENERAL_STRING.match(value):
+                    raise ValueError(
+                        f"Column '{column_key}' can only contain "
+                        "alphabet letters, numbers, underscores, and spaces."
+                    )
 
-        # Trim whitespace and set the value
-        value = value.strip()
-        setattr(target, column_key, value)
-
-        # Check for empty string
-        if value == "":
-            if column.nullable is True:
-                return value
-            raise ValueError(f"Column '{column_key}' cannot be empty.")
-
-        # Email validation
-        email_patterns = VALIDATION_PATTERNS['email']
-        if any(pattern in column_key.lower() for pattern in email_patterns):
-            if '@' not in value:
-                raise ValueError(f"Column '{column_key}' must contain '@'.")
-            if '@' in [value[0], value[-1]]:
-                raise ValueError(
-                    f"Column '{column_key}' must not start or end with '@'"
-                )
-            setattr(target, column_key, value.lower())
-            return value
-
-        # Phone validation
-        phone_patterns = VALIDATION_PATTERNS['phone']
-        if any(pattern in column_key.lower() for pattern in phone_patterns):
-            if not value.isdigit():
-                raise ValueError(
-                    f"Column '{column_key}' must contain only digits."
-                )
-            return value
+        def validate(target, value: Any) -> None:
+            if not isinstance(value, str):
+                return
 
-        # Text type check
-        if isinstance(column.type, Text):
-            return value
+            # Trim whitespace and set the value
+            value = value.strip()
+            setattr(target, column_key, value)
 
-        # General string validation
-        if not re.match(r'^[A-Za-z]', value[0]):
-            raise ValueError(f"Column '{column_key}' must start with a letter.")
+            # Check for empty string
+            if value == "":
+                if nullable:
+                    return
+                raise ValueError(f"Column '{column_key}' cannot be empty.")
 
-        if not re.match(r'^[A-Za-z0-9\s_-]+$', value):
-            raise ValueError(
-                f"Column '{column_key}' can only contain "
-                "alphabet letters, numbers, underscores, and spaces."
-            )
+            if check is not None:
+                check(target, value)
 
-        return value
+        return validate
 
 
 class NumericValidator(BaseValidator):
     """Handles validation for Integer, Float, and Numeric columns."""
 
     @staticmethod
-    def validate_integer(target, column, value: Any) -> None:
+    def validate_integer(column_key: str, value: Any) -> None:
         """Validate integer column value"""
-        column_key = column.key
-
         if isinstance(value, bool):
             raise TypeError(
                 f"Column '{column_key}' must be an integer, not a boolean."
@@ -109,10 +142,8 @@ class NumericValidator(BaseValidator):
             )
 
     @staticmethod
-    def validate_float_numeric(target, column, value: Any) -> None:
+    def validate_float_numeric(column_key: str, value: Any) -> None:
         """Validate float or numeric column value"""
-        column_key = column.key
-
         if isinstance(value, bool):
             raise TypeError(
                 f"Column '{column_key}' must be a float or numeric, "
@@ -120,57 +151,147 @@ class NumericValidator(BaseValidator):
             )
 
     @staticmethod
-    def validate_positive_number(target, column, value: Any) -> None:
+    def validate_positive_number(column_key: str, value: Any) -> None:
         """Consolidated positive number validation for all numeric types."""
-        column_key = column.key
-
-        # Auto-detect positive columns
-        positive_patterns = VALIDATION_PATTERNS['positive']
-
-        if any(pattern in column_key.lower() for pattern in positive_patterns):
-            if isinstance(value, (int, float)) and value <= 0:
-                raise ValueError(
-                    f"Column '{column_key}' must be a positive number "
-                    "(greater than 0)."
-                )
+        if isinstance(value, (int, float)) and value <= 0:
+            raise ValueError(
+                f"Column '{column_key}' must be a positive number "
+                "(greater than 0)."
+            )
 
     @staticmethod
-    def validate_non_negative_number(target, column, value: Any) -> None:
+    def validate_non_negative_number(column_key: str, value: Any) -> None:
         """Validate non-negative number column value"""
+        if isinstance(value, (int, float)) and value < 0:
+            raise ValueError(
+                f"Column '{column_key}' must be a non-negative number "
+                "(greater than or equal to 0)."
+            )
+
+    @classmethod
+    def compile(cls, column) -> ColumnValidator:
+        """Build the validator of a numeric column value"""
         column_key = column.key
+        checks = [
+            cls.validate_integer if isinstance(column.type, Integer)
+            else cls.validate_float_numeric
+        ]
+        # Auto-detect positive and non-negative columns
+        if _matches_pattern(column_key, 'positive'):
+            checks.append(cls.validate_positive_number)
+        if _matches_pattern(column_key, 'non_negative'):
+            checks.append(cls.validate_non_negative_number)
 
-        # Auto-detect non-negative columns
-        non_negative_patterns = VALIDATION_PATTERNS['non_negative']
+        def validate(target, value: Any) -> None:
+            for check in checks:
+                check(column_key, value)
 
-        if any(pattern in column_key.lower() for pattern in non_negative_patterns):
-            if isinstance(value, (int, float)) and value < 0:
-                raise ValueError(
-                    f"Column '{column_key}' must be a non-negative number "
-                    "(greater than or equal to 0)."
-                )
+        return validate
 
 
 class BooleanValidator(BaseValidator):
     """Handles validation for Boolean columns"""
 
     @staticmethod
-    def validate(target, column, value: Any) -> None:
-        """Validate boolean column value"""
+    def compile(column) -> ColumnValidator:
+        """Build the validator of a boolean column value"""
         column_key = column.key
-
         problematic_values = [0, 1, 0.0, 1.0]
-        if value in problematic_values and not isinstance(value, bool):
-            raise TypeError(
-                f"Column '{column_key}' must be a boolean, not "
-                f"{type(value).__name__}."
-            )
+
+        def validate(target, value: Any) -> None:
+            if value in problematic_values and not isinstance(value, bool):
+                raise TypeError(
+                    f"Column '{column_key}' must be a boolean, not "
+                    f"{type(value).__name__}."
+                )
+
+        return validate
+
+
+# Patterns accepting at least what strptime accepts for each directive
+DATETIME_DIRECTIVE_PATTERNS = {
+    'Y': r'\d{4}',
+    'm': r'\d{1,2}',
+    'd': r' ?\d{1,2}',
+    'H': r'\d{1,2}',
+    'M': r'\d{1,2}',
+    'S': r'\d{1,2}',
+    'f': r'\d{1,6}',
+    'z': r'(?:[+-]\d\d:?\d\d(?::?\d\d(?:\.\d{1,6})?)?|Z)',
+}
+
+
+def _compile_datetime_format(fmt: str) -> re.Pattern:
+    """
+    Compile a strptime format into a regex matching every value it may
+    parse, like strptime case-insensitive and with flexible whitespace.
+    """
+    pattern = ''.join(
+        DATETIME_DIRECTIVE_PATTERNS[part[1]] if part.startswith('%')
+        else re.sub(r'\\\s+', r'\\s+', re.escape(part))
+        for part in re.split(r'(%[A-Za-z])', fmt)
+    )
+    return re.compile(pattern, re.IGNORECASE)
 
 
 class DateTimeValidator(BaseValidator):
     """Handles validation for DateTime columns"""
 
-    @staticmethod
-    def validate(target, column, value: str) -> None:
+    # Accepted input formats, tried in order
+    FORMATS = [
+        "%Y-%m-%d %H:%M:%S.%f%z",    # 2025-06-02 23:20:35.661597+08
+        "%Y-%m-%d %H:%M:%S.%f+%z",   # 2025-06-02 23:20:35.661597+0800
+        "%Y-%m-%d %H:%M:%S.%f",      # 2025-06-02 23:20:35.661597
+        "%Y-%m-%d %H:%M:%S",         # 2023-12-25 14:30:00
+        "%Y-%m-%dT%H:%M:%S",         # 2023-12-25T14:30:00 (ISO format)
+        "%Y-%m-%dT%H:%M:%SZ",        # 2023-12-25T14:30:00Z (UTC)
+        "%Y-%m-%dT%H:%M:%S.%f",      # 2023-12-25T14:30:00.123456
+        "%Y-%m-%dT%H:%M:%S.%fZ",     # 2023-12-25T14:30:00.123456Z
+        "%Y-%m-%dT%H:%M:%S.%f%z",    # 2023-12-25T14:30:00.123456+01:00
+        "%Y-%m-%dT%H:%M:%S%z",       # 2023-12-25T14:30:00+01:00
+        "%Y-%m-%d",                  # 2023-12-25 (date only)
+    ]
+
+    # Values that fromisoformat parses exactly as the first matching format:
+    # date only, or date and time with an optional fraction, where only a
+    # fraction may be followed by a +HH:MM offset
+    ISO_PATTERN = re.compile(
+        r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+        r'(?:[T ][0-9]{2}:[0-9]{2}:[0-9]{2}'
+        r'(?:\.[0-9]{6}(?:[+-][0-9]{2}:[0-5][0-9])?)?)?'
+    )
+
+    FORMAT_PATTERNS = [(fmt, _compile_datetime_format(fmt)) for fmt in FORMATS]
+
+    @classmethod
+    def parse(cls, value: str) -> Optional[datetime]:
+        """
+        Parse a value with the first of FORMATS that accepts it.
+
+        Canonical ISO values are parsed by fromisoformat. Other values are
+        only handed to strptime for the formats whose regex matches them,
+        instead of trying every format until one does not raise.
+
+        Returns:
+            The parsed datetime, or None if no format accepts the value
+        """
+        if cls.ISO_PATTERN.fullmatch(value):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                # Out of range fields, left to strptime to reject
+                pass
+
+        for fmt, pattern in cls.FORMAT_PATTERNS:
+            if pattern.fullmatch(value):
+                try:
+                    return datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+        return None
+
+    @classmethod
+    def validate(cls, target, column, value: str) -> None:
         """Validate datetime column value"""
         column_key = column.key
 
@@ -178,38 +299,32 @@ class DateTimeValidator(BaseValidator):
         if value == "":
             raise ValueError(f"Column '{column_key}' cannot be empty.")
 
-        # Try to parse various input formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S.%f%z",    # 2025-06-02 23:20:35.661597+08
-            "%Y-%m-%d %H:%M:%S.%f+%z",   # 2025-06-02 23:20:35.661597+0800
-            "%Y-%m-%d %H:%M:%S.%f",      # 2025-06-02 23:20:35.661597
-            "%Y-%m-%d %H:%M:%S",         # 2023-12-25 14:30:00
-            "%Y-%m-%dT%H:%M:%S",         # 2023-12-25T14:30:00 (ISO format)
-            "%Y-%m-%dT%H:%M:%SZ",        # 2023-12-25T14:30:00Z (UTC)
-            "%Y-%m-%dT%H:%M:%S.%f",      # 2023-12-25T14:30:00.123456
-            "%Y-%m-%dT%H:%M:%S.%fZ",     # 2023-12-25T14:30:00.123456Z
-            "%Y-%m-%dT%H:%M:%S.%f%z",    # 2023-12-25T14:30:00.123456+01:00
-            "%Y-%m-%dT%H:%M:%S%z",       # 2023-12-25T14:30:00+01:00
-            "%Y-%m-%d",                  # 2023-12-25 (date only)
-        ]
+        parsed = cls.parse(value)
+        if parsed is None:
+            raise ValueError(f"Invalid datetime format: {value}")
+        setattr(target, column_key, parsed)
 
-        match = False
-        for fmt in formats:
-            try:
-                setattr(target, column_key, datetime.strptime(value, fmt))
-                match = True
-                break
-            except ValueError:
-                continue
+    @classmethod
+    def compile(cls, column) -> ColumnValidator:
+        """Build the validator of a datetime column value"""
+        def validate(target, value: Any) -> None:
+            # There are certain string values that can be converted to datetime
+            if isinstance(value, str):
+                cls.validate(target, column, value)
 
-        if not match:
-            raise ValueError(f"Invalid datetime format: {value}")
+        return validate
 
 
 def _get_excluded_columns_refactored(model_class) -> Set[str]:
     """Get columns that should be excluded from validation"""
     excluded_columns = {'password'}
 
+    # Search vectors are maintained by the database and listeners
+    excluded_columns.update(
+        column.key for column in model_class.__table__.columns
+        if isinstance(column.type, TSVECTOR)
+    )
+
     # Check for validators in the class and its MRO (Method Resolution Order)
     for cls in model_class.__mro__:
         if hasattr(cls, '__mapper__'):
@@ -220,57 +335,176 @@ def _get_excluded_columns_refactored(model_class) -> Set[str]:
     return excluded_columns
 
 
+# Compiled validation plans by model class
+_validation_plans: Dict[type, ValidationPlan] = {}
+
+
+def _compile_validation_plan(model_class) -> ValidationPlan:
+    """
+    Build the validation plan of a model: the validator of every column
+    that needs one, chosen from the column type and name.
+
+    Everything that only depends on the model (excluded columns, column
+    types, name patterns) is decided here once, so validating a row only
+    runs the checks that apply to its columns.
+    """
+    excluded_columns = _get_excluded_columns_refactored(model_class)
+    plan = []
+    for column in model_class.__table__.columns:
+        # Skip columns that have manual validators
+        if column.key in excluded_columns:
+            continue
+
+        # Route to appropriate validator based on column type
+        if isinstance(column.type, String):
+            validator = StringValidator.compile(column)
+        elif isinstance(column.type, (Integer, Float, Numeric)):
+            validator = NumericValidator.compile(column)
+        elif isinstance(column.type, Boolean):
+            validator = BooleanValidator.compile(column)
+        elif isinstance(column.type, DateTime):
+            validator = DateTimeValidator.compile(column)
+        else:
+            continue
+
+        watched_keys = (column.key,)
+        if column.key == 'name' and model_class in NAME_DERIVED_COLUMNS:
+            # Setting the stripped name again re-derives the slug or code, so
+            # a changed slug or code also requires validating the name
+            watched_keys += (NAME_DERIVED_COLUMNS[model_class][0],)
+        plan.append((column.key, validator, watched_keys))
+    return plan
+
+
+def _get_validation_plan(model_class) -> ValidationPlan:
+    """Get the validation plan of a model, compiling it on first use."""
+    plan = _validation_plans.get(model_class)
+    if plan is None:
+        plan = _validation_plans[model_class] = _compile_validation_plan(
+            model_class
+        )
+    return plan
+
+
+def _compile_validation_plan_listener(mapper, class_):
+    """Listener compiling the validation plan of a model once it is mapped."""
+    _get_validation_plan(class_)
+
+
 def _validate_all_types_on_save(mapper, connection, target):
     """
     Listener that is called before INSERT or UPDATE.
     Additional validation for String, Integer, Boolean, Float, and DateTime types
     on the 'target' object due to SQLAlchemy doesn't validate the data
     type in some cases.
-    """
-    # Get class from target object (e.g., User class)
-    model_class = target.__class__
 
-    # Get excluded columns
-    excluded_columns = _get_excluded_columns_refactored(model_class)
-
-    for column in target.__table__.columns:
-        # Skip columns that have manual validators
-        if column.key in excluded_columns:
+    On UPDATE only the columns changed since the object was loaded are
+    validated, so unchanged values are neither checked again nor loaded.
+    """
+    # Only persistent objects have an identity, new ones are being inserted
+    updating = inspect(target).has_identity
+    for column_key, validate, watched_keys in _get_validation_plan(
+        target.__class__
+    ):
+        if updating and not any(
+            get_history(target, key, passive=PASSIVE_NO_INITIALIZE).has_changes()
+            for key in watched_keys
+        ):
             continue
 
-        value = getattr(target, column.key)
+        value = getattr(target, column_key)
 
         # Skip None values
-        if value is None:
-            continue
+        if value is not None:
+            validate(target, value)
 
-        # Route to appropriate validator based on column type
 
-        # Validation for String type
-        if isinstance(column.type, String) and isinstance(value, str):
-            StringValidator.validate(target, column, value)
+class _RowTarget:
+    """Attribute access to a row dict, so the plan validators can set values."""
 
-        # Validation for Integer type
-        elif isinstance(column.type, Integer):
-            NumericValidator.validate_integer(target, column, value)
-            NumericValidator.validate_positive_number(target, column, value)
-            NumericValidator.validate_non_negative_number(target, column, value)
+    __slots__ = ('row',)
 
-        # Validation for Boolean type
-        elif isinstance(column.type, Boolean):
-            BooleanValidator.validate(target, column, value)
+    def __init__(self, row: Dict[str, Any]):
+        object.__setattr__(self, 'row', row)
 
-        # Validation for Float and Numeric types
-        elif isinstance(column.type, (Float, Numeric)):
-            NumericValidator.validate_float_numeric(target, column, value)
-            NumericValidator.validate_positive_number(target, column, value)
-            NumericValidator.validate_non_negative_number(target, column, value)
+    def __setattr__(self, key: str, value: Any) -> None:
+        self.row[key] = value
 
-        # Validation for DateTime type
-        elif isinstance(column.type, DateTime):
-            # There are certain string values that can be converted to datetime
-            if isinstance(value, str):
-                DateTimeValidator.validate(target, column, value)
+
+def validate_rows(
+    model_class, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Validate rows of a Core INSERT or UPDATE the way the flush listener and
+    the model's own validators (@validates) validate objects.
+
+    Validation runs column by column over the whole batch with the model's
+    validation plan; only the columns present in a row are validated.
+
+    Args:
+        model_class: Model the rows are written to
+        rows: Rows as dicts of column values, updated in place
+
+    Returns:
+        The rows
+
+    Raises:
+        ValueError, TypeError: If a value is invalid for its column
+    """
+    targets = [_RowTarget(row) for row in rows]
+    for column_key, validate, _ in _get_validation_plan(model_class):
+        for target, row in zip(targets, rows):
+            value = row.get(column_key)
+            if value is not None:
+                validate(target, value)
+
+    # Columns with manual validators (@validates) are left out of the plan;
+    # they only rely on class attributes, so the class stands in for self
+    for column_key, (method, _) in model_class.__mapper__.validators.items():
+        for row in rows:
+            if column_key in row:
+                row[column_key] = method(model_class, column_key, row[column_key])
+    return rows
+
+
+def prepare_rows_for_insert(
+    model_class, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Apply to rows of a Core INSERT what the ORM listeners apply to new
+    objects: type validation, the model's own validators, the slug or code
+    derived from the name and password hashing.
+
+    Core inserts (session.execute(insert(Model), rows)) skip the ORM flush
+    events, so bulk loads run the rows through this first (see
+    validate_rows). The materialized path of categories and the search
+    vector of SKUs need the database and are left to the caller.
+
+    Args:
+        model_class: Model the rows are inserted into
+        rows: Rows as dicts of column values, updated in place
+
+    Returns:
+        The rows
+
+    Raises:
+        ValueError, TypeError: If a value is invalid for its column
+    """
+    validate_rows(model_class, rows)
+
+    derived = NAME_DERIVED_COLUMNS.get(model_class)
+    if derived is not None:
+        column_key, derive = derived
+        for row in rows:
+            if row.get('name') is not None:
+                row[column_key] = derive(row['name'])
+
+    if model_class is Users:
+        for row in rows:
+            password = row.get('password')
+            if password and not isinstance(password, HashedPassword):
+                row['password'] = hash_password(password)
+    return rows
 
 
 def _truncate_constraint_name_refactored(name: str, max_length: int = 63) -> str:
@@ -551,11 +785,17 @@ def _apply_automatic_constraints(target, connection, **kw):
 
 
 def _hash_new_password_listener(mapper, connection, target):
-    """Listener for hashing password ONLY on User model."""
+    """
+    Listener for hashing password ONLY on User model.
+
+    UserService hashes passwords in the password pool before the flush and
+    sets them as HashedPassword, which is kept as is; this listener only
+    hashes plain passwords set directly on the model.
+    """
     # Check if 'password' field is actually changed to avoid re-hashing
     if get_history(target, 'password').has_changes():
         plain_password = target.password
-        if plain_password:
+        if plain_password and not isinstance(plain_password, HashedPassword):
             target.password = hash_password(plain_password)
 
 
@@ -569,7 +809,7 @@ def _set_slug(target, value, oldvalue, initiator):
     if value is None:
         return
 
-    target.slug = slugify(value)
+    target.slug = make_slug(value)
 
 
 def _set_code(target, value, oldvalue, initiator):
@@ -580,7 +820,254 @@ def _set_code(target, value, oldvalue, initiator):
     """
     if value is None:
         return
-    target.code = slugify(value).upper()
+    target.code = make_code(value)
+
+
+def get_category_paths(
+    connection, placements: Iterable[Tuple[Optional[int], Optional[int]]]
+) -> Dict[Tuple[Optional[int], Optional[int]], tuple]:
+    """
+    Get the materialized paths (ancestor ids, names, slugs and root category
+    type) of categories placed under the given parents, with at most one
+    query for the parents and one for the category types.
+
+    Args:
+        connection: Connection to query with
+        placements: (parent_id, category_type_id) of each category
+
+    Returns:
+        The path of each distinct placement
+    """
+    placements = set(placements)
+    parent_ids = {parent_id for parent_id, _ in placements if parent_id is not None}
+    category_type_ids = {
+        category_type_id for parent_id, category_type_id in placements
+        if parent_id is None and category_type_id is not None
+    }
+
+    parents = {}
+    if parent_ids:
+        categories = Categories.__table__
+        parents = {
+            parent.id: parent for parent in connection.execute(
+                select(
+                    categories.c.id,
+                    categories.c.name,
+                    categories.c.slug,
+                    categories.c.ancestor_ids,
+                    categories.c.ancestor_names,
+                    categories.c.ancestor_slugs,
+                    categories.c.root_category_type
+                ).where(categories.c.id.in_(parent_ids))
+            )
+        }
+    category_type_names = {}
+    if category_type_ids:
+        category_type_names = dict(connection.execute(
+            select(CategoryTypes.id, CategoryTypes.name)
+            .where(CategoryTypes.id.in_(category_type_ids))
+        ).all())
+
+    paths = {}
+    for parent_id, category_type_id in placements:
+        if parent_id is None:
+            paths[(parent_id, category_type_id)] = (
+                [], [], [], category_type_names.get(category_type_id)
+            )
+            continue
+
+        parent = parents.get(parent_id)
+        if parent is None:
+            # The foreign key constraint reports the missing parent on flush
+            paths[(parent_id, category_type_id)] = ([], [], [], None)
+            continue
+
+        paths[(parent_id, category_type_id)] = (
+            [*parent.ancestor_ids, parent_id],
+            [*parent.ancestor_names, parent.name],
+            [*parent.ancestor_slugs, parent.slug],
+            parent.root_category_type
+        )
+    return paths
+
+
+def _get_category_path(connection, parent_id, category_type_id):
+    """
+    Get the materialized path (ancestor ids, names, slugs and root category
+    type) of a category placed under the given parent.
+    """
+    placement = (parent_id, category_type_id)
+    return get_category_paths(connection, [placement])[placement]
+
+
+def _set_category_path_listener(mapper, connection, target):
+    """Listener for setting the materialized path of a new category."""
+    (
+        target.ancestor_ids,
+        target.ancestor_names,
+        target.ancestor_slugs,
+        target.root_category_type
+    ) = _get_category_path(connection, target.parent_id, target.category_type_id)
+
+
+def _move_category_subtree_listener(mapper, connection, target):
+    """
+    Listener for keeping the materialized path of a category and its subtree
+    up to date when the category is moved or renamed.
+
+    Descendants are rewritten with a single UPDATE: the part of their path up
+    to and including this category is replaced, the rest is kept as is.
+    """
+    moved = (
+        get_history(target, 'parent_id').has_changes()
+        or get_history(target, 'category_type_id').has_changes()
+    )
+    renamed = (
+        get_history(target, 'name').has_changes()
+        or get_history(target, 'slug').has_changes()
+    )
+    if not (moved or renamed):
+        return
+
+    # Position of this category in the ancestor arrays of its descendants
+    depth = len(target.ancestor_ids or [])
+
+    if moved:
+        path = _get_category_path(
+            connection, target.parent_id, target.category_type_id
+        )
+        # A self reference is reported by check_category_no_self_reference
+        if target.parent_id != target.id and target.id in path[0]:
+            raise ValueError("Category cannot be moved under its own descendant.")
+        (
+            target.ancestor_ids,
+            target.ancestor_names,
+            target.ancestor_slugs,
+            target.root_category_type
+        ) = path
+
+    ancestor_ids = [*target.ancestor_ids, target.id]
+    ancestor_names = [*target.ancestor_names, target.name]
+    ancestor_slugs = [*target.ancestor_slugs, target.slug]
+
+    categories = Categories.__table__
+    connection.execute(
+        update(categories)
+        .where(categories.c.ancestor_ids.contains([target.id]))
+        .values(
+            ancestor_ids=bindparam(
+                'new_ids', ancestor_ids, type_=ARRAY(Integer)
+            ).concat(
+                categories.c.ancestor_ids[
+                    depth + 2:func.cardinality(categories.c.ancestor_ids)
+                ]
+            ),
+            ancestor_names=bindparam(
+                'new_names', ancestor_names, type_=ARRAY(String)
+            ).concat(
+                categories.c.ancestor_names[
+                    depth + 2:func.cardinality(categories.c.ancestor_names)
+                ]
+            ),
+            ancestor_slugs=bindparam(
+                'new_slugs', ancestor_slugs, type_=ARRAY(String)
+            ).concat(
+                categories.c.ancestor_slugs[
+                    depth + 2:func.cardinality(categories.c.ancestor_slugs)
+                ]
+            ),
+            root_category_type=target.root_category_type
+        )
+    )
+
+    # Keep descendants already loaded in the session in line with the database
+    session = object_session(target)
+    for obj in list(session.identity_map.values()) if session else []:
+        if not isinstance(obj, Categories):
+            continue
+        obj_ancestor_ids = obj.__dict__.get('ancestor_ids') or []
+        if target.id not in obj_ancestor_ids[depth:depth + 1]:
+            continue
+        set_committed_value(
+            obj, 'ancestor_ids', ancestor_ids + obj_ancestor_ids[depth + 1:]
+        )
+        set_committed_value(
+            obj, 'ancestor_names',
+            ancestor_names + obj.__dict__['ancestor_names'][depth + 1:]
+        )
+        set_committed_value(
+            obj, 'ancestor_slugs',
+            ancestor_slugs + obj.__dict__['ancestor_slugs'][depth + 1:]
+        )
+        set_committed_value(obj, 'root_category_type', target.root_category_type)
+
+
+def _rename_category_type_listener(mapper, connection, target):
+    """
+    Listener for updating the root category type stored on the categories
+    of a renamed category type. Names are unique through their slugs, so the
+    old name identifies the affected categories.
+    """
+    history = get_history(target, 'name')
+    if not history.has_changes() or not history.deleted:
+        return
+    old_name = history.deleted[0]
+
+    categories = Categories.__table__
+    connection.execute(
+        update(categories)
+        .where(categories.c.root_category_type == old_name)
+        .values(root_category_type=target.name)
+    )
+
+    session = object_session(target)
+    for obj in list(session.identity_map.values()) if session else []:
+        if (
+            isinstance(obj, Categories)
+            and obj.__dict__.get('root_category_type') == old_name
+        ):
+            set_committed_value(obj, 'root_category_type', target.name)
+
+
+# Session.info key of the SKU ids whose search vector is stale
+_STALE_SKU_SEARCH_VECTORS = 'stale_sku_search_vectors'
+
+
+def _mark_sku_search_vector_listener(mapper, connection, target):
+    """
+    Listener for marking the search vector of a SKU as stale when its name,
+    description or attribute values change.
+    """
+    if isinstance(target, Skus):
+        if not (
+            get_history(target, 'name').has_changes()
+            or get_history(target, 'description').has_changes()
+        ):
+            return
+        sku_ids = {target.id}
+    else:
+        sku_ids = {target.sku_id, *get_history(target, 'sku_id').deleted}
+
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_STALE_SKU_SEARCH_VECTORS, set()).update(sku_ids)
+
+
+def _rebuild_sku_search_vectors_listener(session, flush_context):
+    """
+    Listener for rebuilding the stale SKU search vectors of a flush with a
+    single UPDATE, however many SKUs and attribute values were flushed.
+    """
+    sku_ids = session.info.pop(_STALE_SKU_SEARCH_VECTORS, None)
+    if not sku_ids:
+        return
+
+    skus = Skus.__table__
+    session.connection().execute(
+        update(skus)
+        .where(skus.c.id.in_(sku_ids))
+        .values(search_vector=literal_column(SKU_SEARCH_VECTOR))
+    )
 
 
 def register_listeners():
@@ -590,6 +1077,9 @@ def register_listeners():
     """
     event.listen(Base, 'before_insert', _validate_all_types_on_save, propagate=True)
     event.listen(Base, 'before_update', _validate_all_types_on_save, propagate=True)
+    event.listen(
+        Base, 'mapper_configured', _compile_validation_plan_listener, propagate=True
+    )
     event.listen(
         Base.metadata,
         'before_create',
@@ -600,6 +1090,18 @@ def register_listeners():
     event.listen(Users, 'before_insert', _hash_new_password_listener)
     event.listen(Users, 'before_update', _hash_new_password_listener)
 
+    event.listen(Categories, 'before_insert', _set_category_path_listener)
+    event.listen(Categories, 'before_update', _move_category_subtree_listener)
+    event.listen(CategoryTypes, 'after_update', _rename_category_type_listener)
+
+    event.listen(Skus, 'after_insert', _mark_sku_search_vector_listener)
+    event.listen(Skus, 'after_update', _mark_sku_search_vector_listener)
+    for operation in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(
+            SkuAttributeValue, operation, _mark_sku_search_vector_listener
+        )
+    event.listen(Session, 'after_flush', _rebuild_sku_search_vectors_listener)
+
     event.listen(CategoryTypes.name, 'set', _set_slug)
     event.listen(Categories.name, 'set', _set_slug)
     event.listen(Suppliers.name, 'set', _set_slug)
@@ -1,17 +1,116 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union, Optional
+from typing import Any, Callable, Dict, Tuple, TypeVar, Union, Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
-# Membuat context untuk hashing, menentukan bcrypt sebagai algoritma default
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Membuat context untuk hashing, menentukan argon2 sebagai algoritma default
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    argon2__parallelism=settings.ARGON2_PARALLELISM
+)
 
 # JWT settings
 ALGORITHM = "HS256"
 
+# Verified token payloads by token digest, each kept until its token expires
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+T = TypeVar("T")
+
+
+class HashedPassword(str):
+    """Password that is already hashed and must be stored as is."""
+
+
+class PasswordHasherPool:
+    """
+    Thread pool running argon2 hashing and verification off the event loop.
+
+    argon2 releases the GIL, so the threads hash in parallel while the event
+    loop keeps serving requests. The number of threads bounds how many hashes
+    run at once, further calls wait in the pool queue; the time they wait is
+    recorded to tell when the pool is too small.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.tasks = 0
+        self.in_flight = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function in the pool and wait for its result.
+
+        Args:
+            func: Function to run
+            *args: Arguments of the function
+
+        Returns:
+            The result of the function
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        submitted_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            started_at, finished_at, result = await asyncio.get_running_loop(
+            ).run_in_executor(self._executor, self._timed, func, args)
+        finally:
+            self.in_flight -= 1
+
+        queue_seconds = started_at - submitted_at
+        self.tasks += 1
+        self.queue_seconds_total += queue_seconds
+        self.queue_seconds_max = max(self.queue_seconds_max, queue_seconds)
+        self.run_seconds_total += finished_at - started_at
+        return result
+
+    @staticmethod
+    def _timed(func: Callable[..., T], args: Tuple) -> Tuple[float, float, T]:
+        """Run a function in a worker thread with its start and end times."""
+        started_at = time.perf_counter()
+        result = func(*args)
+        return started_at, time.perf_counter(), result
+
+    def stats(self) -> Dict[str, float]:
+        """Get the task counters and queue and run times of the pool."""
+        return {
+            'workers': self.max_workers,
+            'tasks': self.tasks,
+            'in_flight': self.in_flight,
+            'queue_seconds_avg': (
+                self.queue_seconds_total / self.tasks if self.tasks else 0.0
+            ),
+            'queue_seconds_max': self.queue_seconds_max,
+            'run_seconds_avg': (
+                self.run_seconds_total / self.tasks if self.tasks else 0.0
+            ),
+        }
+
+
+password_hasher_pool = PasswordHasherPool(settings.PASSWORD_HASH_WORKERS)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Memverifikasi password teks biasa dengan hash di database."""
@@ -23,6 +122,52 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """Verify a plain password against its hash in password_hasher_pool."""
+    return await password_hasher_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash uses outdated parameters.
+
+    Args:
+        plain_password: Password to verify
+        hashed_password: Stored hash
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password is correct, and the
+            new hash when the stored one needs an update
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[HashedPassword]]:
+    """Run verify_and_update_password in password_hasher_pool."""
+    is_valid, new_hash = await password_hasher_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+    return is_valid, HashedPassword(new_hash) if new_hash else None
+
+
+async def hash_password_async(password: str) -> HashedPassword:
+    """
+    Hash a plain password in password_hasher_pool.
+
+    The result is a HashedPassword, which the password listener stores as
+    is instead of hashing it again during the flush.
+    """
+    return HashedPassword(await password_hasher_pool.run(hash_password, password))
+
+
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -48,6 +193,38 @@ def create_access_token(
     return encoded_jwt
 
 
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify a JWT and return its payload.
+
+    Verified payloads are cached by the SHA-256 digest of the token until the
+    token expires, so a token used for many requests has its signature and
+    claims checked only once. Invalid tokens are not cached.
+
+    Args:
+        token: JWT to verify
+
+    Returns:
+        Optional[Dict[str, Any]]: Payload of the token if valid, None otherwise
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        remaining = expires_at - time.time()
+        if remaining > 0:
+            token_cache.set(key, payload, ttl=remaining)
+    return payload
+
+
 def verify_token(token: str) -> Optional[str]:
     """
     Verify JWT token and return subject.
@@ -58,14 +235,13 @@ def verify_token(token: str) -> Optional[str]:
     Returns:
         Optional[str]: Subject from token if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        token_data = payload.get("sub")
-        if token_data is None:
-            return None
-        return str(token_data)
-    except JWTError:
+    payload = decode_token(token)
+    if payload is None:
         return None
+    token_data = payload.get("sub")
+    if token_data is None:
+        return None
+    return str(token_data)
 
 
 def create_refresh_token(subject: Union[str, Any]) -> str:
@@ -94,12 +270,11 @@ def verify_refresh_token(token: str) -> Optional[str]:
     Returns:
         Optional[str]: Subject from token if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        token_type = payload.get("type")
-        token_data = payload.get("sub")
-        if token_type != "refresh" or token_data is None:
-            return None
-        return str(token_data)
-    except JWTError:
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    token_type = payload.get("type")
+    token_data = payload.get("sub")
+    if token_type != "refresh" or token_data is None:
         return None
+    return str(token_data)
@@ -8,12 +8,14 @@ from app.api.router import api_router
 from app.core.config import settings
 from app.core.exceptions import setup_exception_handlers
 from app.core.listeners import register_listeners
+from app.utils.responses import APIResponse
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Product Information Management System for Klampis Mart",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=APIResponse,
 )
 
 # Set up CORS
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, CheckConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, String, Text, Integer, ForeignKey, CheckConstraint, Computed, Index,
+    text
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.base import Base
 from app.utils.mixins import Imageable
+from app.utils.search import NAME_DESCRIPTION_SEARCH_VECTOR
 
 
 class Categories(Base, Imageable):
@@ -19,6 +24,16 @@ class Categories(Base, Imageable):
     - Electronics (category_type_id=1, parent_id=NULL) ✓
     - Mobile Phones (category_type_id=NULL, parent_id=electronics_id) ✓
     - Smartphones (category_type_id=NULL, parent_id=mobile_phones_id) ✓
+
+    Materialized Path:
+    - ancestor_ids, ancestor_names and ancestor_slugs hold the ancestors
+      ordered from root -> parent, root_category_type holds the category type
+      name of the root category
+    - They are maintained by listeners on insert, move and rename, so the
+      full path can be built from a single row
+
+    Full-text Search:
+    - search_vector is generated by the database from name and description
     """
     name = Column(String(100), nullable=False, index=True)
     slug = Column(String(100), unique=True, nullable=False, index=True)
@@ -35,6 +50,19 @@ class Categories(Base, Imageable):
         nullable=True,  # Allow NULL for top-level categories
         index=True
     )
+    ancestor_ids = Column(
+        ARRAY(Integer), nullable=False, server_default=text("'{}'")
+    )
+    ancestor_names = Column(
+        ARRAY(String(100)), nullable=False, server_default=text("'{}'")
+    )
+    ancestor_slugs = Column(
+        ARRAY(String(100)), nullable=False, server_default=text("'{}'")
+    )
+    root_category_type = Column(String(100), nullable=True)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(NAME_DESCRIPTION_SEARCH_VECTOR, persisted=True))
+    )
 
     # Relationships
     category_type = relationship("CategoryTypes", back_populates="categories")
@@ -56,6 +84,15 @@ class Categories(Base, Imageable):
         CheckConstraint(
             'id <> parent_id',
             name='check_category_no_self_reference'
+        ),
+        # GIN index to find all descendants of a category with ancestor_ids @> {id}
+        Index(
+            'ix_categories_ancestor_ids', 'ancestor_ids', postgresql_using='gin'
+        ),
+        # Keyset pagination order
+        Index('ix_categories_sequence_id', 'sequence', 'id'),
+        Index(
+            'ix_categories_search_vector', 'search_vector', postgresql_using='gin'
         )
     )
 
@@ -63,25 +100,22 @@ class Categories(Base, Imageable):
     def full_path(self):
         """
         Computes the full hierarchical path from the root to this category.
-        The path is returned in order from root -> parent -> self.
+        The path is returned in order from root -> parent -> self and is built
+        from the materialized ancestor columns without loading any parent.
         """
-        path = []
-        current = self
-        while current:
-            if current.category_type:
-                category_type = current.category_type.name
-            else:
-                category_type = None
-            path_item = {
-                'name': current.name,
-                'slug': current.slug,
-                'category_type': category_type,
+        names = [*(self.ancestor_names or []), self.name]
+        slugs = [*(self.ancestor_slugs or []), self.slug]
+        path = [
+            {
+                'name': name,
+                'slug': slug,
+                'category_type': None,
                 'type': 'Category'
             }
-            path.append(path_item)
-            current = current.parent
-        # Reverse the path to get it from root -> self
-        return list(reversed(path))
+            for name, slug in zip(names, slugs)
+        ]
+        path[0]['category_type'] = self.root_category_type
+        return path
 
     def __str__(self) -> str:
         """String representation of the category."""
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, String, Text, Integer, ForeignKey, Computed, Index
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.base import Base
 from app.utils.mixins import Imageable
+from app.utils.search import NAME_DESCRIPTION_SEARCH_VECTOR
 
 
 class Products(Base, Imageable):
@@ -12,6 +16,9 @@ class Products(Base, Imageable):
     This model stores product information and establishes relationships
     with categories, suppliers, and skus. Each product belongs
     to one category and one supplier, but can have multiple skus.
+
+    The search_vector column is generated by the database from name and
+    description for full-text search.
     """
     name = Column(String(100), nullable=False, index=True)
     slug = Column(String(100), unique=True, nullable=False, index=True)
@@ -28,6 +35,9 @@ class Products(Base, Imageable):
         nullable=False,
         index=True
     )
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(NAME_DESCRIPTION_SEARCH_VECTOR, persisted=True))
+    )
 
     # Relationships
     category = relationship("Categories", back_populates="products")
@@ -35,6 +45,12 @@ class Products(Base, Imageable):
 
     skus = relationship("Skus", back_populates="product")
 
+    __table_args__ = (
+        # Keyset pagination order
+        Index('ix_products_sequence_id', 'sequence', 'id'),
+        Index('ix_products_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
     @property
     def full_path(self):
         """
@@ -1,7 +1,10 @@
 import uuid
 
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, CheckConstraint
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import (
+    Column, String, Text, Integer, ForeignKey, CheckConstraint, Index
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship, validates
 
 from app.core.base import Base
 
@@ -25,6 +28,10 @@ class Skus(Base):
     Validation Strategy:
     - Application Level: Provides user-friendly error messages and format validation
     - Database Level: Ensures data integrity for SKU number format
+
+    Full-text Search:
+    - search_vector covers name, description and attribute values; it is kept
+      up to date by listeners because the attribute values live in another table
     """
     name = Column(String(100), nullable=False, index=True)
     slug = Column(String(100), unique=True, nullable=False, index=True)
@@ -42,6 +49,7 @@ class Skus(Base):
         nullable=False,
         index=True
     )
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
     # Relationships
     product = relationship("Products", back_populates="skus")
@@ -53,7 +61,8 @@ class Skus(Base):
     price_details = relationship(
         "PriceDetails",
         back_populates="sku",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="[PriceDetails.sequence, PriceDetails.id]"
     )
 
     # Database constraints
@@ -62,6 +71,9 @@ class Skus(Base):
             "sku_number ~ '^[0-9A-F]{10}$'",
             name='check_skus_sku_number_format'
         ),
+        # Keyset pagination order
+        Index('ix_skus_sequence_id', 'sequence', 'id'),
+        Index('ix_skus_search_vector', 'search_vector', postgresql_using='gin'),
     )
 
     @validates('sku_number')
@@ -8,6 +8,7 @@ from app.repositories.supplier_repository import supplier_repository
 from app.repositories.product_repository import product_repository
 from app.repositories.sku_repository import sku_repository
 from app.repositories.user_repository import user_repository
+from app.repositories.search_repository import search_repository
 
 # Export all repositories
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "product_repository",
     "sku_repository",
     "user_repository",
+    "search_repository",
 ]
@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from app.models import Attributes
 from app.schemas.attribute_schema import AttributeCreate, AttributeUpdate
 from app.repositories.base import CRUDBase
+from app.schemas.base import CountMode
 
 
 class AttributeRepository(CRUDBase[Attributes, AttributeCreate, AttributeUpdate]):
@@ -19,16 +20,20 @@ class AttributeRepository(CRUDBase[Attributes, AttributeCreate, AttributeUpdate]
         name: Optional[str] = None,
         code: Optional[str] = None,
         data_type: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Attributes]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Attributes], int]:
         """Get attributes with filtering support."""
         query = select(self.model)
 
         # Build filter conditions
         conditions = []
+        rank = None
 
         if name is not None:
             conditions.append(self.model.name.ilike(f"%{name}%"))
+            rank = await self.search_rank(db, self.model.name, name)
 
         if code is not None:
             conditions.append(self.model.code.ilike(f"%{code}%"))
@@ -43,11 +48,15 @@ class AttributeRepository(CRUDBase[Attributes, AttributeCreate, AttributeUpdate]
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor,
+            rank=rank
+        )
 
 
 # Create instance to be used as dependency
@@ -1,16 +1,52 @@
-from typing import Any, Dict, Generic, List, Type, TypeVar, Union
+import json
+import time
+from typing import (
+    Any, Dict, Generic, Iterable, List, Optional, Sequence, Set, Tuple, Type,
+    TypeVar, Union
+)
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import (
+    ColumnElement, Row, Select, Subquery, case, delete, insert, or_, select,
+    update, func, text, true, tuple_
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from app.core.base import Base
+from app.core.config import settings
+from app.core.listeners import prepare_rows_for_insert, validate_rows
 from fastapi import HTTPException, status
 from app.models import Images
+from app.schemas.base import CountMode
+from app.utils.etag import ConditionalRequest
+from app.utils.pagination import decode_cursor
+from app.utils.slug import allocate_slugs, slug_prefixes
 
 # Definisikan tipe generik untuk model dan skema
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Row estimates per table name: (time of lookup, estimated rows)
+_table_row_estimates: Dict[str, Tuple[float, int]] = {}
+
+# Whether pg_trgm is installed, per database URL
+_trigram_support: Dict[str, bool] = {}
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
@@ -28,12 +64,288 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return result
 
     async def get_multi(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
-    ) -> List[ModelType]:
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ModelType], int]:
+        return await self.paginate(
+            db,
+            select(self.model),
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
+
+    async def paginate(
+        self,
+        db: AsyncSession,
+        query: Select,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        rank: Optional[ColumnElement] = None,
+        conditional: Optional[ConditionalRequest] = None
+    ) -> Tuple[List[Any], int]:
+        """
+        Get one page of the entities selected by a query together with the
+        total number of entities the query matches.
+
+        Pages are ordered by (sequence, id). Without a cursor the page is
+        taken with OFFSET skip; with a cursor (see app.utils.pagination) it
+        starts right after the cursor key, so deep pages cost the same as
+        the first one and skip is ignored. Ranked pages (see search_rank) are
+        ordered by descending rank first and can only be taken with OFFSET.
+
+        Args:
+            db: Database session
+            query: Select of a single entity, without offset and limit
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            count_mode: EXACT counts with COUNT(*) OVER() in the same query as
+                the page, ESTIMATED uses the planner row estimates instead
+            cursor: Opaque cursor of the previous page
+            rank: Relevance to order by before (sequence, id)
+            conditional: Conditional request to check with the version of
+                the page (see get_version) before loading it. With EXACT
+                counts the version is always taken and its count is the
+                total; otherwise it costs a full count of the query, so it is
+                only taken when the request has an If-None-Match header
+
+        Returns:
+            Tuple of the page of entities and the total count
+
+        Raises:
+            NotModifiedException: If the conditional request has the entity
+                tag of the page
+        """
+        entity = query.column_descriptions[0]['entity']
+        if rank is not None:
+            if cursor is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor cannot be used with a ranked search"
+                )
+            page_query = query.order_by(rank.desc(), entity.sequence, entity.id)
+        else:
+            page_query = query.order_by(entity.sequence, entity.id)
+
+        if cursor is not None:
+            sequence, id = decode_cursor(cursor)
+            page_query = page_query.where(
+                tuple_(entity.sequence, entity.id) > tuple_(sequence, id)
+            ).limit(limit)
+        else:
+            page_query = page_query.offset(skip).limit(limit)
+
+        version = None
+        if conditional is not None and (
+            count_mode == CountMode.EXACT or conditional.if_none_match
+        ):
+            version = await self.get_version(db, query, page_query)
+            conditional.check(version)
+
+        if cursor is not None:
+            result = await db.execute(page_query)
+            items = result.scalars().all()
+            if version is not None:
+                return items, version[0]
+            total = None
+            if count_mode == CountMode.ESTIMATED:
+                total = await self.estimate_count(db, query)
+            if total is None:
+                total = await self.count(db, query)
+            return items, total
+
+        if count_mode == CountMode.ESTIMATED:
+            result = await db.execute(page_query)
+            items = result.scalars().all()
+            if len(items) < limit and (items or skip == 0):
+                # A partial page already tells the exact total
+                return items, skip + len(items)
+            if version is not None:
+                return items, version[0]
+
+            total = await self.estimate_count(db, query)
+            if total is None:
+                total = await self.count(db, query)
+            return items, max(total, skip + len(items))
+
+        if version is not None:
+            # The version already counted the rows of the query
+            result = await db.execute(page_query)
+            return result.scalars().all(), version[0]
+
         result = await db.execute(
-            select(self.model).offset(skip).limit(limit)
+            page_query.add_columns(func.count().over().label('total_count'))
         )
-        return result.scalars().all()
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+
+        # Past the last page there is no row to carry the window count
+        total = await self.count(db, query) if skip > 0 else 0
+        return [], total
+
+    async def get_version(
+        self, db: AsyncSession, query: Select, page: Optional[Select] = None
+    ) -> Tuple[Any, ...]:
+        """
+        Get the version of what a query returns, for entity tags.
+
+        The version is the number of rows the query matches and their newest
+        updated_at, followed by the same pair for every set of related rows
+        shown with the rows of the page (see _related_versions), so deleting
+        a row changes it as well as editing one. All pairs are aggregated in
+        a single statement without loading any entity.
+
+        Args:
+            db: Database session
+            query: Select of a single entity, without offset and limit
+            page: The query with the order, offset and limit of the page,
+                if only part of it is returned
+
+        Returns:
+            Tuple of the counts and newest updated_at values
+        """
+        rows = query.order_by(None).subquery()
+        page_rows = rows if page is None else page.subquery()
+        aggregates = [
+            select(func.count(), func.max(rows.c.updated_at)).subquery()
+        ]
+        aggregates.extend(
+            aggregate.subquery()
+            for aggregate in self._related_versions(page_rows)
+        )
+
+        statement = select(
+            *(column for aggregate in aggregates for column in aggregate.c)
+        ).select_from(aggregates[0])
+        # Every aggregate is a single row, so they are joined side by side
+        for aggregate in aggregates[1:]:
+            statement = statement.join(aggregate, true())
+        result = await db.execute(statement)
+        return tuple(result.one())
+
+    def _related_versions(self, rows: Subquery) -> List[Select]:
+        """
+        Get the aggregates of the related rows a response shows with the
+        given rows, each a select of (count, max(updated_at)).
+
+        Repositories whose responses include relationships override this;
+        by default a response only shows the rows themselves.
+        """
+        return []
+
+    async def check_not_modified(
+        self,
+        db: AsyncSession,
+        id: Any,
+        conditional: Optional[ConditionalRequest]
+    ) -> None:
+        """
+        Check a conditional request for one entity with its version, before
+        loading it.
+
+        Raises:
+            NotModifiedException: If the request has the entity tag of the
+                entity
+        """
+        if conditional is None:
+            return
+        query = select(self.model).where(self.model.id == id)
+        conditional.check(await self.get_version(db, query))
+
+    async def count(self, db: AsyncSession, query: Select) -> int:
+        """Count all rows matched by a query."""
+        subquery = query.order_by(None).subquery()
+        result = await db.execute(select(func.count()).select_from(subquery))
+        return result.scalar() or 0
+
+    async def estimate_count(
+        self, db: AsyncSession, query: Select
+    ) -> Optional[int]:
+        """
+        Estimate the number of rows matched by a query from the planner
+        statistics.
+
+        Unfiltered queries use pg_class.reltuples of the table, which is
+        cached for COUNT_ESTIMATE_TTL_SECONDS. Filtered queries use the row
+        estimate of their EXPLAIN plan, with the filter values bound as
+        parameters. Returns None if the table has never been analyzed.
+        """
+        if query.whereclause is None:
+            table_name = query.column_descriptions[0]['entity'].__tablename__
+            return await self._estimate_table_rows(db, table_name)
+
+        result = await db.execute(_Explain(query.order_by(None)))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    async def _estimate_table_rows(
+        self, db: AsyncSession, table_name: str
+    ) -> Optional[int]:
+        """Get the (cached) pg_class.reltuples estimate of a table."""
+        now = time.monotonic()
+        cached = _table_row_estimates.get(table_name)
+        if cached and now - cached[0] < settings.COUNT_ESTIMATE_TTL_SECONDS:
+            return cached[1]
+
+        result = await db.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = CAST(:table_name AS regclass)"
+            ),
+            {'table_name': table_name}
+        )
+        estimate = result.scalar()
+        if estimate is None or estimate < 0:
+            # reltuples is -1 until the table is vacuumed or analyzed
+            return None
+
+        _table_row_estimates[table_name] = (now, estimate)
+        return estimate
+
+    async def search_rank(
+        self, db: AsyncSession, column: ColumnElement, term: str
+    ) -> ColumnElement:
+        """
+        Get the relevance of a column value to a partial match search term.
+
+        With pg_trgm installed this is the trigram word similarity of the
+        term to the value, computed on the rows the ILIKE filter found
+        through the GIN trigram index. Without it, values starting with the
+        term rank before values that only contain it.
+
+        Args:
+            db: Database session
+            column: Searched column
+            term: Search term
+
+        Returns:
+            Expression to pass as rank to paginate
+        """
+        if await self._has_trigram_support(db):
+            return func.word_similarity(term, column)
+        return case((column.ilike(f"{term}%"), 1), else_=0)
+
+    async def _has_trigram_support(self, db: AsyncSession) -> bool:
+        """Check (once per database) whether pg_trgm is installed."""
+        url = str(db.get_bind().url)
+        if url not in _trigram_support:
+            result = await db.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            )
+            _trigram_support[url] = result.scalar() is not None
+        return _trigram_support[url]
 
     async def create(
         self,
@@ -64,6 +376,148 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 detail=f"Internal server error: {e}"
             )
 
+    async def insert_bulk(
+        self,
+        db: AsyncSession,
+        objs_in: Iterable[Union[CreateSchemaType, Dict[str, Any]]],
+        created_by: int,
+        *,
+        returning: Optional[Sequence[ColumnElement]] = None
+    ) -> List[Row]:
+        """
+        Insert many objects with a single executemany INSERT, without
+        committing.
+
+        The ORM listeners do not run for Core inserts, so the rows get the
+        same treatment through prepare_rows_for_insert: type validation, the
+        slug or code derived from the name and password hashing. Slugs that
+        are taken or repeated in the batch get a '-2', '-3', ... suffix
+        instead of failing on the unique index. Models with
+        rows that need the database (the path of categories, the child rows
+        and search vector of SKUs) extend _before_bulk_insert and
+        _after_bulk_insert. Fields that are not columns of the model, such as
+        nested images, are not inserted here.
+
+        Args:
+            db: Database session
+            objs_in: Create schemas or dicts of column values
+            created_by: ID of the creating user
+            returning: Columns to return besides the id
+
+        Returns:
+            The (id, *returning) rows of the inserted objects, in input order
+
+        Raises:
+            ValueError, TypeError: If a value is invalid for its column
+        """
+        objs_in = list(objs_in)
+        columns = self.model.__table__.columns
+        rows = []
+        for obj_in in objs_in:
+            obj_data = (
+                obj_in.model_dump() if isinstance(obj_in, BaseModel) else obj_in
+            )
+            row = {key: value for key, value in obj_data.items() if key in columns}
+            row['created_by'] = created_by
+            row['updated_by'] = created_by
+            rows.append(row)
+        if not rows:
+            return []
+
+        await self._before_bulk_insert(db, rows)
+        prepare_rows_for_insert(self.model, rows)
+        await self._allocate_unique_slugs(db, rows)
+        result = await db.execute(
+            insert(self.model).returning(
+                self.model.id, *(returning or ()), sort_by_parameter_order=True
+            ),
+            rows
+        )
+        created = result.all()
+        await self._after_bulk_insert(db, objs_in, rows, created)
+        return created
+
+    async def create_bulk(
+        self,
+        db: AsyncSession,
+        objs_in: Iterable[Union[CreateSchemaType, Dict[str, Any]]],
+        created_by: int,
+        *,
+        returning: Optional[Sequence[ColumnElement]] = None
+    ) -> List[Row]:
+        """
+        Create many objects in a single transaction (see insert_bulk).
+        """
+        try:
+            created = await self.insert_bulk(
+                db, objs_in, created_by, returning=returning
+            )
+            await db.commit()
+            return created
+        except HTTPException:
+            await db.rollback()
+            raise
+        except (ValueError, TypeError) as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Internal server error: {e}"
+            )
+
+    async def _allocate_unique_slugs(
+        self, db: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Suffix the colliding slugs of a bulk insert, with a single query for
+        the taken slugs of the whole batch.
+
+        The query matches slug LIKE 'prefix%' for the prefixes of the batch,
+        which is served by the varchar_pattern_ops index on slug (see the
+        add_slug_pattern_indexes migration).
+        """
+        slug_column = self.model.__table__.columns.get('slug')
+        if slug_column is None or not slug_column.unique:
+            return
+        slug_rows = [row for row in rows if row.get('slug') is not None]
+        if not slug_rows:
+            return
+
+        slugs = [row['slug'] for row in slug_rows]
+        max_length = slug_column.type.length
+        result = await db.execute(
+            select(slug_column).where(or_(*(
+                slug_column.like(f'{prefix}%')
+                for prefix in slug_prefixes(slugs, max_length)
+            )))
+        )
+        allocated = allocate_slugs(slugs, result.scalars().all(), max_length)
+        for row, slug in zip(slug_rows, allocated):
+            row['slug'] = slug
+
+    async def _before_bulk_insert(
+        self, db: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> None:
+        """Complete the rows of a bulk insert before they are validated."""
+
+    async def _after_bulk_insert(
+        self,
+        db: AsyncSession,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+        rows: List[Dict[str, Any]],
+        created: List[Row]
+    ) -> None:
+        """
+        Finish a bulk insert once the rows are inserted. The objects given to
+        insert_bulk, their column values and their created rows are in the
+        same order.
+        """
+
     async def update(
         self,
         db: AsyncSession,
@@ -175,6 +629,54 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 )
             )
 
+    async def get_existing_ids(
+        self,
+        db: AsyncSession,
+        foreign_model: ModelType,
+        foreign_key_values: Iterable[int]
+    ) -> Set[int]:
+        """
+        Get which of the given ids exist, with a single query for a whole
+        batch instead of one validate_foreign_key call per id.
+
+        Args:
+            db: Database session
+            foreign_model: Model the ids refer to
+            foreign_key_values: Ids to look up
+
+        Returns:
+            Set of the ids that exist
+        """
+        ids = set(foreign_key_values)
+        if not ids:
+            return set()
+        result = await db.execute(
+            select(foreign_model.id).where(foreign_model.id.in_(ids))
+        )
+        return set(result.scalars().all())
+
+    async def get_taken_names(
+        self, db: AsyncSession, names: Iterable[str]
+    ) -> Set[str]:
+        """
+        Get which of the given names are already used, with a single query
+        for a whole batch instead of one get_by_field call per name.
+
+        Slugs are not checked: bulk inserts suffix the taken ones (see
+        _allocate_unique_slugs).
+
+        Args:
+            db: Database session
+            names: Names to look up
+
+        Returns:
+            The taken names
+        """
+        result = await db.execute(
+            select(self.model.name).where(self.model.name.in_(set(names)))
+        )
+        return set(result.scalars().all())
+
     async def count_children(
         self, db: AsyncSession, parent_column: str, parent_id: int, children: ModelType
     ) -> int:
@@ -185,6 +687,87 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await db.execute(query)
         return result.scalar() or 0
 
+    async def sync_images(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        *,
+        images_to_create: Optional[Sequence[BaseModel]] = None,
+        images_to_update: Optional[Sequence[BaseModel]] = None,
+        images_to_delete: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        Create, update and delete images of an Imageable object without
+        committing.
+
+        The images to update or delete are fetched with one query and checked
+        in memory with check_and_validate_existing_image. Deletes, updates
+        and inserts then each run as one statement for the whole batch, after
+        going through the same validation as the ORM listeners.
+
+        Args:
+            db: Database session
+            db_obj: Object owning the images
+            images_to_create: New images (ImageCreate)
+            images_to_update: Changes of existing images (ImageUpdate)
+            images_to_delete: IDs of the images to delete
+
+        Raises:
+            HTTPException: If an image is missing or belongs to another object
+            ValueError, TypeError: If a value is invalid for its column
+        """
+        content_type = self.model.__tablename__
+        images_to_update = images_to_update or []
+        images_to_delete = images_to_delete or []
+
+        image_ids = [image_data.id for image_data in images_to_update]
+        image_ids.extend(images_to_delete)
+        existing_images = {}
+        if image_ids:
+            # Looked up by id only, not filtered by object_id/content_type:
+            # an image of another object must still be told apart from a
+            # missing one (400 instead of 404)
+            result = await db.execute(
+                select(Images.id, Images.object_id, Images.content_type)
+                .where(Images.id.in_(image_ids))
+            )
+            existing_images = {row.id: row for row in result}
+        for image_id in image_ids:
+            self.check_and_validate_existing_image(
+                existing_images.get(image_id), image_id, db_obj, content_type
+            )
+
+        # Deletes go first so their files can be reused by the other images
+        if images_to_delete:
+            await db.execute(delete(Images).where(Images.id.in_(images_to_delete)))
+
+        update_rows = validate_rows(Images, [
+            {'id': image_data.id, **update_data}
+            for image_data in images_to_update
+            if (update_data := image_data.model_dump(
+                exclude_unset=True, exclude={'id'}
+            ))
+        ])
+        if update_rows:
+            await db.execute(update(Images), update_rows)
+            # Bulk updates by primary key leave loaded images untouched
+            for row in update_rows:
+                image = db.sync_session.identity_map.get(
+                    identity_key(Images, row['id'])
+                )
+                if image is not None:
+                    db.expire(image)
+
+        if images_to_create:
+            await db.execute(insert(Images), prepare_rows_for_insert(Images, [
+                {
+                    'object_id': db_obj.id,
+                    'content_type': content_type,
+                    **image_data.model_dump()
+                }
+                for image_data in images_to_create
+            ]))
+
     def check_and_validate_existing_image(
         self,
         image: Images | None,
@@ -1,12 +1,18 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Select, Subquery, and_, func, select
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
+from app.core.listeners import get_category_paths
 from app.models import Categories, Images, Products, CategoryTypes
 from app.schemas.category_schema import CategoryCreate, CategoryUpdate
 from app.repositories.base import CRUDBase
+from app.schemas.base import CountMode
+from app.utils.etag import ConditionalRequest
 
 
 class CategoryRepository(
@@ -24,20 +30,23 @@ class CategoryRepository(
         slug: Optional[str] = None,
         category_type_id: Optional[int] = None,
         parent_id: Optional[int] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Categories]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
+    ) -> Tuple[List[Categories], int]:
         """Get categories with filtering support."""
         query = select(self.model).options(
-            selectinload(self.model.category_type),
-            selectinload(self.model.parent),
             selectinload(self.model.images)
         )
 
         # Build filter conditions
         conditions = []
+        rank = None
 
         if name is not None:
             conditions.append(self.model.name.ilike(f"%{name}%"))
+            rank = await self.search_rank(db, self.model.name, name)
 
         if slug is not None:
             conditions.append(self.model.slug == slug)
@@ -55,51 +64,60 @@ class CategoryRepository(
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        categories = result.scalars().all()
+        categories, total = await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor,
+            rank=rank,
+            conditional=conditional
+        )
 
-        # Load children recursively for each category
-        for category in categories:
-            await self.load_children_recursively(db, category)
-            if category.parent is not None:
-                await self.load_parent_category_type_recursively(db, category.parent)
+        # Load the whole subtree of every category at once
+        await self.load_subtrees(db, categories)
 
-        return categories
+        return categories, total
 
     async def get_children_by_parent(
         self,
         db: AsyncSession,
         parent_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Categories]:
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Categories], int]:
         """Get all direct children of a category."""
         query = (
             select(self.model)
-            .options(
-                selectinload(self.model.parent),
-                selectinload(self.model.images)
-            )
+            .options(selectinload(self.model.images))
             .where(self.model.parent_id == parent_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        categories = result.scalars().all()
+        categories, total = await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
-        # Load children recursively for each category
-        for category in categories:
-            await self.load_children_recursively(db, category)
-            await self.load_parent_category_type_recursively(db, category)
+        # Load the whole subtree of every category at once
+        await self.load_subtrees(db, categories)
 
-        return categories
+        return categories, total
 
     async def get_products_by_category(
-        self, db: AsyncSession, category_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Products]:
+        self,
+        db: AsyncSession,
+        category_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Products], int]:
         """Get products by category."""
         query = (
             select(Products)
@@ -108,14 +126,15 @@ class CategoryRepository(
                 selectinload(Products.images)
             )
             .where(Products.category_id == category_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        products = result.scalars().all()
-        if len(products) > 0:
-            await self.load_parent_category_type_recursively(db, products[0].category)
-        return products
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
     async def create_category(
         self, db: AsyncSession, obj_in: CategoryCreate, created_by: int
@@ -149,9 +168,8 @@ class CategoryRepository(
                 db.add(image)
 
             await db.commit()
-            await self.load_children_recursively(db, db_category)
+            await self.load_subtrees(db, [db_category])
             await db.refresh(db_category, ['images'])
-            await self.load_parent_category_type_recursively(db, db_category)
             return db_category
         except HTTPException:
             await db.rollback()
@@ -200,39 +218,16 @@ class CategoryRepository(
                 await db.commit()
                 await db.refresh(db_obj)
 
-            if obj_in.images_to_create:
-                for image_data in obj_in.images_to_create:
-                    image = Images(
-                        object_id=db_obj.id,
-                        content_type="categories",
-                        **image_data.model_dump()
-                    )
-                    db.add(image)
-
-            if obj_in.images_to_update:
-                for image_data in obj_in.images_to_update:
-                    image = await db.get(Images, image_data.id)
-                    self.check_and_validate_existing_image(
-                        image, image_data.id, db_obj, "categories"
-                    )
-                    update_data = image_data.model_dump(
-                        exclude_unset=True, exclude={'id'}
-                    )
-                    for field, value in update_data.items():
-                        setattr(image, field, value)
-                    db.add(image)
-
-            if obj_in.images_to_delete:
-                for image_id in obj_in.images_to_delete:
-                    image = await db.get(Images, image_id)
-                    self.check_and_validate_existing_image(
-                        image, image_id, db_obj, "categories"
-                    )
-                    await db.delete(image)
+            await self.sync_images(
+                db,
+                db_obj,
+                images_to_create=obj_in.images_to_create,
+                images_to_update=obj_in.images_to_update,
+                images_to_delete=obj_in.images_to_delete
+            )
             await db.commit()
-            await self.load_children_recursively(db, db_obj)
+            await self.load_subtrees(db, [db_obj])
             await db.refresh(db_obj, ['images'])
-            await self.load_parent_category_type_recursively(db, db_obj)
             return db_obj
         except HTTPException:
             await db.rollback()
@@ -250,13 +245,30 @@ class CategoryRepository(
                 detail=f"Failed to update category: {str(e)}"
             )
 
+    def _related_versions(self, rows: Subquery) -> List[Select]:
+        """
+        Categories are shown with their whole subtree, found through
+        ancestor_ids, and with the images of every category in it.
+        """
+        descendants = (
+            select(Categories.id, Categories.updated_at)
+            .join(rows, Categories.ancestor_ids.contains(array([rows.c.id])))
+            .subquery()
+        )
+        shown_ids = select(rows.c.id).union_all(select(descendants.c.id))
+        return [
+            select(func.count(), func.max(descendants.c.updated_at)),
+            select(func.count(), func.max(Images.updated_at)).where(
+                Images.content_type == Categories.__tablename__,
+                Images.object_id.in_(shown_ids)
+            )
+        ]
+
     async def get_with_full_relations(
         self, db: AsyncSession, category_id: int
     ) -> Categories | None:
         """Get category with all relations loaded."""
         query = select(self.model).options(
-            selectinload(self.model.category_type),
-            selectinload(self.model.parent),
             selectinload(self.model.images)
         ).where(self.model.id == category_id)
 
@@ -264,37 +276,75 @@ class CategoryRepository(
         category = result.scalar_one_or_none()
 
         if category:
-            await self.load_children_recursively(db, category)
-            await self.load_parent_category_type_recursively(db, category)
+            await self.load_subtrees(db, [category])
 
         return category
 
-    async def load_parent_category_type_recursively(
-        self, session: AsyncSession, category: Categories
+    async def load_subtrees(
+        self, session: AsyncSession, categories: Sequence[Categories]
     ) -> None:
         """
-        Load parent category type recursively. This will be used mostly for
-        getting the category type of the parent category to be used for full path.
+        Load all descendants of the given categories with a single recursive
+        query and assemble their ``children`` collections in memory.
+
+        Descendants are loaded together with their images so the whole tree
+        can be serialized without any further lazy loading.
         """
-        stmt = select(Categories).where(Categories.id == category.id).options(
-            selectinload(Categories.category_type),
-            selectinload(Categories.parent)
+        if not categories:
+            return
+
+        root_ids = {category.id for category in categories}
+        subtree = (
+            select(Categories.id)
+            .where(Categories.parent_id.in_(root_ids))
+            .cte(name="subtree", recursive=True)
         )
-        result = await session.execute(stmt)
-        data = result.scalar_one_or_none()
-        if data.parent is not None:
-            await self.load_parent_category_type_recursively(session, data.parent)
+        # UNION (not UNION ALL) so a cyclic hierarchy cannot recurse forever
+        subtree = subtree.union(
+            select(Categories.id).where(Categories.parent_id == subtree.c.id)
+        )
+        query = (
+            select(Categories)
+            .join(subtree, Categories.id == subtree.c.id)
+            .options(selectinload(Categories.images))
+            .order_by(Categories.id)
+        )
+        result = await session.execute(query)
+        descendants = result.scalars().all()
+
+        children_by_parent = defaultdict(list)
+        for descendant in descendants:
+            children_by_parent[descendant.parent_id].append(descendant)
+
+        categories_by_id = {
+            category.id: category for category in (*categories, *descendants)
+        }
+        for category in categories_by_id.values():
+            set_committed_value(
+                category, 'children', children_by_parent.get(category.id, [])
+            )
+        for descendant in descendants:
+            set_committed_value(
+                descendant, 'parent', categories_by_id[descendant.parent_id]
+            )
 
-    async def load_children_recursively(
-        self, session: AsyncSession, category: Categories
+    async def _before_bulk_insert(
+        self, db: AsyncSession, rows: List[Dict[str, Any]]
     ) -> None:
-        """
-        Load all children recursively.
-        Warning: This will cause N+1 query problem.
-        """
-        await session.refresh(category, ['children'])
-        for child in category.children:
-            await self.load_children_recursively(session, child)
+        """Set the materialized path of new categories, fetched per batch."""
+        placements = [
+            (row.get('parent_id'), row.get('category_type_id')) for row in rows
+        ]
+        paths = await db.run_sync(
+            lambda session: get_category_paths(session.connection(), placements)
+        )
+        for row, placement in zip(rows, placements):
+            (
+                row['ancestor_ids'],
+                row['ancestor_names'],
+                row['ancestor_slugs'],
+                row['root_category_type']
+            ) = paths[placement]
 
 
 # Create instance to be used as dependency
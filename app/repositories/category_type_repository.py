@@ -1,11 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 
-from app.models import CategoryTypes
+from app.models import CategoryTypes, Categories
 from app.schemas.category_type_schema import CategoryTypeCreate, CategoryTypeUpdate
 from app.repositories.base import CRUDBase
+from app.schemas.base import CountMode
 from app.repositories import category_repository
 
 
@@ -22,8 +23,10 @@ class CategoryTypeRepository(
         limit: int = 100,
         name: Optional[str] = None,
         slug: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[CategoryTypes]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CategoryTypes], int]:
         """Get category types with filtering support."""
         query = select(self.model)
 
@@ -43,23 +46,25 @@ class CategoryTypeRepository(
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
     async def get_categories_by_type(
         self,
         db: AsyncSession,
         category_type_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List:
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Categories], int]:
         """Get categories by category type."""
-        # Import here to avoid circular import
-        from app.models import Categories
-
         query = (
             select(Categories)
             .options(
@@ -67,14 +72,17 @@ class CategoryTypeRepository(
                 selectinload(Categories.images)
             )
             .where(Categories.category_type_id == category_type_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        categories = result.scalars().all()
-        for category in categories:
-            await category_repository.load_children_recursively(db, category)
-        return categories
+        categories, total = await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
+        await category_repository.load_subtrees(db, categories)
+        return categories, total
 
 
 # Create instance to be used as dependency
@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from app.models import Pricelists
 from app.schemas.pricelist_schema import PricelistCreate, PricelistUpdate
 from app.repositories.base import CRUDBase
+from app.schemas.base import CountMode
 
 
 class PricelistRepository(CRUDBase[Pricelists, PricelistCreate, PricelistUpdate]):
@@ -18,8 +19,10 @@ class PricelistRepository(CRUDBase[Pricelists, PricelistCreate, PricelistUpdate]
         limit: int = 100,
         name: Optional[str] = None,
         code: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Pricelists]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Pricelists], int]:
         """Get pricelists with filtering support."""
         query = select(self.model)
 
@@ -39,11 +42,14 @@ class PricelistRepository(CRUDBase[Pricelists, PricelistCreate, PricelistUpdate]
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
 
 # Create instance to be used as dependency
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Row, Select, Subquery, select, and_, func, insert
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
@@ -14,8 +14,12 @@ from app.models import (
     SkuAttributeValue,
 )
 from app.schemas.product_schema import ProductCreate, ProductUpdate
+from app.schemas.import_schema import ProductImportLine
+from app.core.listeners import prepare_rows_for_insert
 from app.repositories.base import CRUDBase
-from app.repositories import category_repository
+from app.repositories.sku_repository import sku_repository
+from app.schemas.base import CountMode
+from app.utils.etag import ConditionalRequest
 
 
 class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
@@ -31,8 +35,11 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
         slug: Optional[str] = None,
         category_id: Optional[int] = None,
         supplier_id: Optional[int] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Products]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
+    ) -> Tuple[List[Products], int]:
         """Get products with filtering support."""
         query = select(self.model).options(
             selectinload(self.model.category),
@@ -42,9 +49,11 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
 
         # Build filter conditions
         conditions = []
+        rank = None
 
         if name is not None:
             conditions.append(self.model.name.ilike(f"%{name}%"))
+            rank = await self.search_rank(db, self.model.name, name)
 
         if slug is not None:
             conditions.append(self.model.slug == slug)
@@ -62,19 +71,31 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        products = result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor,
+            rank=rank,
+            conditional=conditional
+        )
 
-        # Load parent category type recursively for each product's category
-        for product in products:
-            await category_repository.load_parent_category_type_recursively(
-                db, product.category
+    def _related_versions(self, rows: Subquery) -> List[Select]:
+        """
+        Products are shown with the path of their category, stored on the
+        category row, and with their images.
+        """
+        return [
+            select(func.count(), func.max(Categories.updated_at)).where(
+                Categories.id.in_(select(rows.c.category_id))
+            ),
+            select(func.count(), func.max(Images.updated_at)).where(
+                Images.content_type == Products.__tablename__,
+                Images.object_id.in_(select(rows.c.id))
             )
-
-        return products
+        ]
 
     async def get_with_relationships(
         self, db: AsyncSession, product_id: int
@@ -89,16 +110,17 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
         result = await db.execute(query)
         product = result.scalar_one_or_none()
 
-        if product:
-            await category_repository.load_parent_category_type_recursively(
-                db, product.category
-            )
-
         return product
 
     async def get_skus_by_product(
-        self, db: AsyncSession, product_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Skus]:
+        self,
+        db: AsyncSession,
+        product_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Skus], int]:
         """Get SKUs by product."""
         query = (
             select(Skus)
@@ -112,19 +134,15 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
                 )
             )
             .where(Skus.product_id == product_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        skus = result.scalars().all()
-
-        # Load category type for product category
-        if len(skus) > 0:
-            await category_repository.load_parent_category_type_recursively(
-                db, skus[0].product.category
-            )
-
-        return skus
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
     async def create_product(
         self, db: AsyncSession, obj_in: ProductCreate, created_by: int
@@ -160,9 +178,6 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
                 db.add(image)
             await db.commit()
             await db.refresh(db_product, ['images', 'category', 'supplier'])
-            await category_repository.load_parent_category_type_recursively(
-                db, db_product.category
-            )
             return db_product
         except HTTPException:
             await db.rollback()
@@ -180,6 +195,85 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
                 detail=f"Failed to create product: {str(e)}"
             )
 
+    async def get_taken_image_files(
+        self, db: AsyncSession, files: Iterable[str]
+    ) -> Set[str]:
+        """Get which of the given image files are already used."""
+        files = set(files)
+        if not files:
+            return set()
+        result = await db.execute(select(Images.file).where(Images.file.in_(files)))
+        return set(result.scalars().all())
+
+    async def create_products_bulk(
+        self, db: AsyncSession, objs_in: List[ProductImportLine], created_by: int
+    ) -> Tuple[List[Row], int]:
+        """
+        Create many products with their images and SKUs in a single
+        transaction.
+
+        The products are inserted with insert_bulk, which suffixes taken
+        slugs. Their images then get one multi-row INSERT for the whole batch
+        and their SKUs are inserted with sku_repository.insert_skus_bulk.
+        Business rules are expected to be checked beforehand.
+
+        Args:
+            db: Database session
+            objs_in: Products to create, with their images and SKUs
+            created_by: ID of the user creating the products
+
+        Returns:
+            Tuple of the (id, slug) rows of the created products, in input
+            order, and the number of created SKUs
+        """
+        try:
+            created = await self.insert_bulk(
+                db, objs_in, created_by, returning=[self.model.slug]
+            )
+
+            image_rows = []
+            skus = []
+            for obj_in, row in zip(objs_in, created):
+                image_rows.extend(
+                    {
+                        'object_id': row.id,
+                        'content_type': 'products',
+                        **image_data.model_dump(),
+                        'created_by': created_by,
+                        'updated_by': created_by
+                    }
+                    for image_data in obj_in.images
+                )
+                skus.extend(
+                    sku.model_copy(update={'product_id': row.id})
+                    for sku in obj_in.skus
+                )
+            if image_rows:
+                prepare_rows_for_insert(Images, image_rows)
+                await db.execute(insert(Images), image_rows)
+            created_skus = await sku_repository.insert_skus_bulk(
+                db, skus, created_by
+            )
+
+            await db.commit()
+            return created, len(created_skus)
+
+        except HTTPException:
+            await db.rollback()
+            raise
+        except (ValueError, TypeError) as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create products: {str(e)}"
+            )
+
     async def update_product(
         self,
         db: AsyncSession,
@@ -214,40 +308,15 @@ class ProductRepository(CRUDBase[Products, ProductCreate, ProductUpdate]):
                 await db.commit()
                 await db.refresh(db_obj)
 
-            if obj_in.images_to_create:
-                for image_data in obj_in.images_to_create:
-                    image = Images(
-                        object_id=db_obj.id,
-                        content_type='products',
-                        **image_data.model_dump()
-                    )
-                    db.add(image)
-
-            if obj_in.images_to_update:
-                for image_data in obj_in.images_to_update:
-                    image = await db.get(Images, image_data.id)
-                    self.check_and_validate_existing_image(
-                        image, image_data.id, db_obj, "products"
-                    )
-                    update_data = image_data.model_dump(
-                        exclude_unset=True, exclude={'id'}
-                    )
-                    for field, value in update_data.items():
-                        setattr(image, field, value)
-                    db.add(image)
-
-            if obj_in.images_to_delete:
-                for image_id in obj_in.images_to_delete:
-                    image = await db.get(Images, image_id)
-                    self.check_and_validate_existing_image(
-                        image, image_id, db_obj, "products"
-                    )
-                    await db.delete(image)
+            await self.sync_images(
+                db,
+                db_obj,
+                images_to_create=obj_in.images_to_create,
+                images_to_update=obj_in.images_to_update,
+                images_to_delete=obj_in.images_to_delete
+            )
             await db.commit()
             await db.refresh(db_obj, ['images', 'category', 'supplier'])
-            await category_repository.load_parent_category_type_recursively(
-                db, db_obj.category
-            )
             return db_obj
         except HTTPException:
             await db.rollback()
@@ -0,0 +1,112 @@
+from typing import Any, Dict, List, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import selectinload
+
+from app.models import Categories, Products, Skus
+from app.schemas.search_schema import SearchType
+from app.utils.search import SEARCH_TEXT_CONFIG
+
+
+class SearchRepository:
+    """Repository for full-text search across categories, products and SKUs."""
+
+    models = {
+        SearchType.CATEGORY: Categories,
+        SearchType.PRODUCT: Products,
+        SearchType.SKU: Skus,
+    }
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        *,
+        types: Sequence[SearchType],
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Tuple[SearchType, Any, float]], int]:
+        """
+        Search the search vectors of the given entity types.
+
+        Matches of every type are ranked together with ts_rank in one query
+        served by the GIN indexes of the search vectors, then the entities of
+        the page are loaded with what their full path needs.
+
+        Args:
+            db: Database session
+            q: Search terms in web search syntax
+            types: Entity types to search
+            skip: Number of hits to skip
+            limit: Maximum number of hits to return
+
+        Returns:
+            Tuple of the (type, entity, rank) hits of the page, ordered by
+            descending rank, and the total number of hits
+        """
+        query = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, q)
+        hits = union_all(*(
+            select(
+                literal(search_type.value).label('type'),
+                self.models[search_type].id.label('id'),
+                func.ts_rank(
+                    self.models[search_type].search_vector, query
+                ).label('rank')
+            ).where(self.models[search_type].search_vector.bool_op('@@')(query))
+            for search_type in types
+        )).subquery()
+
+        result = await db.execute(
+            select(
+                hits.c.type,
+                hits.c.id,
+                hits.c.rank,
+                func.count().over().label('total_count')
+            )
+            .order_by(hits.c.rank.desc(), hits.c.type, hits.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total_count
+        elif skip > 0:
+            # Past the last page there is no row to carry the window count
+            result = await db.execute(select(func.count()).select_from(hits))
+            total = result.scalar() or 0
+        else:
+            total = 0
+
+        ids_by_type: Dict[SearchType, List[int]] = {}
+        for row in rows:
+            ids_by_type.setdefault(SearchType(row.type), []).append(row.id)
+
+        entities: Dict[Tuple[SearchType, int], Any] = {}
+        for search_type, ids in ids_by_type.items():
+            for entity in await self._load(db, search_type, ids):
+                entities[(search_type, entity.id)] = entity
+
+        page = []
+        for row in rows:
+            search_type = SearchType(row.type)
+            page.append((search_type, entities[(search_type, row.id)], row.rank))
+        return page, total
+
+    async def _load(
+        self, db: AsyncSession, search_type: SearchType, ids: List[int]
+    ) -> Sequence[Any]:
+        """Load the hit entities of one type with their path relations."""
+        model = self.models[search_type]
+        query = select(model).where(model.id.in_(ids))
+        if search_type == SearchType.PRODUCT:
+            query = query.options(selectinload(Products.category))
+        elif search_type == SearchType.SKU:
+            query = query.options(
+                selectinload(Skus.product).selectinload(Products.category)
+            )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+
+# Create instance to be used as dependency
+search_repository = SearchRepository()
@@ -1,15 +1,27 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    Row, Select, Subquery, and_, delete, func, insert, literal_column, or_,
+    select, update
+)
+from sqlalchemy.orm import joinedload, selectinload
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 from app.models import (
-    Skus, Products, Attributes, PriceDetails, SkuAttributeValue, Pricelists
+    Skus, Products, Categories, Attributes, PriceDetails, SkuAttributeValue,
+    Pricelists
 )
 from app.schemas.sku_schema import SkuCreate, SkuUpdate
+from app.core.config import settings
+from app.core.listeners import prepare_rows_for_insert, validate_rows
 from app.repositories.base import CRUDBase
-from app.repositories import category_repository
+from app.schemas.base import CountMode
+from app.utils.etag import ConditionalRequest
+from app.utils.search import SKU_SEARCH_VECTOR
 
 
 class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
@@ -25,8 +37,11 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
         slug: Optional[str] = None,
         sku_number: Optional[str] = None,
         product_id: Optional[int] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Skus]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
+    ) -> Tuple[List[Skus], int]:
         """Get SKUs with filtering support."""
         query = select(self.model).options(
             selectinload(self.model.product).selectinload(Products.category),
@@ -40,9 +55,11 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
 
         # Build filter conditions
         conditions = []
+        rank = None
 
         if name is not None:
             conditions.append(self.model.name.ilike(f"%{name}%"))
+            rank = await self.search_rank(db, self.model.name, name)
 
         if slug is not None:
             conditions.append(self.model.slug == slug)
@@ -59,19 +76,64 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
         if conditions:
             query = query.where(and_(*conditions))
 
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        data = result.scalars().all()
-        for sku in data:
-            await category_repository.load_parent_category_type_recursively(
-                db, sku.product.category
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor,
+            rank=rank,
+            conditional=conditional
+        )
+
+    def _related_versions(self, rows: Subquery) -> List[Select]:
+        """
+        SKUs are shown with the path of their product and category, their
+        price details with pricelists and their attribute values with
+        attributes.
+        """
+        sku_ids = select(rows.c.id)
+        product_ids = select(rows.c.product_id)
+        return [
+            select(func.count(), func.max(Products.updated_at)).where(
+                Products.id.in_(product_ids)
+            ),
+            select(func.count(), func.max(Categories.updated_at)).where(
+                Categories.id.in_(
+                    select(Products.category_id)
+                    .where(Products.id.in_(product_ids))
+                )
+            ),
+            select(func.count(), func.max(PriceDetails.updated_at)).where(
+                PriceDetails.sku_id.in_(sku_ids)
+            ),
+            select(func.count(), func.max(Pricelists.updated_at)).where(
+                Pricelists.id.in_(
+                    select(PriceDetails.pricelist_id)
+                    .where(PriceDetails.sku_id.in_(sku_ids))
+                )
+            ),
+            select(func.count(), func.max(SkuAttributeValue.updated_at)).where(
+                SkuAttributeValue.sku_id.in_(sku_ids)
+            ),
+            select(func.count(), func.max(Attributes.updated_at)).where(
+                Attributes.id.in_(
+                    select(SkuAttributeValue.attribute_id)
+                    .where(SkuAttributeValue.sku_id.in_(sku_ids))
+                )
             )
-        return data
+        ]
 
     async def get_with_relationships(
-        self, db: AsyncSession, sku_id: int
+        self, db: AsyncSession, sku_id: int, *, populate_existing: bool = False
     ) -> Optional[Skus]:
-        """Get SKU with all its relationships loaded."""
+        """
+        Get SKU with all its relationships loaded.
+
+        populate_existing overwrites objects already in the session with the
+        loaded rows, for callers that changed rows with bulk statements.
+        """
         query = select(self.model).options(
             selectinload(self.model.product).selectinload(Products.category),
             selectinload(self.model.price_details).selectinload(
@@ -81,14 +143,50 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
                 SkuAttributeValue.attribute
             )
         ).where(self.model.id == sku_id)
+        if populate_existing:
+            query = query.execution_options(populate_existing=True)
         result = await db.execute(query)
         sku = result.scalar_one_or_none()
+        return sku
+
+    async def stream_for_export(
+        self, db: AsyncSession, *, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Sequence[Skus]]:
+        """
+        Stream all SKUs with their relationships, batch by batch.
 
-        if sku:
-            await category_repository.load_parent_category_type_recursively(
-                db, sku.product.category
+        The rows are read through a server-side cursor EXPORT_BATCH_SIZE at a
+        time, so the whole table is never held in memory. Products and
+        categories are joined into the SKU query; price details and attribute
+        values are loaded with one query per batch.
+
+        Args:
+            db: Database session
+            updated_since: Only SKUs updated at or after this time
+
+        Yields:
+            Batches of SKUs, ordered by id
+        """
+        query = (
+            select(self.model)
+            .options(
+                joinedload(self.model.product).joinedload(Products.category),
+                selectinload(self.model.price_details).selectinload(
+                    PriceDetails.pricelist
+                ),
+                selectinload(self.model.sku_attribute_values).selectinload(
+                    SkuAttributeValue.attribute
+                )
             )
-        return sku
+            .order_by(self.model.id)
+            .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        if updated_since is not None:
+            query = query.where(self.model.updated_at >= updated_since)
+
+        result = await db.stream_scalars(query)
+        async for batch in result.partitions():
+            yield batch
 
     async def get_existing_attributes(
         self, db: AsyncSession, attribute_ids: List[int]
@@ -120,43 +218,137 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
         pricelists = result.scalars().all()
         return pricelists
 
+    async def insert_skus_bulk(
+        self, db: AsyncSession, objs_in: List[SkuCreate], created_by: int
+    ) -> List[Row]:
+        """
+        Insert many SKUs with their price details and attribute values
+        without committing.
+
+        The SKUs are inserted with insert_bulk, which suffixes taken slugs,
+        and _after_bulk_insert adds their price details and attribute values
+        and sets their search vectors. Each table gets one multi-row INSERT
+        for the whole batch; business rules (unique names, existing products)
+        are expected to be checked already.
+
+        Args:
+            db: Database session
+            objs_in: Validated SKUs to create
+            created_by: ID of the creating user
+
+        Returns:
+            Rows of (id, slug, sku_number) of the created SKUs, in input order
+        """
+        return await self.insert_bulk(
+            db,
+            objs_in,
+            created_by,
+            returning=[self.model.slug, self.model.sku_number]
+        )
+
+    async def create_skus_bulk(
+        self, db: AsyncSession, objs_in: List[SkuCreate], created_by: int
+    ) -> List[Row]:
+        """
+        Create many SKUs with their price details and attribute values in a
+        single transaction (see insert_skus_bulk).
+        """
+        try:
+            created = await self.insert_skus_bulk(db, objs_in, created_by)
+            await db.commit()
+            return created
+
+        except HTTPException:
+            await db.rollback()
+            raise
+        except (ValueError, TypeError) as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create SKUs: {str(e)}"
+            )
+
     async def create_sku(
-        self, db: AsyncSession, obj_in: SkuCreate, created_by: int
+        self,
+        db: AsyncSession,
+        obj_in: SkuCreate,
+        created_by: int,
+        *,
+        attributes: Sequence[Attributes] = (),
+        pricelists: Sequence[Pricelists] = ()
     ) -> Skus:
-        """Create SKU with price details and attribute values."""
+        """
+        Create SKU with price details and attribute values.
+
+        The SKU and its children are flushed together and committed once. The
+        response graph is built from the objects in memory: the product and
+        its category come from the foreign key check and the attributes and
+        pricelists from the caller's validation, so nothing is selected again.
+
+        Args:
+            db: Database session
+            obj_in: SKU to create
+            created_by: ID of the creating user
+            attributes: Attributes of the attribute values if already
+                loaded, otherwise they are fetched with one query
+            pricelists: Pricelists of the price details if already loaded,
+                otherwise they are fetched with one query
+
+        Returns:
+            The created SKU with its relationships loaded
+        """
         try:
-            # Create the main SKU object
             sku_data = obj_in.model_dump(
                 exclude={'price_details', 'attribute_values'}
             )
             sku_data['created_by'] = created_by
             sku_data['updated_by'] = created_by
-            await self.validate_foreign_key(
-                db, Products, sku_data['product_id']
+            product = await self._get_product_with_category(
+                db, sku_data['product_id']
             )
-            db_sku = Skus(**sku_data)
-            db.add(db_sku)
-            await db.commit()
-            await db.refresh(db_sku)
-
-            # Create price details
+            if obj_in.attribute_values and not attributes:
+                attributes = await self.get_existing_attributes(db, [
+                    av.attribute_id for av in obj_in.attribute_values
+                ])
+            if obj_in.price_details and not pricelists:
+                pricelists = await self.get_existing_pricelists(db, [
+                    pd.pricelist_id for pd in obj_in.price_details
+                ])
+            attributes_by_id = {attribute.id: attribute for attribute in attributes}
+            pricelists_by_id = {pricelist.id: pricelist for pricelist in pricelists}
+
+            price_details = []
             for price_detail_data in obj_in.price_details:
-                price_detail = PriceDetails(
-                    sku_id=db_sku.id,
-                    **price_detail_data.model_dump()
-                )
-                db.add(price_detail)
-
-            # Create attribute values
+                price_detail = PriceDetails(**price_detail_data.model_dump())
+                pricelist = pricelists_by_id.get(price_detail.pricelist_id)
+                if pricelist is not None:
+                    price_detail.pricelist = pricelist
+                price_details.append(price_detail)
+            attr_values = []
             for attr_value_data in obj_in.attribute_values:
-                attr_value = SkuAttributeValue(
-                    sku_id=db_sku.id,
-                    **attr_value_data.model_dump()
-                )
-                db.add(attr_value)
+                attr_value = SkuAttributeValue(**attr_value_data.model_dump())
+                attribute = attributes_by_id.get(attr_value.attribute_id)
+                if attribute is not None:
+                    attr_value.attribute = attribute
+                attr_values.append(attr_value)
 
+            db_sku = Skus(**sku_data)
+            db_sku.product = product
+            # Assigned even when empty, so the collections are loaded and the
+            # response does not lazy load them
+            db_sku.price_details = price_details
+            db_sku.sku_attribute_values = attr_values
+            db.add(db_sku)
+            # Server defaults and child ids come back through INSERT ... RETURNING
+            await db.flush()
             await db.commit()
-            return await self.get_with_relationships(db, db_sku.id)
+            return db_sku
 
         except HTTPException:
             # Re-raise HTTPException as-is (business logic errors)
@@ -176,10 +368,38 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
                 detail=f"Failed to create price details or attribute values: {str(e)}"
             )
 
+    async def _get_product_with_category(
+        self, db: AsyncSession, product_id: int
+    ) -> Products:
+        """
+        Get a product with its category, which carries the materialized
+        ancestor path, raising 404 if it does not exist.
+        """
+        result = await db.execute(
+            select(Products)
+            .options(joinedload(Products.category))
+            .where(Products.id == product_id)
+        )
+        product = result.scalar_one_or_none()
+        if product is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Products with id {product_id} not found"
+            )
+        return product
+
     async def update_sku(
         self, db: AsyncSession, db_obj: Skus, obj_in: SkuUpdate, updated_by: int
     ) -> Skus:
-        """Update SKU with price details and attribute values."""
+        """
+        Update SKU with price details and attribute values.
+
+        The price details to update or delete and the attribute values to
+        update are each fetched with one IN (...) query, checked in memory
+        and written with one set-based statement per collection, so the
+        number of round trips does not grow with the number of entries.
+        Everything is committed once.
+        """
         obj_data = db_obj.__dict__
         # Update basic SKU fields
         update_data = obj_in.model_dump(
@@ -203,35 +423,59 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
                     if field in update_data:
                         setattr(db_obj, field, update_data[field])
                 db.add(db_obj)
-                await db.commit()
-                await db.refresh(db_obj)
+
             # Handle price details updates
-            if obj_in.price_details_to_delete:
-                # Validate that SKU will still have active price details after deletion
-                await self._validate_price_details_deletion(
-                    db, db_obj.id, obj_in.price_details_to_delete
+            if obj_in.price_details_to_delete or obj_in.price_details_to_update:
+                price_details_to_update = {
+                    price_detail_update.id: price_detail_update.model_dump(
+                        exclude_unset=True, exclude={'id'}
+                    )
+                    for price_detail_update in obj_in.price_details_to_update or []
+                }
+                sku_ids_by_price_detail = await self._get_price_detail_owners(
+                    db,
+                    db_obj.id,
+                    [
+                        *(obj_in.price_details_to_delete or []),
+                        *price_details_to_update
+                    ]
                 )
 
-                # Delete price details
-                for price_detail_id in obj_in.price_details_to_delete:
-                    price_detail = await db.get(PriceDetails, price_detail_id)
-                    if price_detail and price_detail.sku_id == db_obj.id:
-                        await db.delete(price_detail)
-                    elif not price_detail:
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=(
-                                f"Price detail with ID {price_detail_id} not found"
-                            )
-                        )
-                    elif price_detail.sku_id != db_obj.id:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=(
-                                f"Price detail with ID {price_detail_id} does not "
-                                f"belong to SKU {db_obj.id}"
-                            )
-                        )
+                if obj_in.price_details_to_delete:
+                    # Validate that SKU will still have active price details
+                    # after deletion
+                    self._validate_price_details_deletion(
+                        db_obj.id,
+                        [
+                            price_detail_id
+                            for price_detail_id, sku_id
+                            in sku_ids_by_price_detail.items()
+                            if sku_id == db_obj.id
+                        ],
+                        obj_in.price_details_to_delete
+                    )
+                    self._check_price_details_owner(
+                        db_obj.id,
+                        obj_in.price_details_to_delete,
+                        sku_ids_by_price_detail
+                    )
+                    await db.execute(
+                        delete(PriceDetails)
+                        .where(PriceDetails.id.in_(obj_in.price_details_to_delete))
+                    )
+
+                if price_details_to_update:
+                    self._check_price_details_owner(
+                        db_obj.id, price_details_to_update, sku_ids_by_price_detail
+                    )
+                    price_detail_rows = validate_rows(PriceDetails, [
+                        {'id': price_detail_id, **update_price_data}
+                        for price_detail_id, update_price_data
+                        in price_details_to_update.items()
+                        if update_price_data
+                    ])
+                    if price_detail_rows:
+                        await db.execute(update(PriceDetails), price_detail_rows)
 
             if obj_in.price_details_to_create:
                 for price_detail_data in obj_in.price_details_to_create:
@@ -241,59 +485,62 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
                     )
                     db.add(price_detail_to_create)
 
-            if obj_in.price_details_to_update:
-                for price_detail_update in obj_in.price_details_to_update:
-                    price_detail = await db.get(
-                        PriceDetails, price_detail_update.id
-                    )
-                    if price_detail and price_detail.sku_id == db_obj.id:
-                        update_price_data = price_detail_update.model_dump(
-                            exclude_unset=True, exclude={'id'}
-                        )
-                        for field, value in update_price_data.items():
-                            setattr(price_detail, field, value)
-                        db.add(price_detail)
-                    elif not price_detail:
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=(
-                                f"Price detail with ID {price_detail_update.id} "
-                                "not found"
-                            )
-                        )
-                    elif price_detail.sku_id != db_obj.id:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=(
-                                f"Price detail with ID {price_detail_update.id} "
-                                f"does not belong to SKU {db_obj.id}"
-                            )
-                        )
             # Handle attribute values updates
             if obj_in.attribute_values:
-                for attr_value_data in obj_in.attribute_values:
-                    query = (
-                        select(SkuAttributeValue)
-                        .where(
-                            and_(
-                                SkuAttributeValue.sku_id == db_obj.id,
-                                SkuAttributeValue.attribute_id == (
-                                    attr_value_data.attribute_id
-                                )
-                            )
+                result = await db.execute(
+                    select(SkuAttributeValue.attribute_id, SkuAttributeValue.id)
+                    .where(and_(
+                        SkuAttributeValue.sku_id == db_obj.id,
+                        SkuAttributeValue.attribute_id.in_([
+                            attr_value_data.attribute_id
+                            for attr_value_data in obj_in.attribute_values
+                        ])
+                    ))
+                )
+                attr_value_ids = dict(result.all())
+                missing_attribute_ids = {
+                    attr_value_data.attribute_id
+                    for attr_value_data in obj_in.attribute_values
+                } - attr_value_ids.keys()
+                if missing_attribute_ids:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=(
+                            f"Attribute values with sku id {db_obj.id} and "
+                            f"attribute ids {missing_attribute_ids} not found"
                         )
                     )
-                    result = await db.execute(query)
-                    existing_attr_value = result.scalar_one()
-                    existing_attr_value.value = attr_value_data.value
-                    db.add(existing_attr_value)
+
+                attr_value_rows = validate_rows(SkuAttributeValue, [
+                    {
+                        'id': attr_value_ids[attr_value_data.attribute_id],
+                        'value': attr_value_data.value
+                    }
+                    for attr_value_data in obj_in.attribute_values
+                ])
+                await db.execute(update(SkuAttributeValue), attr_value_rows)
+                # Bulk updates skip the listener marking the search vector stale
+                await db.execute(
+                    update(self.model)
+                    .where(self.model.id == db_obj.id)
+                    .values(search_vector=literal_column(SKU_SEARCH_VECTOR))
+                    .execution_options(synchronize_session=False)
+                )
             await db.commit()
-            return await self.get_with_relationships(db, db_obj.id)
+            return await self.get_with_relationships(
+                db, db_obj.id, populate_existing=True
+            )
 
         except HTTPException:
             # Re-raise HTTPException as-is (business logic errors)
             await db.rollback()
             raise
+        except (ValueError, TypeError) as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
         except Exception as e:
             # Handle unexpected database/system errors
             await db.rollback()
@@ -302,36 +549,124 @@ class SkuRepository(CRUDBase[Skus, SkuCreate, SkuUpdate]):
                 detail=f"Failed to update SKU: {str(e)}"
             )
 
-    async def _validate_price_details_deletion(
+    async def _get_price_detail_owners(
+        self, db: AsyncSession, sku_id: int, price_detail_ids: List[int]
+    ) -> Dict[int, int]:
+        """
+        Get the SKU id of the given price details and of every price detail
+        of the SKU, with one query.
+
+        Args:
+            db: Database session
+            sku_id: SKU ID
+            price_detail_ids: Price detail IDs to look up
+
+        Returns:
+            SKU id by price detail id; missing price details are left out
+        """
+        result = await db.execute(
+            select(PriceDetails.id, PriceDetails.sku_id).where(or_(
+                PriceDetails.sku_id == sku_id,
+                PriceDetails.id.in_(price_detail_ids)
+            ))
+        )
+        return dict(result.all())
+
+    @staticmethod
+    def _check_price_details_owner(
+        sku_id: int,
+        price_detail_ids: Iterable[int],
+        sku_ids_by_price_detail: Dict[int, int]
+    ) -> None:
+        """
+        Check the price details exist and belong to the SKU.
+
+        Raises:
+            HTTPException: 404 for a missing price detail, 400 for a price
+                detail of another SKU
+        """
+        for price_detail_id in price_detail_ids:
+            owner_id = sku_ids_by_price_detail.get(price_detail_id)
+            if owner_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Price detail with ID {price_detail_id} not found"
+                )
+            if owner_id != sku_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=(
+                        f"Price detail with ID {price_detail_id} does not "
+                        f"belong to SKU {sku_id}"
+                    )
+                )
+
+    async def _after_bulk_insert(
         self,
         db: AsyncSession,
+        objs_in: List[Union[SkuCreate, Dict[str, Any]]],
+        rows: List[Dict[str, Any]],
+        created: List[Row]
+    ) -> None:
+        """
+        Insert the price details and attribute values of new SKUs, then set
+        their search vectors, which include the attribute values.
+        """
+        price_detail_rows = []
+        attribute_value_rows = []
+        for obj_in, row, created_row in zip(objs_in, rows, created):
+            if isinstance(obj_in, BaseModel):
+                obj_in = obj_in.model_dump()
+            audit = {
+                'created_by': row['created_by'],
+                'updated_by': row['updated_by']
+            }
+            price_detail_rows.extend(
+                {'sku_id': created_row.id, **price_detail, **audit}
+                for price_detail in obj_in.get('price_details') or []
+            )
+            attribute_value_rows.extend(
+                {'sku_id': created_row.id, **attr_value, **audit}
+                for attr_value in obj_in.get('attribute_values') or []
+            )
+        if price_detail_rows:
+            prepare_rows_for_insert(PriceDetails, price_detail_rows)
+            await db.execute(insert(PriceDetails), price_detail_rows)
+        if attribute_value_rows:
+            prepare_rows_for_insert(SkuAttributeValue, attribute_value_rows)
+            await db.execute(insert(SkuAttributeValue), attribute_value_rows)
+
+        await db.execute(
+            update(self.model)
+            .where(self.model.id.in_([row.id for row in created]))
+            .values(search_vector=literal_column(SKU_SEARCH_VECTOR))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _validate_price_details_deletion(
         sku_id: int,
+        current_price_detail_ids: List[int],
         price_details_to_delete: List[int]
     ) -> None:
         """
         Validate that SKU will still have active price details after deletion.
 
         Args:
-            db: Database session
             sku_id: SKU ID
+            current_price_detail_ids: IDs of the price details of the SKU
             price_details_to_delete: List of price detail IDs to be deleted
 
         Raises:
             HTTPException: If deletion would leave SKU without price details
         """
-        # Get all active price details for this SKU
-        query = select(PriceDetails).where(PriceDetails.sku_id == sku_id)
-        result = await db.execute(query)
-        current_price_details = result.scalars().all()
-
-        if not current_price_details:
+        if not current_price_detail_ids:
             return
 
         # Calculate remaining price details after deletion
-        remaining_count = len([
-            pd for pd in current_price_details
-            if pd.id not in price_details_to_delete
-        ])
+        remaining_count = len(
+            set(current_price_detail_ids) - set(price_details_to_delete)
+        )
 
         if remaining_count == 0:
             raise HTTPException(
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
@@ -6,7 +6,7 @@ from sqlalchemy.orm import selectinload
 from app.models import Suppliers, Products
 from app.schemas.supplier_schema import SupplierCreate, SupplierUpdate
 from app.repositories.base import CRUDBase
-from app.repositories import category_repository
+from app.schemas.base import CountMode
 
 
 class SupplierRepository(
@@ -25,16 +25,20 @@ class SupplierRepository(
         company_type: Optional[str] = None,
         email: Optional[str] = None,
         contact: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Suppliers]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Suppliers], int]:
         """Get suppliers with filtering support."""
         query = select(self.model)
 
         # Build filter conditions
         conditions = []
+        rank = None
 
         if name is not None:
             conditions.append(self.model.name.ilike(f"%{name}%"))
+            rank = await self.search_rank(db, self.model.name, name)
 
         if slug is not None:
             conditions.append(self.model.slug == slug)
@@ -55,15 +59,25 @@ class SupplierRepository(
         if conditions:
             query = query.where(and_(*conditions))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor,
+            rank=rank
+        )
 
     async def get_products_by_supplier(
-        self, db: AsyncSession, supplier_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Products]:
+        self,
+        db: AsyncSession,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Products], int]:
         """Get products by supplier."""
         query = (
             select(Products)
@@ -72,16 +86,15 @@ class SupplierRepository(
                 selectinload(Products.images)
             )
             .where(Products.supplier_id == supplier_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        products = result.scalars().all()
-        if len(products) > 0:
-            await category_repository.load_parent_category_type_recursively(
-                db, products[0].category
-            )
-        return products
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
 
 # Create instance to be used as dependency
@@ -1,10 +1,13 @@
-from typing import Optional, List
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import HashedPassword, hash_password_async
 from app.models import Users
 from app.schemas.user_schema import UserCreate, UserUpdate
 from app.repositories.base import CRUDBase
+from app.schemas.base import CountMode
 
 
 class UserRepository(CRUDBase[Users, UserCreate, UserUpdate]):
@@ -20,8 +23,10 @@ class UserRepository(CRUDBase[Users, UserCreate, UserUpdate]):
         email: Optional[str] = None,
         name: Optional[str] = None,
         role: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[Users]:
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Users], int]:
         """Get users with filtering and pagination."""
         query = select(self.model)
 
@@ -45,10 +50,14 @@ class UserRepository(CRUDBase[Users, UserCreate, UserUpdate]):
         if conditions:
             query = query.where(and_(*conditions))
 
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db,
+            query,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
+        )
 
     async def get_next_sequence(self, db: AsyncSession) -> int:
         """Get next sequence number for user."""
@@ -74,5 +83,19 @@ class UserRepository(CRUDBase[Users, UserCreate, UserUpdate]):
         await db.refresh(db_obj)
         return db_obj
 
+    async def _before_bulk_insert(
+        self, db: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> None:
+        """Hash the passwords of new users in the password pool."""
+        plain_rows = [
+            row for row in rows
+            if row.get('password') and not isinstance(row['password'], HashedPassword)
+        ]
+        hashed_passwords = await asyncio.gather(*(
+            hash_password_async(row['password']) for row in plain_rows
+        ))
+        for row, hashed_password in zip(plain_rows, hashed_passwords):
+            row['password'] = hashed_password
+
 
 user_repository = UserRepository(Users)
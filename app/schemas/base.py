@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Annotated, Optional, Generic, TypeVar, List, Dict, Any
 
 from pydantic import BaseModel, StrictBool, StrictInt, Field, AfterValidator
@@ -51,6 +52,18 @@ class BaseInDB(BaseSchema):
     model_config = {"from_attributes": True}
 
 
+class CountMode(str, Enum):
+    """How the total number of items of a list response is counted."""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+class ExportFormat(str, Enum):
+    """File format of a streamed export."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 # API Response Wrappers
 class MetaSchema(BaseModel):
     """Schema for pagination metadata."""
@@ -58,6 +71,12 @@ class MetaSchema(BaseModel):
     limit: int = Field(..., description="Number of items per page")
     total: int = Field(..., description="Total number of items")
     pages: int = Field(..., description="Total number of pages")
+    cursor: Optional[str] = Field(
+        None, description="Cursor the current page starts after"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, null on the last page"
+    )
 
 
 class ErrorDetailSchema(BaseModel):
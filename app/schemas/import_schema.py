@@ -0,0 +1,46 @@
+from typing import Optional, List
+
+from pydantic import Field
+
+from app.schemas.base import BaseSchema, StrictPositiveInt
+from app.schemas.product_schema import ProductCreate
+from app.schemas.sku_schema import SkuCreate
+
+
+class SkuImportItem(SkuCreate):
+    """Schema for a SKU nested in an imported product.
+
+    Used in: POST /products/import lines
+    Note: product_id is set from the product created by the same line
+    """
+    product_id: Optional[StrictPositiveInt] = None
+
+
+class ProductImportLine(ProductCreate):
+    """Schema for one line of a catalogue import.
+
+    Used in: POST /products/import (one JSON object per line)
+    Contains: A product to create together with its SKUs
+    """
+    skus: List[SkuImportItem] = Field(default_factory=list)
+
+
+class ImportLineError(BaseSchema):
+    """Schema for the error of one rejected import line."""
+    line: int
+    error: str
+
+
+class ImportResult(BaseSchema):
+    """Schema for the report of a catalogue import.
+
+    Used in: POST /products/import responses
+    Contains: Counts and the errors of the rejected lines, in line order
+    """
+    lines: int
+    products_created: int
+    skus_created: int
+    failed: int
+    chunks: int
+    errors: List[ImportLineError]
+    errors_truncated: bool
@@ -0,0 +1,37 @@
+from enum import Enum
+from typing import Optional, List, Union, Annotated
+
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+from app.schemas.category_schema import CategoryPathItem
+from app.schemas.product_schema import ProductPathItem
+from app.schemas.sku_schema import SkuPathItem
+
+
+class SearchType(str, Enum):
+    """Types of entities covered by the full-text search."""
+    CATEGORY = "category"
+    PRODUCT = "product"
+    SKU = "sku"
+
+
+class SearchHit(BaseSchema):
+    """Schema for a full-text search hit.
+
+    Used in: GET /search responses
+    Contains: The matched entity summary, its relevance and full path
+    """
+    type: SearchType
+    id: int
+    name: str
+    slug: str
+    description: Optional[str] = None
+    sku_number: Optional[str] = None
+    rank: float
+    full_path: List[
+        Annotated[
+            Union[CategoryPathItem, ProductPathItem, SkuPathItem],
+            Field(discriminator='type')
+        ]
+    ]
@@ -46,6 +46,37 @@ class SkuCreate(SkuBase, BaseCreateSchema):
     attribute_values: List[AttributeValueInput]
 
 
+class SkuBulkCreate(BaseSchema):
+    """Schema for creating many SKUs at once.
+
+    Used in: POST /skus/bulk
+    Contains: The SKUs to create, validated and inserted as one batch
+    """
+    items: List[SkuCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class SkuBulkItemResult(BaseSchema):
+    """Schema for the result of one SKU of a bulk create."""
+    index: int
+    name: str
+    success: bool
+    id: Optional[int] = None
+    slug: Optional[str] = None
+    sku_number: Optional[str] = None
+    error: Optional[str] = None
+
+
+class SkuBulkResult(BaseSchema):
+    """Schema for the result of a bulk create.
+
+    Used in: POST /skus/bulk responses
+    Contains: Counts and the per-item results, in request order
+    """
+    created: int
+    failed: int
+    items: List[SkuBulkItemResult]
+
+
 class PriceDetailUpdate(BaseSchema):
     """Schema for updating a price detail."""
     id: StrictPositiveInt
@@ -7,6 +7,8 @@ from app.services.supplier_service import supplier_service
 from app.services.product_service import product_service
 from app.services.sku_service import sku_service
 from app.services.user_service import user_service
+from app.services.search_service import search_service
+from app.services.import_service import import_service
 
 # Export all services
 __all__ = [
@@ -18,4 +20,6 @@ __all__ = [
     "product_service",
     "sku_service",
     "user_service",
+    "search_service",
+    "import_service",
 ]
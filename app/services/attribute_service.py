@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import attribute_repository
-from app.models import Attributes, SkuAttributeValue, Users
+from app.models import Attributes, SkuAttributeValue
 from app.schemas.attribute_schema import (
     AttributeCreate,
     AttributeUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
 
 
 class AttributeService:
@@ -19,11 +20,17 @@ class AttributeService:
         self.repository = attribute_repository
 
     async def get_all_attributes(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Attributes], int]:
         """Get all attributes with pagination and total count."""
-        data = await self.repository.get_multi(db, skip=skip, limit=limit)
-        total = len(data)
+        data, total = await self.repository.get_multi(
+            db, skip=skip, limit=limit, count_mode=count_mode, cursor=cursor
+        )
         return data, total
 
     async def get_attributes_with_filter(
@@ -35,22 +42,31 @@ class AttributeService:
         name: Optional[str] = None,
         code: Optional[str] = None,
         data_type: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Attributes], int]:
         """Get attributes with filtering support and total count."""
         if name is None and code is None and data_type is None and is_active is None:
-            return await self.get_all_attributes(db, skip=skip, limit=limit)
+            return await self.get_all_attributes(
+                db,
+                skip=skip,
+                limit=limit,
+                count_mode=count_mode,
+                cursor=cursor
+            )
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
             name=name,
             code=code,
             data_type=data_type,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_attribute_by_id(
@@ -86,7 +102,7 @@ class AttributeService:
         attribute_id: int,
         attribute_update: AttributeUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Attributes:
         """Update an existing attribute."""
         # Get existing attribute
@@ -122,7 +138,7 @@ class AttributeService:
         )
 
     async def delete_attribute(
-        self, db: AsyncSession, attribute_id: int, current_user: Users
+        self, db: AsyncSession, attribute_id: int, current_user: Principal
     ) -> Attributes:
         """Delete an attribute."""
         db_attribute = await self.repository.get(db, id=attribute_id)
@@ -3,13 +3,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import category_repository
-from app.models import Categories, Products, Users
+from app.models import Categories, Products
 from app.schemas.category_schema import (
     CategoryCreate,
     CategoryUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
+from app.utils.etag import ConditionalRequest
 
 
 class CategoryService:
@@ -28,11 +30,14 @@ class CategoryService:
         slug: Optional[str] = None,
         category_type_id: Optional[int] = None,
         parent_id: Optional[int] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Tuple[List[Categories], int]:
         """Get categories with filtering support and total count."""
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
@@ -40,15 +45,21 @@ class CategoryService:
             slug=slug,
             category_type_id=category_type_id,
             parent_id=parent_id,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor,
+            conditional=conditional
         )
-        total = len(data)
         return data, total
 
     async def get_category_by_id(
-        self, db: AsyncSession, category_id: int
+        self,
+        db: AsyncSession,
+        category_id: int,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Categories | None:
         """Get category by ID with all relations."""
+        await self.repository.check_not_modified(db, category_id, conditional)
         return await self.repository.get_with_full_relations(
             db, category_id=category_id
         )
@@ -58,7 +69,9 @@ class CategoryService:
         db: AsyncSession,
         parent_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Categories], int]:
         """Get children of a specific category with total count."""
         # Verify parent exists
@@ -69,14 +82,21 @@ class CategoryService:
                 detail=f"Parent category with id {parent_id} not found"
             )
 
-        data = await self.repository.get_children_by_parent(
-            db, parent_id=parent_id, skip=skip, limit=limit
+        data, total = await self.repository.get_children_by_parent(
+            db, parent_id=parent_id, skip=skip, limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_products_by_category(
-        self, db: AsyncSession, category_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        category_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Products], int]:
         """Get products by category with total count."""
         # Verify category exists
@@ -87,10 +107,11 @@ class CategoryService:
                 detail=f"Category with id {category_id} not found"
             )
 
-        data = await self.repository.get_products_by_category(
-            db, category_id=category_id, skip=skip, limit=limit
+        data, total = await self.repository.get_products_by_category(
+            db, category_id=category_id, skip=skip, limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def create_category(
@@ -115,7 +136,7 @@ class CategoryService:
         category_id: int,
         category_update: CategoryUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Categories:
         """Update an existing category with business validation."""
         # Get existing category
@@ -154,7 +175,7 @@ class CategoryService:
         )
 
     async def delete_category(
-        self, db: AsyncSession, category_id: int, current_user: Users
+        self, db: AsyncSession, category_id: int, current_user: Principal
     ) -> Categories:
         """Delete a category after validation."""
         db_category = await self.repository.get(db, id=category_id)
@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import category_type_repository
-from app.models import CategoryTypes, Categories, Users
+from app.models import CategoryTypes, Categories
 from app.schemas.category_type_schema import (
     CategoryTypeCreate,
     CategoryTypeUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
 
 
 class CategoryTypeService:
@@ -19,11 +20,17 @@ class CategoryTypeService:
         self.repository = category_type_repository
 
     async def get_all_category_types(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[CategoryTypes], int]:
         """Get all category types with pagination and total count."""
-        data = await self.repository.get_multi(db, skip=skip, limit=limit)
-        total = len(data)
+        data, total = await self.repository.get_multi(
+            db, skip=skip, limit=limit, count_mode=count_mode, cursor=cursor
+        )
         return data, total
 
     async def get_category_types_with_filter(
@@ -34,21 +41,30 @@ class CategoryTypeService:
         limit: int = 100,
         name: Optional[str] = None,
         slug: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[CategoryTypes], int]:
         """Get category types with filtering support and total count."""
         if name is None and slug is None and is_active is None:
-            return await self.get_all_category_types(db, skip=skip, limit=limit)
+            return await self.get_all_category_types(
+                db,
+                skip=skip,
+                limit=limit,
+                count_mode=count_mode,
+                cursor=cursor
+            )
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
             name=name,
             slug=slug,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_category_type_by_id(
@@ -85,7 +101,7 @@ class CategoryTypeService:
         category_type_id: int,
         category_type_update: CategoryTypeUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> CategoryTypes:
         """Update an existing category type."""
         # Get existing category type
@@ -122,7 +138,7 @@ class CategoryTypeService:
         )
 
     async def delete_category_type(
-        self, db: AsyncSession, category_type_id: int, current_user: Users
+        self, db: AsyncSession, category_type_id: int, current_user: Principal
     ) -> CategoryTypes:
         """Delete a category type."""
         db_category_type = await self.repository.get(db, id=category_type_id)
@@ -155,7 +171,9 @@ class CategoryTypeService:
         db: AsyncSession,
         category_type_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List, int]:
         """Get all categories under a specific category type with total count."""
         # Verify category type exists
@@ -166,10 +184,11 @@ class CategoryTypeService:
                 detail=f"Category type with id {category_type_id} not found"
             )
 
-        data = await self.repository.get_categories_by_type(
-            db, category_type_id=category_type_id, skip=skip, limit=limit
+        data, total = await self.repository.get_categories_by_type(
+            db, category_type_id=category_type_id, skip=skip, limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
 
@@ -0,0 +1,161 @@
+from typing import Any, AsyncIterable, Dict, List, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.repositories import product_repository
+from app.schemas.import_schema import ProductImportLine
+from app.services.product_service import product_service
+from app.services.sku_service import sku_service
+from app.utils.ndjson import iter_ndjson_lines
+
+
+class ImportService:
+    """Service layer for streaming catalogue imports."""
+
+    def __init__(self):
+        self.repository = product_repository
+
+    async def import_products(
+        self,
+        db: AsyncSession,
+        chunks: AsyncIterable[bytes],
+        created_by: int
+    ) -> Dict[str, Any]:
+        """
+        Import products with their SKUs from an NDJSON body.
+
+        The body is read line by line and handled in chunks of
+        IMPORT_CHUNK_SIZE lines: each chunk is validated with the batch
+        validation of products and SKUs, then inserted and committed on its
+        own, so memory does not grow with the size of the import. A line that
+        fails validation is rejected with all its SKUs and reported, the other
+        lines of its chunk are still imported.
+
+        Args:
+            db: Database session
+            chunks: Byte chunks of the NDJSON body
+            created_by: ID of the user importing the products
+
+        Returns:
+            Import report with counts and the errors of rejected lines
+        """
+        report = {
+            'lines': 0,
+            'products_created': 0,
+            'skus_created': 0,
+            'failed': 0,
+            'chunks': 0,
+            'errors': [],
+            'errors_truncated': False
+        }
+        # Parsed lines of the current chunk, or their parsing error
+        batch: List[Tuple[int, Union[ProductImportLine, str]]] = []
+
+        async for line_number, line in iter_ndjson_lines(
+            chunks, settings.IMPORT_MAX_LINE_BYTES
+        ):
+            report['lines'] += 1
+            if line is None:
+                batch.append((
+                    line_number,
+                    f"Line is longer than {settings.IMPORT_MAX_LINE_BYTES} bytes"
+                ))
+            else:
+                try:
+                    batch.append(
+                        (line_number, ProductImportLine.model_validate_json(line))
+                    )
+                except ValidationError as e:
+                    batch.append((line_number, self._format_errors(e)))
+
+            if len(batch) >= settings.IMPORT_CHUNK_SIZE:
+                await self._import_chunk(db, batch, created_by, report)
+                batch = []
+
+        if batch:
+            await self._import_chunk(db, batch, created_by, report)
+        return report
+
+    async def _import_chunk(
+        self,
+        db: AsyncSession,
+        batch: List[Tuple[int, Union[ProductImportLine, str]]],
+        created_by: int,
+        report: Dict[str, Any]
+    ) -> None:
+        """Validate and insert one chunk of lines, reporting errors in order."""
+        report['chunks'] += 1
+        errors = {
+            position: entry
+            for position, (_, entry) in enumerate(batch)
+            if isinstance(entry, str)
+        }
+        positions = [
+            position for position in range(len(batch)) if position not in errors
+        ]
+        items = [batch[position][1] for position in positions]
+        if items:
+            product_errors = await product_service.get_bulk_errors(db, items)
+            for index, error in product_errors.items():
+                errors[positions[index]] = error
+
+        # SKUs are only checked for lines whose product is valid
+        skus = []
+        sku_lines = []
+        for position in positions:
+            if position not in errors:
+                for sku_index, sku in enumerate(batch[position][1].skus):
+                    skus.append(sku)
+                    sku_lines.append((position, sku_index))
+        if skus:
+            sku_errors = await sku_service.get_bulk_errors(
+                db, skus, check_products=False
+            )
+            for sku_position, error in sku_errors.items():
+                position, sku_index = sku_lines[sku_position]
+                errors.setdefault(position, f"skus.{sku_index}: {error}")
+
+        valid = [
+            batch[position][1] for position in positions if position not in errors
+        ]
+        if valid:
+            try:
+                created, skus_created = await self.repository.create_products_bulk(
+                    db, valid, created_by
+                )
+            except HTTPException as e:
+                for position in positions:
+                    errors.setdefault(position, e.detail)
+            else:
+                report['products_created'] += len(created)
+                report['skus_created'] += skus_created
+
+        for position in sorted(errors):
+            self._add_error(report, batch[position][0], errors[position])
+
+    def _add_error(
+        self, report: Dict[str, Any], line_number: int, error: str
+    ) -> None:
+        """Count a rejected line and keep its error while under the limit."""
+        report['failed'] += 1
+        if len(report['errors']) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            report['errors'].append({'line': line_number, 'error': error})
+        else:
+            report['errors_truncated'] = True
+
+    def _format_errors(self, error: ValidationError) -> str:
+        """Format the errors of a line that failed schema validation."""
+        messages = []
+        for detail in error.errors(include_url=False):
+            location = '.'.join(str(part) for part in detail['loc'])
+            if location:
+                messages.append(f"{location}: {detail['msg']}")
+            else:
+                messages.append(detail['msg'])
+        return '; '.join(messages)
+
+
+# Create the service instance
+import_service = ImportService()
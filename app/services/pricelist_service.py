@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import pricelist_repository
-from app.models import Pricelists, PriceDetails, Users
+from app.models import Pricelists, PriceDetails
 from app.schemas.pricelist_schema import (
     PricelistCreate,
     PricelistUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
 
 
 class PricelistService:
@@ -19,11 +20,17 @@ class PricelistService:
         self.repository = pricelist_repository
 
     async def get_all_pricelists(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Pricelists], int]:
         """Get all pricelists with pagination and total count."""
-        data = await self.repository.get_multi(db, skip=skip, limit=limit)
-        total = len(data)
+        data, total = await self.repository.get_multi(
+            db, skip=skip, limit=limit, count_mode=count_mode, cursor=cursor
+        )
         return data, total
 
     async def get_pricelists_with_filter(
@@ -34,21 +41,30 @@ class PricelistService:
         limit: int = 100,
         name: Optional[str] = None,
         code: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Pricelists], int]:
         """Get pricelists with filtering support and total count."""
         if name is None and code is None and is_active is None:
-            return await self.get_all_pricelists(db, skip=skip, limit=limit)
+            return await self.get_all_pricelists(
+                db,
+                skip=skip,
+                limit=limit,
+                count_mode=count_mode,
+                cursor=cursor
+            )
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
             name=name,
             code=code,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_pricelist_by_id(
@@ -84,7 +100,7 @@ class PricelistService:
         pricelist_id: int,
         pricelist_update: PricelistUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Pricelists:
         """Update an existing pricelist."""
         # Get existing pricelist
@@ -120,7 +136,7 @@ class PricelistService:
         )
 
     async def delete_pricelist(
-        self, db: AsyncSession, pricelist_id: int, current_user: Users
+        self, db: AsyncSession, pricelist_id: int, current_user: Principal
     ) -> Pricelists:
         """Delete a pricelist."""
         db_pricelist = await self.repository.get(db, id=pricelist_id)
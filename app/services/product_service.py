@@ -1,15 +1,18 @@
-from typing import List, Optional, Tuple
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import product_repository
-from app.models import Products, Skus, Users
+from app.models import Categories, Products, Skus, Suppliers
 from app.schemas.product_schema import (
     ProductCreate,
     ProductUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
+from app.utils.etag import ConditionalRequest
 
 
 class ProductService:
@@ -28,10 +31,13 @@ class ProductService:
         slug: Optional[str] = None,
         category_id: Optional[int] = None,
         supplier_id: Optional[int] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Tuple[List[Products], int]:
         """Get products with filtering support and total count."""
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
@@ -39,19 +45,31 @@ class ProductService:
             slug=slug,
             category_id=category_id,
             supplier_id=supplier_id,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor,
+            conditional=conditional
         )
-        total = len(data)
         return data, total
 
     async def get_product_by_id(
-        self, db: AsyncSession, product_id: int
+        self,
+        db: AsyncSession,
+        product_id: int,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Products | None:
         """Get product by ID with all relationships."""
+        await self.repository.check_not_modified(db, product_id, conditional)
         return await self.repository.get_with_relationships(db, product_id=product_id)
 
     async def get_skus_by_product(
-        self, db: AsyncSession, product_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        product_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Skus], int]:
         """Get SKUs by product with total count."""
         # Verify product exists
@@ -62,10 +80,11 @@ class ProductService:
                 detail=f"Product with id {product_id} not found"
             )
 
-        data = await self.repository.get_skus_by_product(
-            db, product_id=product_id, skip=skip, limit=limit
+        data, total = await self.repository.get_skus_by_product(
+            db, product_id=product_id, skip=skip, limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def create_product(
@@ -86,13 +105,73 @@ class ProductService:
         )
         return data
 
+    async def get_bulk_errors(
+        self, db: AsyncSession, items: Sequence[ProductCreate]
+    ) -> Dict[int, str]:
+        """
+        Validate a batch of products with the same rules as create_product.
+
+        Names, categories, suppliers and image files of the whole batch are
+        each looked up with one query instead of once per product. Slugs
+        colliding with stored or earlier ones are not errors: the bulk
+        insert suffixes them.
+
+        Args:
+            db: Database session
+            items: Products to validate
+
+        Returns:
+            Error message of every invalid product, by index in items
+        """
+        taken_names = await self.repository.get_taken_names(
+            db, [item.name for item in items]
+        )
+        existing_category_ids = await self.repository.get_existing_ids(
+            db, Categories, {item.category_id for item in items}
+        )
+        existing_supplier_ids = await self.repository.get_existing_ids(
+            db, Suppliers, {item.supplier_id for item in items}
+        )
+        taken_files = await self.repository.get_taken_image_files(db, {
+            image.file.strip() for item in items for image in item.images
+        })
+
+        errors: Dict[int, str] = {}
+        seen_names = set()
+        seen_files = set()
+        for index, item in enumerate(items):
+            files = [image.file.strip() for image in item.images]
+            if item.name in taken_names:
+                errors[index] = f"Product with name '{item.name}' already exists"
+            elif item.name in seen_names:
+                errors[index] = (
+                    f"Product with name '{item.name}' is duplicated in the batch"
+                )
+            elif item.category_id not in existing_category_ids:
+                errors[index] = f"Categories with id {item.category_id} not found"
+            elif item.supplier_id not in existing_supplier_ids:
+                errors[index] = f"Suppliers with id {item.supplier_id} not found"
+            elif not all(re.match(r'^[A-Za-z]', file) for file in files):
+                errors[index] = "Column file must start with a letter"
+            elif (
+                taken_files.intersection(files)
+                or seen_files.intersection(files)
+                or len(set(files)) != len(files)
+            ):
+                errors[index] = "Image files must be unique"
+            else:
+                # Only accepted products are created and take their name
+                seen_files.update(files)
+                seen_names.add(item.name)
+        return errors
+
     async def update_product(
         self,
         db: AsyncSession,
         product_id: int,
         product_update: ProductUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Products:
         """Update an existing product with business validation and authorization."""
 
@@ -123,7 +202,7 @@ class ProductService:
         )
 
     async def delete_product(
-        self, db: AsyncSession, product_id: int, current_user: Users
+        self, db: AsyncSession, product_id: int, current_user: Principal
     ) -> None:
         """Delete a product."""
 
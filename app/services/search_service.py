@@ -0,0 +1,48 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import search_repository
+from app.schemas.search_schema import SearchType
+
+
+class SearchService:
+    """Service layer for full-text search business logic."""
+
+    def __init__(self):
+        self.repository = search_repository
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        *,
+        types: Optional[Sequence[SearchType]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Search categories, products and SKUs, most relevant first."""
+        hits, total = await self.repository.search(
+            db,
+            q,
+            types=list(dict.fromkeys(types or SearchType)),
+            skip=skip,
+            limit=limit
+        )
+        data = [
+            {
+                'type': search_type,
+                'id': entity.id,
+                'name': entity.name,
+                'slug': entity.slug,
+                'description': entity.description,
+                'sku_number': getattr(entity, 'sku_number', None),
+                'rank': rank,
+                'full_path': entity.full_path
+            }
+            for search_type, entity, rank in hits
+        ]
+        return data, total
+
+
+# Create instance to be used as dependency
+search_service = SearchService()
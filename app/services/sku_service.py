@@ -1,11 +1,19 @@
-from typing import List, Optional, Tuple
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.schemas.base import CountMode, ExportFormat
 from app.repositories import sku_repository
-from app.models import Skus, Attributes, Users
-from app.schemas.sku_schema import SkuCreate, SkuUpdate, AttributeValueInput
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.models import Skus, Attributes, Pricelists, Products
+from app.schemas.sku_schema import (
+    SkuCreate, SkuUpdate, SkuBulkCreate, AttributeValueInput
+)
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
+from app.utils.etag import ConditionalRequest
 
 
 class SkuService:
@@ -24,10 +32,13 @@ class SkuService:
         slug: Optional[str] = None,
         sku_number: Optional[str] = None,
         product_id: Optional[int] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Tuple[List[Skus], int]:
         """Get SKUs with filtering support and total count."""
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
@@ -35,15 +46,21 @@ class SkuService:
             slug=slug,
             sku_number=sku_number,
             product_id=product_id,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor,
+            conditional=conditional
         )
-        total = len(data)
         return data, total
 
     async def get_sku_by_id(
-        self, db: AsyncSession, sku_id: int
+        self,
+        db: AsyncSession,
+        sku_id: int,
+        conditional: Optional[ConditionalRequest] = None
     ) -> Skus | None:
         """Get SKU by ID with all relationships."""
+        await self.repository.check_not_modified(db, sku_id, conditional)
         return await self.repository.get_with_relationships(db, sku_id=sku_id)
 
     async def create_sku(
@@ -59,6 +76,7 @@ class SkuService:
             )
 
         # Validate attributes exist and get their data types
+        existing_attributes = []
         if sku_create.attribute_values:
             attribute_ids = [
                 av.attribute_id for av in sku_create.attribute_values
@@ -85,6 +103,7 @@ class SkuService:
             )
 
         # Validate pricelists exist
+        existing_pricelists = []
         if sku_create.price_details:
             pricelist_ids = [
                 pd.pricelist_id for pd in sku_create.price_details
@@ -102,16 +121,261 @@ class SkuService:
                 )
 
         return await self.repository.create_sku(
-            db, obj_in=sku_create, created_by=created_by
+            db,
+            obj_in=sku_create,
+            created_by=created_by,
+            attributes=existing_attributes,
+            pricelists=existing_pricelists
         )
 
+    async def create_skus_bulk(
+        self, db: AsyncSession, sku_bulk: SkuBulkCreate, created_by: int
+    ) -> Dict[str, Any]:
+        """
+        Create a batch of SKUs with the same business validation as create_sku.
+
+        Items failing validation (see get_bulk_errors) are reported and
+        skipped, the others are created together in one transaction.
+        """
+        items = sku_bulk.items
+        errors = await self.get_bulk_errors(db, items)
+
+        valid_indexes = [
+            index for index in range(len(items)) if index not in errors
+        ]
+        created = {}
+        if valid_indexes:
+            rows = await self.repository.create_skus_bulk(
+                db, [items[index] for index in valid_indexes], created_by
+            )
+            created = dict(zip(valid_indexes, rows))
+
+        results = []
+        for index, item in enumerate(items):
+            row = created.get(index)
+            results.append({
+                'index': index,
+                'name': item.name,
+                'success': row is not None,
+                'id': row.id if row else None,
+                'slug': row.slug if row else None,
+                'sku_number': row.sku_number if row else None,
+                'error': errors.get(index)
+            })
+        return {
+            'created': len(created),
+            'failed': len(errors),
+            'items': results
+        }
+
+    async def get_bulk_errors(
+        self,
+        db: AsyncSession,
+        items: Sequence[SkuCreate],
+        *,
+        check_products: bool = True
+    ) -> Dict[int, str]:
+        """
+        Validate a batch of SKUs with the same rules as create_sku.
+
+        Names, products, attributes and pricelists of the whole batch are each
+        looked up with one query instead of once per SKU. Slugs colliding
+        with stored or earlier ones are not errors: insert_skus_bulk suffixes
+        them.
+
+        Args:
+            db: Database session
+            items: SKUs to validate
+            check_products: Whether to check the products exist, False when
+                the products are created together with the SKUs
+
+        Returns:
+            Error message of every invalid SKU, by index in items
+        """
+        taken_names = await self.repository.get_taken_names(
+            db, [item.name for item in items]
+        )
+        existing_product_ids = set()
+        if check_products:
+            existing_product_ids = await self.repository.get_existing_ids(
+                db, Products, {item.product_id for item in items}
+            )
+        attr_lookup = {
+            attr.id: attr
+            for attr in await self.repository.get_existing_attributes(db, list({
+                av.attribute_id for item in items for av in item.attribute_values
+            }))
+        }
+        existing_pricelist_ids = await self.repository.get_existing_ids(
+            db, Pricelists, {
+                pd.pricelist_id for item in items for pd in item.price_details
+            }
+        )
+
+        errors: Dict[int, str] = {}
+        seen_names = set()
+        for index, item in enumerate(items):
+            attribute_ids = [av.attribute_id for av in item.attribute_values]
+            price_keys = [
+                (pd.pricelist_id, pd.minimum_quantity) for pd in item.price_details
+            ]
+            missing_attribute_ids = set(attribute_ids) - attr_lookup.keys()
+            missing_pricelist_ids = {
+                pd.pricelist_id for pd in item.price_details
+            } - existing_pricelist_ids
+
+            if item.name in taken_names:
+                errors[index] = f"SKU with name '{item.name}' already exists"
+            elif item.name in seen_names:
+                errors[index] = (
+                    f"SKU with name '{item.name}' is duplicated in the batch"
+                )
+            elif check_products and item.product_id not in existing_product_ids:
+                errors[index] = f"Products with id {item.product_id} not found"
+            elif missing_attribute_ids:
+                errors[index] = (
+                    f"Attributes with IDs {missing_attribute_ids} not found"
+                )
+            elif len(set(attribute_ids)) != len(attribute_ids):
+                errors[index] = "Attribute values must have distinct attributes"
+            elif missing_pricelist_ids:
+                errors[index] = (
+                    f"Pricelists with IDs {missing_pricelist_ids} not found"
+                )
+            elif len(set(price_keys)) != len(price_keys):
+                errors[index] = (
+                    "Price details must have distinct pricelist and "
+                    "minimum quantity combinations"
+                )
+            else:
+                try:
+                    await self._validate_attribute_values(
+                        item.attribute_values, attr_lookup
+                    )
+                except HTTPException as e:
+                    errors[index] = e.detail
+            # Rejected SKUs are not created, so their name stays free
+            if index not in errors:
+                seen_names.add(item.name)
+        return errors
+
+    # Columns of CSV exports; nested lists are written as JSON
+    EXPORT_CSV_COLUMNS = [
+        'id', 'sku_number', 'name', 'slug', 'description', 'is_active',
+        'sequence', 'updated_at', 'product_id', 'product_name', 'category_id',
+        'category_name', 'full_path', 'price_details', 'attribute_values'
+    ]
+
+    async def export_skus(
+        self,
+        db: AsyncSession,
+        *,
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[str]:
+        """
+        Export all SKUs with their full path, prices and attribute values.
+
+        The SKUs are streamed from the database batch by batch and every batch
+        is written out as one chunk of NDJSON lines or CSV rows, so the export
+        runs in constant memory. The session is closed once the export ends,
+        as the stream outlives the request handler.
+
+        Args:
+            db: Database session
+            export_format: NDJSON (one object per line) or CSV
+            updated_since: Only SKUs updated at or after this time
+
+        Yields:
+            Chunks of the export file
+        """
+        try:
+            if export_format == ExportFormat.CSV:
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=self.EXPORT_CSV_COLUMNS)
+                writer.writeheader()
+                yield buffer.getvalue()
+
+            async for batch in self.repository.stream_for_export(
+                db, updated_since=updated_since
+            ):
+                rows = [self._export_row(sku) for sku in batch]
+                if export_format == ExportFormat.CSV:
+                    buffer = io.StringIO()
+                    writer = csv.DictWriter(
+                        buffer, fieldnames=self.EXPORT_CSV_COLUMNS
+                    )
+                    writer.writerows(self._csv_row(row) for row in rows)
+                    yield buffer.getvalue()
+                else:
+                    yield ''.join(
+                        json.dumps(row, separators=(',', ':')) + '\n'
+                        for row in rows
+                    )
+        finally:
+            await db.close()
+
+    def _export_row(self, sku: Skus) -> Dict[str, Any]:
+        """Build the exported object of a SKU with JSON-compatible values."""
+        product = sku.product
+        return {
+            'id': sku.id,
+            'sku_number': sku.sku_number,
+            'name': sku.name,
+            'slug': sku.slug,
+            'description': sku.description,
+            'is_active': sku.is_active,
+            'sequence': sku.sequence,
+            'updated_at': sku.updated_at.isoformat(),
+            'product': {'id': product.id, 'name': product.name},
+            'category': {
+                'id': product.category.id, 'name': product.category.name
+            },
+            'full_path': sku.full_path,
+            'price_details': [
+                {
+                    'pricelist_id': price_detail.pricelist_id,
+                    'pricelist': price_detail.pricelist.name,
+                    'price': str(price_detail.price),
+                    'minimum_quantity': price_detail.minimum_quantity
+                }
+                for price_detail in sku.price_details
+            ],
+            'attribute_values': [
+                {
+                    'attribute_id': attribute_value.attribute_id,
+                    'attribute': attribute_value.attribute.name,
+                    'value': attribute_value.value
+                }
+                for attribute_value in sku.sku_attribute_values
+            ]
+        }
+
+    def _csv_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten an exported object into a CSV row."""
+        return {
+            **{
+                column: row[column] for column in (
+                    'id', 'sku_number', 'name', 'slug', 'description',
+                    'is_active', 'sequence', 'updated_at'
+                )
+            },
+            'product_id': row['product']['id'],
+            'product_name': row['product']['name'],
+            'category_id': row['category']['id'],
+            'category_name': row['category']['name'],
+            'full_path': ' > '.join(item['name'] for item in row['full_path']),
+            'price_details': json.dumps(row['price_details']),
+            'attribute_values': json.dumps(row['attribute_values'])
+        }
+
     async def update_sku(
         self,
         db: AsyncSession,
         sku_id: int,
         sku_update: SkuUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Skus:
         """Update an existing SKU with business validation."""
 
@@ -191,7 +455,7 @@ class SkuService:
         )
 
     async def delete_sku(
-        self, db: AsyncSession, sku_id: int, current_user: Users
+        self, db: AsyncSession, sku_id: int, current_user: Principal
     ) -> Skus:
         """Delete a SKU after validation."""
         db_sku = await self.repository.get(db, id=sku_id)
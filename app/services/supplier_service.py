@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from fastapi import status
 
+from app.schemas.base import CountMode
 from app.repositories import supplier_repository
-from app.models import Suppliers, Products, Users
+from app.models import Suppliers, Products
 from app.schemas.supplier_schema import (
     SupplierCreate,
     SupplierUpdate
 )
-from app.api.v1.dependencies.auth import require_resource_ownership
+from app.api.v1.dependencies.auth import Principal, require_resource_ownership
 
 
 class SupplierService:
@@ -19,11 +20,17 @@ class SupplierService:
         self.repository = supplier_repository
 
     async def get_all_suppliers(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Suppliers], int]:
         """Get all suppliers with pagination and total count."""
-        data = await self.repository.get_multi(db, skip=skip, limit=limit)
-        total = len(data)
+        data, total = await self.repository.get_multi(
+            db, skip=skip, limit=limit, count_mode=count_mode, cursor=cursor
+        )
         return data, total
 
     async def get_suppliers_with_filter(
@@ -37,16 +44,24 @@ class SupplierService:
         company_type: Optional[str] = None,
         email: Optional[str] = None,
         contact: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Suppliers], int]:
         """Get suppliers with filtering support and total count."""
         if (
             name is None and slug is None and company_type is None
             and email is None and contact is None and is_active is None
         ):
-            return await self.get_all_suppliers(db, skip=skip, limit=limit)
+            return await self.get_all_suppliers(
+                db,
+                skip=skip,
+                limit=limit,
+                count_mode=count_mode,
+                cursor=cursor
+            )
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db,
             skip=skip,
             limit=limit,
@@ -55,9 +70,10 @@ class SupplierService:
             company_type=company_type,
             email=email,
             contact=contact,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_supplier_by_id(
@@ -67,7 +83,13 @@ class SupplierService:
         return await self.repository.get(db, id=supplier_id)
 
     async def get_products_by_supplier(
-        self, db: AsyncSession, supplier_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        supplier_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Products], int]:
         """Get products by supplier with total count."""
         # Verify supplier exists
@@ -78,10 +100,11 @@ class SupplierService:
                 detail=f"Supplier with id {supplier_id} not found"
             )
 
-        data = await self.repository.get_products_by_supplier(
-            db, supplier_id=supplier_id, skip=skip, limit=limit
+        data, total = await self.repository.get_products_by_supplier(
+            db, supplier_id=supplier_id, skip=skip, limit=limit,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def create_supplier(
@@ -133,7 +156,7 @@ class SupplierService:
         supplier_id: int,
         supplier_update: SupplierUpdate,
         updated_by: int,
-        current_user: Users
+        current_user: Principal
     ) -> Suppliers:
         """Update an existing supplier with business validation."""
         # Get existing supplier
@@ -197,7 +220,7 @@ class SupplierService:
         )
 
     async def delete_supplier(
-        self, db: AsyncSession, supplier_id: int, current_user: Users
+        self, db: AsyncSession, supplier_id: int, current_user: Principal
     ) -> Suppliers:
         """Delete a supplier after validation."""
         db_supplier = await self.repository.get(db, id=supplier_id)
@@ -4,10 +4,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models import Users
+from app.schemas.base import CountMode
 from app.repositories import user_repository
 from app.schemas.user_schema import UserCreate, UserUpdate, UserChangePassword
-from app.core.security import verify_password
+from app.core.security import (
+    hash_password_async,
+    verify_and_update_password_async,
+    verify_password_async
+)
 from app.core.config import settings
+from app.api.v1.dependencies.auth import principal_cache
 
 
 class UserService:
@@ -31,17 +37,22 @@ class UserService:
             Optional[Users]: User if authentication successful, None otherwise
         """
         user = await self.repository.get_by_field(db, 'username', username)
-        if (
-            not user
-            or not user.is_active
-            or not verify_password(password, user.password)
-        ):
+        is_valid, new_hash = False, None
+        if user and user.is_active:
+            is_valid, new_hash = await verify_and_update_password_async(
+                password, user.password
+            )
+        if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # Rehash with the current argon2 parameters while the password is known
+        if new_hash:
+            user.password = new_hash
+
         # Update last login
         user.last_login = datetime.now(timezone.utc)
         await db.commit()
@@ -49,11 +60,17 @@ class UserService:
         return user
 
     async def get_all_users(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Users], int]:
         """Get all users with pagination and total count."""
-        data = await self.repository.get_multi(db, skip=skip, limit=limit)
-        total = len(data)
+        data, total = await self.repository.get_multi(
+            db, skip=skip, limit=limit, count_mode=count_mode, cursor=cursor
+        )
         return data, total
 
     async def create_user(
@@ -98,7 +115,8 @@ class UserService:
 
         # Create user
         user_data = user_create.model_dump()
-        # Password will be hashed automatically by the listener
+        # Hashed off the event loop, the listener keeps it as is
+        user_data["password"] = await hash_password_async(user_data["password"])
         user_data["created_by"] = created_by
         user_data["updated_by"] = created_by
         user_data["sequence"] = next_sequence
@@ -115,16 +133,24 @@ class UserService:
         email: Optional[str] = None,
         name: Optional[str] = None,
         role: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Users], int]:
         """Get users with filtering."""
         if (
             username is None and email is None and name is None
             and role is None and is_active is None
         ):
-            return await self.get_all_users(db, skip=skip, limit=limit)
+            return await self.get_all_users(
+                db,
+                skip=skip,
+                limit=limit,
+                count_mode=count_mode,
+                cursor=cursor
+            )
 
-        data = await self.repository.get_multi_with_filter(
+        data, total = await self.repository.get_multi_with_filter(
             db=db,
             skip=skip,
             limit=limit,
@@ -132,9 +158,10 @@ class UserService:
             email=email,
             name=name,
             role=role,
-            is_active=is_active
+            is_active=is_active,
+            count_mode=count_mode,
+            cursor=cursor
         )
-        total = len(data)
         return data, total
 
     async def get_user_by_id(self, db: AsyncSession, user_id: int) -> Optional[Users]:
@@ -196,7 +223,10 @@ class UserService:
         update_data = user_update.model_dump(exclude_unset=True)
         update_data["updated_by"] = updated_by
 
-        return await self.repository.update(db, user, update_data)
+        user = await self.repository.update(db, user, update_data)
+        # Role and active status may have changed
+        principal_cache.invalidate(user_id)
+        return user
 
     async def delete_user(self, db: AsyncSession, user_id: int) -> Users:
         """
@@ -224,7 +254,9 @@ class UserService:
                 detail="Cannot delete system or admin user"
             )
 
-        return await self.repository.delete(db, id=user_id)
+        user = await self.repository.delete(db, id=user_id)
+        principal_cache.invalidate(user_id)
+        return user
 
     async def change_password(
         self,
@@ -254,7 +286,9 @@ class UserService:
             )
 
         # Verify current password
-        if not verify_password(password_change.current_password, user.password):
+        if not await verify_password_async(
+            password_change.current_password, user.password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
@@ -262,7 +296,7 @@ class UserService:
 
         # Update password
         update_data = {
-            "password": password_change.new_password,
+            "password": await hash_password_async(password_change.new_password),
             "updated_by": user_id
         }
 
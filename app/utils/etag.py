@@ -0,0 +1,103 @@
+"""
+Conditional GET with weak entity tags.
+
+Catalogue reads are repeated over and over by clients that already hold the
+answer. Every row has an updated_at, so a repository can tell with one
+aggregate query whether what a request would return changed, without loading
+relationships or serializing anything. The entity tag of a response is a hash
+of that version and of the request it answers; a client sending it back in
+If-None-Match gets an empty 304 Not Modified while it still matches.
+
+The tags are weak (W/"..."): they identify the data of a response, not its
+bytes, which depend on the JSON encoder.
+"""
+import hashlib
+from typing import Any, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.exceptions import NotModifiedException
+
+
+def make_etag(version: Hashable) -> str:
+    """Make the weak entity tag of a version."""
+    digest = hashlib.blake2b(repr(version).encode(), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(
+    if_none_match: Optional[str], etag: str, exists: bool = True
+) -> bool:
+    """
+    Check an If-None-Match header against an entity tag, with the weak
+    comparison of RFC 9110: the W/ prefixes are ignored.
+
+    Args:
+        if_none_match: Value of the header, a list of tags or '*'
+        etag: Entity tag of the current response
+        exists: Whether there is a current representation at all; '*'
+            only matches one that exists
+
+    Returns:
+        True if the header lists the tag, or is '*' and the data exists
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' and exists:
+            return True
+        if candidate.removeprefix('W/') == opaque_tag:
+            return True
+    return False
+
+
+class ConditionalRequest:
+    """
+    The conditional part of a GET request: its If-None-Match header and the
+    scope its entity tag is made in.
+
+    Endpoints get one with Depends(ConditionalRequest.from_request) and hand
+    it down to the repository, which calls check with the version of the
+    data before loading it.
+    """
+
+    def __init__(
+        self, if_none_match: Optional[str] = None, scope: Hashable = ()
+    ):
+        """
+        Args:
+            if_none_match: Value of the If-None-Match header
+            scope: What else the response depends on, like its path and
+                query parameters
+        """
+        self.if_none_match = if_none_match
+        self.scope = scope
+        self.etag: Optional[str] = None
+
+    @classmethod
+    def from_request(cls, request: Request) -> "ConditionalRequest":
+        """Dependency: the conditional request scoped to its URL."""
+        return cls(
+            request.headers.get('if-none-match'),
+            (request.url.path, tuple(sorted(request.query_params.multi_items())))
+        )
+
+    def check(self, version: Tuple[Any, ...]) -> None:
+        """
+        Set the entity tag of the response from the version of its data.
+        The version starts with the number of rows (see
+        CRUDBase.get_version), so '*' does not match missing data.
+
+        Raises:
+            NotModifiedException: If the request already has this tag
+        """
+        self.etag = make_etag((self.scope, version))
+        if etag_matches(self.if_none_match, self.etag, exists=version[0] > 0):
+            raise NotModifiedException(self.etag)
+
+    def set_etag(self, response: Response) -> None:
+        """Send the entity tag with the response, once it is known."""
+        if self.etag is not None:
+            response.headers['ETag'] = self.etag
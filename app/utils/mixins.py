@@ -21,7 +21,8 @@ class Imageable:
                 Images.content_type == cls.__tablename__
             ),
             overlaps="images",
-            cascade="all, delete-orphan"
+            cascade="all, delete-orphan",
+            order_by=lambda: (Images.sequence, Images.id)
         )
 
     @validates('images')
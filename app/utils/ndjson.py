@@ -0,0 +1,62 @@
+"""
+NDJSON (newline-delimited JSON) utilities.
+
+Request bodies are read as a stream of byte chunks; only the current partial
+line is buffered, so memory stays bounded by the longest accepted line rather
+than by the size of the body.
+"""
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Split a stream of byte chunks into NDJSON lines.
+
+    Blank lines are skipped but still counted, so line numbers match the
+    ones of the body. A line longer than max_line_bytes is dropped instead of
+    being buffered and is yielded as None.
+
+    Args:
+        chunks: Byte chunks of the body, in order
+        max_line_bytes: Longest line to buffer, without its line break
+
+    Yields:
+        Tuple of the 1-based line number and the line bytes, or None when the
+        line is too long
+    """
+    buffer = bytearray()
+    line_number = 0
+    # Whether the rest of the current line is being discarded
+    overflow = False
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b'\n', start)
+            if end == -1:
+                if not overflow:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        buffer.clear()
+                        overflow = True
+                break
+
+            line_number += 1
+            if overflow:
+                overflow = False
+                yield line_number, None
+            else:
+                buffer += chunk[start:end]
+                if len(buffer) > max_line_bytes:
+                    yield line_number, None
+                elif buffer.strip():
+                    yield line_number, bytes(buffer)
+                buffer.clear()
+            start = end + 1
+
+    if overflow:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, bytes(buffer)
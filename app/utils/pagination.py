@@ -0,0 +1,70 @@
+"""
+Keyset pagination utilities.
+
+List queries are ordered by (sequence, id). A cursor is the opaque encoding of
+the (sequence, id) key of the last item of a page; the next page starts right
+after that key instead of skipping rows with OFFSET.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sequence: int, id: int) -> str:
+    """
+    Encode a (sequence, id) key into an opaque cursor.
+
+    Args:
+        sequence: Sequence of the last item of a page
+        id: ID of the last item of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([sequence, id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Decode an opaque cursor into its (sequence, id) key.
+
+    Args:
+        cursor: Cursor created by encode_cursor
+
+    Returns:
+        Tuple of sequence and id
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sequence, id = json.loads(base64.urlsafe_b64decode(padded))
+        if type(sequence) is not int or type(id) is not int:
+            raise ValueError(cursor)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return sequence, id
+
+
+def get_next_cursor(data: Sequence[Any], limit: int) -> Optional[str]:
+    """
+    Get the cursor of the page following the given one.
+
+    Args:
+        data: Items of the current page, ordered by (sequence, id)
+        limit: Items per page
+
+    Returns:
+        Cursor after the last item, or None if the page is not full
+    """
+    if not data or len(data) < limit:
+        return None
+    return encode_cursor(data[-1].sequence, data[-1].id)
@@ -4,12 +4,16 @@ Response helper utilities for standardized API responses.
 import math
 from typing import List, TypeVar, Optional, Any, Dict
 
+from fastapi.responses import JSONResponse
+
 from app.schemas.base import (
     SingleItemResponse,
     MultipleItemsResponse,
     MetaSchema,
     ErrorDetailSchema
 )
+from app.utils.pagination import get_next_cursor
+from app.utils.responses import APIResponse
 
 T = TypeVar('T')
 
@@ -40,16 +44,21 @@ def create_multiple_items_response(
     page: int,
     limit: int,
     total: int,
+    cursor: Optional[str] = None,
+    ranked: bool = False,
     success: bool = True
 ) -> MultipleItemsResponse[T]:
     """
     Create a standardized multiple items response with pagination.
 
     Args:
-        data: List of response data
+        data: List of response data, ordered by (sequence, id)
         page: Current page number
         limit: Items per page
         total: Total number of items
+        cursor: Cursor the current page was requested with
+        ranked: Whether data is ordered by search relevance, which has no
+            next cursor
         success: Whether the request was successful
 
     Returns:
@@ -61,7 +70,9 @@ def create_multiple_items_response(
         page=page,
         limit=limit,
         total=total,
-        pages=pages
+        pages=pages,
+        cursor=cursor,
+        next_cursor=None if ranked else get_next_cursor(data, limit)
     )
 
     return MultipleItemsResponse[T](
@@ -72,6 +83,71 @@ def create_multiple_items_response(
     )
 
 
+def create_serialized_single_item_response(
+    data: Dict[str, Any],
+    status_code: int = 200
+) -> JSONResponse:
+    """
+    Create a standardized single item response from already serialized data.
+
+    The response is returned as is by the endpoint, so the data is not
+    validated again against the response_model.
+
+    Args:
+        data: JSON-ready response data (see app.utils.serialization)
+        status_code: HTTP status code of the response
+
+    Returns:
+        JSON response with single item format
+    """
+    return APIResponse(
+        status_code=status_code,
+        content={'success': True, 'data': data, 'error': None}
+    )
+
+
+def create_serialized_multiple_items_response(
+    items: List[Any],
+    data: List[Dict[str, Any]],
+    page: int,
+    limit: int,
+    total: int,
+    cursor: Optional[str] = None,
+    ranked: bool = False
+) -> JSONResponse:
+    """
+    Create a standardized multiple items response from already serialized
+    data (see create_multiple_items_response).
+
+    Args:
+        items: Items of the page, ordered by (sequence, id)
+        data: JSON-ready response data of the items
+        page: Current page number
+        limit: Items per page
+        total: Total number of items
+        cursor: Cursor the current page was requested with
+        ranked: Whether items are ordered by search relevance, which has no
+            next cursor
+
+    Returns:
+        JSON response with multiple items format and pagination metadata
+    """
+    meta = MetaSchema(
+        page=page,
+        limit=limit,
+        total=total,
+        pages=math.ceil(total / limit),
+        cursor=cursor,
+        next_cursor=None if ranked else get_next_cursor(items, limit)
+    )
+    return APIResponse(content={
+        'success': True,
+        'data': data,
+        'meta': meta.model_dump(mode='json'),
+        'error': None
+    })
+
+
 def create_error_response(
     code: str,
     message: str,
@@ -0,0 +1,51 @@
+"""
+JSON response classes.
+
+FastAPI renders responses with the standard library json module. With
+FAST_JSON_RESPONSES the API renders them with orjson instead, which encodes
+straight to bytes several times faster on large catalogue pages.
+
+Only the encoding changes for endpoints answering through a response_model:
+FastAPI still validates their data against the model and dumps it in JSON
+mode before rendering, so the content reaching orjson holds plain JSON types
+only. The full gain is for responses built from pre-dumped data, like the
+cached SKU fragments (see app.utils.serialization), which are returned as an
+APIResponse and skip the response_model validation.
+"""
+from decimal import Decimal
+from typing import Any, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+# UTC datetimes end with 'Z', the way pydantic writes them in JSON mode
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode the values orjson does not support natively, like pydantic."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    The content is encoded as is: Decimal values as strings and datetimes in
+    ISO 8601, matching the output of the response models in JSON mode.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_encode_default, option=ORJSON_OPTIONS
+        )
+
+
+# Response class of the API, chosen by FAST_JSON_RESPONSES
+APIResponse: Type[JSONResponse] = (
+    FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+)
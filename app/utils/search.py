@@ -0,0 +1,47 @@
+"""
+Full-text search utilities.
+
+Categories, products and SKUs keep a weighted ``search_vector`` tsvector
+column: name is weighted A, description B and, for SKUs, attribute values C,
+so ts_rank ranks matches on the name above matches on the description.
+"""
+from typing import Tuple
+
+# Text search configuration of the search vectors and queries. 'simple' does
+# not stem, so it works the same for every language of the catalog.
+SEARCH_TEXT_CONFIG = 'simple'
+
+
+def weighted_search_vector_sql(*parts: Tuple[str, str]) -> str:
+    """
+    Build the SQL of a weighted tsvector.
+
+    Args:
+        parts: Pairs of a text SQL expression and its weight (A-D)
+
+    Returns:
+        SQL expression concatenating the weighted vectors of all parts
+    """
+    return ' || '.join(
+        f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', "
+        f"coalesce({expression}, '')), '{weight}')"
+        for expression, weight in parts
+    )
+
+
+# Search vector of the rows of a table with name and description columns
+NAME_DESCRIPTION_SEARCH_VECTOR = weighted_search_vector_sql(
+    ('name', 'A'), ('description', 'B')
+)
+
+# Search vector of a SKU row, including the values of its attributes
+SKU_SEARCH_VECTOR = weighted_search_vector_sql(
+    ('skus.name', 'A'),
+    ('skus.description', 'B'),
+    (
+        "(SELECT string_agg(sku_attribute_value.value, ' ') "
+        "FROM sku_attribute_value "
+        "WHERE sku_attribute_value.sku_id = skus.id)",
+        'C'
+    )
+)
@@ -0,0 +1,108 @@
+"""
+Cached response serialization.
+
+Response models validate ORM objects attribute by attribute (from_attributes)
+and FastAPI validates the result again against the response_model before
+encoding it. For catalogue pages with many rows this dominates the request.
+A FragmentSerializer turns an ORM object into its JSON-ready response dict
+once and reuses it until the object or one of the related rows it shows
+changes, and endpoints return the fragments in a JSONResponse so they are
+not validated a second time.
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Type
+
+from pydantic import BaseModel
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.schemas.sku_schema import SkuResponse
+
+
+class FragmentSerializer:
+    """
+    Serialize ORM objects with a response model, caching the result per
+    object id.
+
+    Each cached fragment is stored with the version of the object it was
+    built from: a tuple of the (id, updated_at) of the object and of every
+    related row it shows. A fragment is only reused while the version is
+    unchanged, so an edit anywhere in the graph rebuilds it.
+    """
+
+    def __init__(
+        self,
+        response_model: Type[BaseModel],
+        version: Callable[[Any], Hashable],
+        cache: TTLCache
+    ):
+        """
+        Args:
+            response_model: Model the fragments are built with
+            version: Version of an object, from its loaded relationships
+            cache: Cache of (version, fragment) by object id
+        """
+        self.response_model = response_model
+        self.version = version
+        self.cache = cache
+
+    def serialize(self, obj: Any) -> Dict[str, Any]:
+        """
+        Get the JSON-ready response dict of an object.
+
+        Args:
+            obj: ORM object with the relationships of the response loaded
+
+        Returns:
+            The object as the response model dumps it in JSON mode by alias
+        """
+        version = self.version(obj)
+        # An entry of another version is stale and counts as a miss
+        entry = self.cache.get(obj.id, lambda entry: entry[0] == version)
+        if entry is not None:
+            return entry[1]
+
+        fragment = self.response_model.model_validate(
+            obj, from_attributes=True
+        ).model_dump(mode='json', by_alias=True)
+        self.cache.set(obj.id, (version, fragment))
+        return fragment
+
+    def serialize_many(self, objs: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Get the JSON-ready response dicts of many objects, in order."""
+        return [self.serialize(obj) for obj in objs]
+
+
+def _sku_version(sku) -> Hashable:
+    """
+    Version of a SKU response: the SKU, its product and category, price
+    details with their pricelists and attribute values with their attributes.
+    """
+    product = sku.product
+    category = product.category
+    return (
+        sku.updated_at,
+        product.id,
+        product.updated_at,
+        category.id if category else None,
+        category.updated_at if category else None,
+        tuple(
+            (price_detail.id, price_detail.updated_at,
+             price_detail.pricelist.id, price_detail.pricelist.updated_at)
+            for price_detail in sku.price_details
+        ),
+        tuple(
+            (attr_value.id, attr_value.updated_at,
+             attr_value.attribute.id, attr_value.attribute.updated_at)
+            for attr_value in sku.sku_attribute_values
+        )
+    )
+
+
+sku_serializer = FragmentSerializer(
+    SkuResponse,
+    _sku_version,
+    TTLCache(
+        maxsize=settings.SKU_RESPONSE_CACHE_SIZE,
+        ttl=settings.SKU_RESPONSE_CACHE_TTL_SECONDS
+    )
+)
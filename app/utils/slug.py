@@ -0,0 +1,95 @@
+"""
+Slug and code generation.
+
+Slugs and codes are derived from names on every name assignment, by the
+'set' listeners as well as the bulk insert paths. Imports and updates assign
+the same names over and over, so slugs are memoised in a bounded LRU cache.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Set
+
+from slugify import slugify
+
+from app.core.config import settings
+
+# Characters kept free at the end of a truncated slug for a collision suffix
+# ('-2' ... '-9999999'), so the taken slugs of a batch are found with prefixes
+SLUG_SUFFIX_RESERVE = 8
+
+
+@lru_cache(maxsize=settings.SLUG_CACHE_SIZE)
+def make_slug(name: str) -> str:
+    """Generate the slug of a name."""
+    return slugify(name)
+
+
+def make_code(name: str) -> str:
+    """Generate the code of a name: its slug in uppercase."""
+    return make_slug(name).upper()
+
+
+def make_slugs(names: Iterable[str]) -> List[str]:
+    """
+    Generate the slugs of many names, slugifying each distinct name once.
+
+    Args:
+        names: Names to generate the slugs of
+
+    Returns:
+        The slug of each name, in input order
+    """
+    slugs = {}
+    return [
+        slugs[name] if name in slugs
+        else slugs.setdefault(name, make_slug(name))
+        for name in names
+    ]
+
+
+def slug_prefixes(slugs: Iterable[str], max_length: int) -> Set[str]:
+    """
+    Get the prefixes that every allocated variant of the slugs starts with.
+
+    Slugs only contain lowercase letters, digits and hyphens, so the prefixes
+    can be matched with LIKE without escaping.
+
+    Args:
+        slugs: Base slugs to allocate
+        max_length: Length of the slug column
+
+    Returns:
+        The distinct prefixes to look up the taken slugs with
+    """
+    return {slug[:max_length - SLUG_SUFFIX_RESERVE] for slug in slugs}
+
+
+def allocate_slugs(
+    slugs: Iterable[str], taken: Iterable[str], max_length: int
+) -> List[str]:
+    """
+    Make slugs unique by suffixing collisions with '-2', '-3', ...
+
+    A slug collides when it is taken or already allocated earlier in the
+    batch. A suffixed slug is truncated to fit the column.
+
+    Args:
+        slugs: Base slugs, in input order
+        taken: Slugs already stored, at least those starting with the
+            slug_prefixes of the batch
+        max_length: Length of the slug column
+
+    Returns:
+        The unique slug of each base slug, in input order
+    """
+    used = set(taken)
+    allocated = []
+    for slug in slugs:
+        candidate = slug[:max_length]
+        number = 2
+        while candidate in used:
+            suffix = f"-{number}"
+            candidate = slug[:max_length - len(suffix)] + suffix
+            number += 1
+        used.add(candidate)
+        allocated.append(candidate)
+    return allocated
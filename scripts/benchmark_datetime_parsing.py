@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark datetime parsing in DateTimeValidator.
+
+DateTime columns accept strings in several formats. They used to be parsed
+by trying every format with strptime until one did not raise, so late
+formats and invalid values paid for up to eleven failed parses. This script
+parses an example of every accepted format and a few invalid values both
+that way and with DateTimeValidator.parse, and reports the parses per second
+of each.
+
+Usage:
+    python scripts/benchmark_datetime_parsing.py [rounds]
+"""
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.listeners import DateTimeValidator  # noqa
+
+DEFAULT_ROUNDS = 2000
+
+VALUES = [
+    "2025-06-02 23:20:35.661597+08:00",
+    "2025-06-02 23:20:35.661597++0800",
+    "2025-06-02 23:20:35.661597",
+    "2023-12-25 14:30:00",
+    "2023-12-25T14:30:00",
+    "2023-12-25T14:30:00Z",
+    "2023-12-25T14:30:00.123456",
+    "2023-12-25T14:30:00.123456Z",
+    "2023-12-25T14:30:00.123456+01:00",
+    "2023-12-25T14:30:00+01:00",
+    "2023-12-25",
+    # Invalid values
+    "2025-06-02 23:20:35+08",
+    "05-06-2025",
+    "2023-02-30",
+    "not a date",
+]
+
+
+def parse_with_strptime(value: str):
+    """Parse a value by trying every format with strptime, in order."""
+    for fmt in DateTimeValidator.FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def time_parsing(parse, value: str, rounds: int) -> float:
+    """Parse a value `rounds` times and return parses per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse(value)
+    elapsed = time.perf_counter() - start
+    return rounds / elapsed
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS
+
+    print(f"{rounds} rounds per value")
+    print(f"{'value':<34} {'strptime/s':>12} {'parse/s':>12} {'speedup':>8}")
+    total_before = total_after = 0.0
+    for value in VALUES:
+        assert DateTimeValidator.parse(value) == parse_with_strptime(value)
+        before = time_parsing(parse_with_strptime, value, rounds)
+        after = time_parsing(DateTimeValidator.parse, value, rounds)
+        # Sum of seconds per parse, to compare the whole mix
+        total_before += 1 / before
+        total_after += 1 / after
+        print(
+            f"{value:<34} {before:>12,.0f} {after:>12,.0f} "
+            f"{after / before:>7.1f}x"
+        )
+    print(f"mix speedup: {total_before / total_after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
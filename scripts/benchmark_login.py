@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark password verification of logins at several argon2 parameter sets.
+
+Login time is dominated by verifying the password hash. For each parameter
+set this script hashes a password, then runs a burst of concurrent logins'
+verifications through a PasswordHasherPool the way the login endpoint does,
+and reports the p50/p99 latency seen by a login (queue time included),
+logins per second, and logins per second per worker core.
+
+Usage:
+    python scripts/benchmark_login.py [logins] [workers]
+
+Parameter sets are time_cost:memory_cost_kib:parallelism triples, read from
+the LOGIN_BENCHMARK_PARAMS environment variable (comma separated) when set.
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passlib.context import CryptContext  # noqa
+
+from app.core.config import settings  # noqa
+from app.core.security import PasswordHasherPool  # noqa
+
+DEFAULT_LOGINS = 200
+DEFAULT_PARAMS = [
+    (2, 19456, 1),
+    (2, 65536, 1),
+    (3, 65536, 4),
+    (4, 131072, 4),
+]
+PASSWORD = "benchmark-password-123"
+
+
+def parse_params():
+    """Get the (time_cost, memory_cost, parallelism) sets to benchmark."""
+    raw = os.environ.get("LOGIN_BENCHMARK_PARAMS")
+    if not raw:
+        return DEFAULT_PARAMS
+    return [
+        tuple(int(part) for part in item.split(":"))
+        for item in raw.split(",")
+    ]
+
+
+async def benchmark(params, logins: int, workers: int):
+    """Run `logins` concurrent verifications and return their latencies."""
+    time_cost, memory_cost, parallelism = params
+    context = CryptContext(
+        schemes=["argon2"],
+        argon2__rounds=time_cost,
+        argon2__memory_cost=memory_cost,
+        argon2__parallelism=parallelism
+    )
+    hashed = context.hash(PASSWORD)
+    pool = PasswordHasherPool(workers)
+
+    async def login() -> float:
+        started_at = time.perf_counter()
+        assert await pool.run(context.verify, PASSWORD, hashed)
+        return time.perf_counter() - started_at
+
+    # Warm up the pool threads
+    await asyncio.gather(*(login() for _ in range(workers)))
+
+    started_at = time.perf_counter()
+    latencies = await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started_at
+    return sorted(latencies), elapsed
+
+
+def percentile(values, fraction: float) -> float:
+    """Get a percentile of sorted values."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def main() -> None:
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOGINS
+    workers = (
+        int(sys.argv[2]) if len(sys.argv) > 2 else settings.PASSWORD_HASH_WORKERS
+    )
+    cores = min(workers, os.cpu_count() or 1)
+    print(f"{logins} concurrent logins, {workers} workers, {cores} cores used")
+    print(
+        f"{'t':>3} {'m (KiB)':>9} {'p':>3} {'verify ms':>10} {'p50 ms':>9} "
+        f"{'p99 ms':>9} {'logins/s':>9} {'/s/core':>8}"
+    )
+    for params in parse_params():
+        latencies, elapsed = await benchmark(params, logins, workers)
+        throughput = logins / elapsed
+        verify_ms = elapsed / logins * cores * 1000
+        print(
+            f"{params[0]:>3} {params[1]:>9} {params[2]:>3} {verify_ms:>10.1f} "
+            f"{percentile(latencies, 0.5) * 1000:>9.1f} "
+            f"{percentile(latencies, 0.99) * 1000:>9.1f} "
+            f"{throughput:>9.1f} {throughput / cores:>8.1f}"
+        )
+    print(
+        "current settings: "
+        f"t={settings.ARGON2_TIME_COST} m={settings.ARGON2_MEMORY_COST_KIB} "
+        f"p={settings.ARGON2_PARALLELISM}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark encoding SKU list pages.
+
+A list endpoint answering through its response_model validates the page of
+ORM objects against MultipleItemsResponse[SkuResponse], dumps it in JSON mode
+and renders it with the json module. This script times, for pages of
+generated SKUs, that path against rendering the same page with orjson
+(FastJSONResponse) and against the cached fragments of the SKU serializer,
+and checks that all of them produce the same JSON.
+
+No database is needed: the SKUs are plain objects with the attributes of
+loaded ORM rows.
+
+Usage:
+    python scripts/benchmark_response_encoding.py [items ...] [--rounds N]
+"""
+import json
+import sys
+import os
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa
+from pydantic import TypeAdapter  # noqa
+
+from app.schemas.base import MultipleItemsResponse  # noqa
+from app.schemas.sku_schema import SkuResponse  # noqa
+from app.utils.responses import FastJSONResponse  # noqa
+from app.utils.serialization import sku_serializer  # noqa
+
+DEFAULT_SIZES = [100, 1000]
+DEFAULT_ROUNDS = 20
+PAGE_ADAPTER = TypeAdapter(MultipleItemsResponse[SkuResponse])
+META = {
+    'page': 1, 'limit': 1000, 'total': 100000, 'pages': 100,
+    'cursor': None, 'next_cursor': None
+}
+
+
+def make_skus(count: int) -> list:
+    """Generate SKUs shaped like loaded ORM rows."""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    audit = {
+        'created_at': now, 'updated_at': now, 'created_by': 1,
+        'updated_by': 1, 'is_active': True, 'sequence': 0
+    }
+    category = SimpleNamespace(id=1, updated_at=now)
+    product = SimpleNamespace(id=1, updated_at=now, category=category)
+    pricelists = [
+        SimpleNamespace(id=i, name=f"Pricelist {i}", code=f"PRICELIST-{i}",
+                        updated_at=now)
+        for i in range(1, 3)
+    ]
+    attributes = [
+        SimpleNamespace(id=i, name=f"Attribute {i}", code=f"ATTRIBUTE-{i}",
+                        data_type="TEXT", uom=None, updated_at=now)
+        for i in range(1, 5)
+    ]
+
+    skus = []
+    for index in range(1, count + 1):
+        skus.append(SimpleNamespace(
+            id=index,
+            name=f"SKU {index}",
+            slug=f"sku-{index}",
+            description="Generated SKU",
+            sku_number=f"{index:010X}",
+            product_id=1,
+            product=product,
+            full_path=[
+                {'name': 'Electronics', 'slug': 'electronics',
+                 'category_type': 'Goods', 'type': 'Category'},
+                {'name': 'Phones', 'slug': 'phones',
+                 'category_type': None, 'type': 'Category'},
+                {'name': 'Phone', 'slug': 'phone', 'type': 'Product'},
+                {'name': f"SKU {index}", 'slug': f"sku-{index}",
+                 'sku_number': f"{index:010X}", 'type': 'SKU'}
+            ],
+            price_details=[
+                SimpleNamespace(
+                    id=index * 10 + tier, price=Decimal("1999.90") * tier,
+                    minimum_quantity=tier, pricelist=pricelists[tier % 2],
+                    updated_at=now
+                )
+                for tier in range(1, 4)
+            ],
+            sku_attribute_values=[
+                SimpleNamespace(
+                    id=index * 10 + i, attribute=attribute, value=f"Value {i}",
+                    updated_at=now
+                )
+                for i, attribute in enumerate(attributes)
+            ],
+            **audit
+        ))
+    return skus
+
+
+def encode_response_model(skus: list) -> bytes:
+    """The response_model path: validate, dump in JSON mode, json module."""
+    page = PAGE_ADAPTER.validate_python(
+        {'success': True, 'data': skus, 'meta': META, 'error': None},
+        from_attributes=True
+    )
+    content = PAGE_ADAPTER.dump_python(page, mode='json', by_alias=True)
+    return JSONResponse(content).body
+
+
+def encode_response_model_orjson(skus: list) -> bytes:
+    """The response_model path rendered with orjson."""
+    page = PAGE_ADAPTER.validate_python(
+        {'success': True, 'data': skus, 'meta': META, 'error': None},
+        from_attributes=True
+    )
+    content = PAGE_ADAPTER.dump_python(page, mode='json', by_alias=True)
+    return FastJSONResponse(content).body
+
+
+def encode_fragments(skus: list) -> bytes:
+    """Cached SKU fragments rendered with orjson."""
+    return FastJSONResponse({
+        'success': True,
+        'data': sku_serializer.serialize_many(skus),
+        'meta': META,
+        'error': None
+    }).body
+
+
+def time_encoding(encode, skus: list, rounds: int) -> float:
+    """Encode the page `rounds` times and return the mean time in ms."""
+    encode(skus)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode(skus)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    rounds = DEFAULT_ROUNDS
+    if '--rounds' in args:
+        position = args.index('--rounds')
+        rounds = int(args[position + 1])
+        del args[position:position + 2]
+    sizes = [int(size) for size in args] or DEFAULT_SIZES
+
+    print(
+        f"{'items':>6} {'model+json ms':>14} {'model+orjson ms':>16} "
+        f"{'fragments ms':>13}"
+    )
+    for size in sizes:
+        skus = make_skus(size)
+        expected = json.loads(encode_response_model(skus))
+        assert json.loads(encode_response_model_orjson(skus)) == expected
+        assert json.loads(encode_fragments(skus)) == expected
+
+        stdlib = time_encoding(encode_response_model, skus, rounds)
+        orjson = time_encoding(encode_response_model_orjson, skus, rounds)
+        fragments = time_encoding(encode_fragments, skus, rounds)
+        print(f"{size:>6} {stdlib:>14.2f} {orjson:>16.2f} {fragments:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark creating a SKU with price details and attribute values.
+
+The previous create path committed the SKU, refreshed it, committed its
+children and selected the whole graph again; the current one flushes the SKU
+and its children together, commits once and answers from the objects in
+memory. This script creates SKUs through both and reports, per create, the
+mean latency, the statements sent to the database and the commits.
+
+The scratch product, pricelist, attribute and SKUs are deleted at the end.
+
+Usage:
+    python scripts/benchmark_sku_create.py [creates]
+"""
+import asyncio
+import sys
+import os
+import time
+import uuid
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, event, select  # noqa
+
+from app.core.listeners import register_listeners  # noqa
+from app.core.session import async_session_factory, engine  # noqa
+from app.models.attribute_model import DataType  # noqa
+from app.models.supplier_model import CompanyType  # noqa
+from app.models import (  # noqa
+    Attributes, Categories, CategoryTypes, PriceDetails, Pricelists, Products,
+    SkuAttributeValue, Skus, Suppliers
+)
+from app.repositories import sku_repository  # noqa
+from app.schemas.sku_schema import SkuCreate  # noqa
+
+DEFAULT_CREATES = 200
+
+
+class StatementCounter:
+    """Count the statements and commits sent through the engine."""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine.sync_engine, 'before_cursor_execute', self.on_execute)
+        event.listen(engine.sync_engine, 'commit', self.on_commit)
+
+    def on_execute(self, *args):
+        self.statements += 1
+
+    def on_commit(self, *args):
+        self.commits += 1
+
+
+async def legacy_create_sku(db, obj_in: SkuCreate, created_by: int) -> Skus:
+    """The previous create path: two commits, a refresh and a reload."""
+    sku_data = obj_in.model_dump(exclude={'price_details', 'attribute_values'})
+    sku_data['created_by'] = created_by
+    sku_data['updated_by'] = created_by
+    await sku_repository.validate_foreign_key(db, Products, sku_data['product_id'])
+    db_sku = Skus(**sku_data)
+    db.add(db_sku)
+    await db.commit()
+    await db.refresh(db_sku)
+    for price_detail_data in obj_in.price_details:
+        db.add(PriceDetails(sku_id=db_sku.id, **price_detail_data.model_dump()))
+    for attr_value_data in obj_in.attribute_values:
+        db.add(SkuAttributeValue(sku_id=db_sku.id, **attr_value_data.model_dump()))
+    await db.commit()
+    return await sku_repository.get_with_relationships(db, db_sku.id)
+
+
+async def create_fixtures(db, tag: str):
+    """Create the rows every benchmarked SKU refers to."""
+    category_type = CategoryTypes(name=f"Benchmark {tag}")
+    supplier = Suppliers(
+        name=f"Benchmark {tag}",
+        company_type=CompanyType.PT,
+        contact=str(uuid.uuid4().int)[:12],
+        email=f"benchmark-{tag}@example.com"
+    )
+    db.add_all([category_type, supplier])
+    await db.flush()
+    category = Categories(
+        name=f"Benchmark {tag}", category_type_id=category_type.id
+    )
+    db.add(category)
+    await db.flush()
+    product = Products(
+        name=f"Benchmark {tag}", category_id=category.id, supplier_id=supplier.id
+    )
+    pricelist = Pricelists(name=f"Benchmark {tag}")
+    attribute = Attributes(name=f"Benchmark {tag}", data_type=DataType.TEXT)
+    db.add_all([product, pricelist, attribute])
+    await db.commit()
+    return category_type, supplier, category, product, pricelist, attribute
+
+
+async def time_creates(create, fixtures, creates: int, label: str, counter):
+    """Create SKUs with `create`, returning ms, statements and commits per SKU."""
+    _, _, _, product, pricelist, attribute = fixtures
+    statements, commits = counter.statements, counter.commits
+    start = time.perf_counter()
+    for index in range(creates):
+        obj_in = SkuCreate(
+            name=f"Benchmark {label} {index}",
+            product_id=product.id,
+            price_details=[{
+                'pricelist_id': pricelist.id,
+                'price': 100,
+                'minimum_quantity': 1
+            }],
+            attribute_values=[{'attribute_id': attribute.id, 'value': 'blue'}]
+        )
+        async with async_session_factory() as db:
+            await create(db, obj_in, 1)
+    elapsed = time.perf_counter() - start
+    return (
+        elapsed * 1000 / creates,
+        (counter.statements - statements) / creates,
+        (counter.commits - commits) / creates
+    )
+
+
+async def main():
+    """Main function to run the benchmark."""
+    creates = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CREATES
+    register_listeners()
+    counter = StatementCounter()
+    tag = uuid.uuid4().hex[:8]
+
+    async with async_session_factory() as db:
+        fixtures = await create_fixtures(db, tag)
+    category_type, supplier, category, product, pricelist, attribute = fixtures
+
+    async def current_create_sku(db, obj_in, created_by):
+        return await sku_repository.create_sku(db, obj_in, created_by)
+
+    try:
+        print(f"{'path':>10} {'ms/create':>10} {'statements':>11} {'commits':>8}")
+        for label, create in [
+            ("legacy", legacy_create_sku), ("current", current_create_sku)
+        ]:
+            ms, statements, commits = await time_creates(
+                create, fixtures, creates, label, counter
+            )
+            print(f"{label:>10} {ms:>10.2f} {statements:>11.1f} {commits:>8.1f}")
+    finally:
+        async with async_session_factory() as db:
+            sku_ids = select(Skus.id).where(Skus.product_id == product.id)
+            for model in (PriceDetails, SkuAttributeValue):
+                await db.execute(delete(model).where(model.sku_id.in_(sku_ids)))
+            await db.execute(delete(Skus).where(Skus.product_id == product.id))
+            for model, obj in [
+                (Products, product), (Pricelists, pricelist),
+                (Attributes, attribute), (Categories, category),
+                (Suppliers, supplier), (CategoryTypes, category_type)
+            ]:
+                await db.execute(delete(model).where(model.id == obj.id))
+            await db.commit()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
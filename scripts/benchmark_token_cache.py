@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark access token verification with and without the token cache.
+
+Every authenticated request verifies its bearer token. Without the cache
+each verification runs the HMAC signature check, base64 decoding and JSON
+claim parsing of python-jose; with the cache a token is verified once and
+then found by its digest. This script verifies a pool of tokens many times
+each, the way a few active clients do, and reports the throughput of both.
+
+Usage:
+    python scripts/benchmark_token_cache.py [tokens] [rounds]
+"""
+import sys
+import os
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import security  # noqa
+from app.core.cache import TTLCache  # noqa
+
+DEFAULT_TOKENS = 100
+DEFAULT_ROUNDS = 200
+
+
+def time_verification(tokens: list, rounds: int) -> float:
+    """Verify every token `rounds` times and return verifications per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            assert security.verify_token(token) is not None
+    elapsed = time.perf_counter() - start
+    return len(tokens) * rounds / elapsed
+
+
+def main() -> None:
+    tokens_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TOKENS
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ROUNDS
+    tokens = [
+        security.create_access_token(subject=user_id)
+        for user_id in range(1, tokens_count + 1)
+    ]
+    cache = security.token_cache
+
+    # A cache without room never stores anything
+    security.token_cache = TTLCache(maxsize=0, ttl=cache.ttl)
+    uncached = time_verification(tokens, rounds)
+
+    security.token_cache = cache
+    cache.clear()
+    cached = time_verification(tokens, rounds)
+
+    print(f"{tokens_count} tokens x {rounds} rounds")
+    print(f"{'mode':>10} {'verifications/s':>16}")
+    print(f"{'uncached':>10} {uncached:>16,.0f}")
+    print(f"{'cached':>10} {cached:>16,.0f}")
+    print(f"speedup: {cached / uncached:.1f}x, cache {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
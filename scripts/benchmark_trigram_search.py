@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark partial match name search with and without a trigram index.
+
+This script fills a scratch table with generated SKU-like names at growing
+sizes and times a selective ILIKE '%term%' search, ranked by word
+similarity, once as a sequential scan and once through a pg_trgm GIN index.
+The sequential scan grows linearly with the table while the index scan only
+grows with the number of matching rows.
+
+Usage:
+    python scripts/benchmark_trigram_search.py [rows ...]
+"""
+import asyncio
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa
+
+from app.core.session import engine  # noqa
+
+TABLE_NAME = "benchmark_trigram_search"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+SEARCH_QUERY = (
+    f"SELECT id, name FROM {TABLE_NAME} WHERE name ILIKE :pattern "
+    "ORDER BY word_similarity(:term, name) DESC, id LIMIT 20"
+)
+
+
+async def fill_table(connection, rows: int) -> str:
+    """Fill the scratch table and return a term matching a few rows."""
+    await connection.execute(text(f"TRUNCATE {TABLE_NAME}"))
+    await connection.execute(
+        text(
+            f"INSERT INTO {TABLE_NAME} (name) "
+            "SELECT 'SKU ' || substr(md5(g::text), 1, 12) || ' Series ' || g % 97 "
+            "FROM generate_series(1, :rows) AS g"
+        ),
+        {"rows": rows}
+    )
+    await connection.execute(text(f"ANALYZE {TABLE_NAME}"))
+    result = await connection.execute(
+        text(f"SELECT substr(name, 6, 6) FROM {TABLE_NAME} WHERE id = :id"),
+        {"id": rows // 2}
+    )
+    return result.scalar()
+
+
+async def time_search(connection, term: str, use_index: bool) -> float:
+    """Run the search once and return its execution time in milliseconds."""
+    toggle = "on" if use_index else "off"
+    await connection.execute(text(f"SET LOCAL enable_bitmapscan = {toggle}"))
+    await connection.execute(text(f"SET LOCAL enable_indexscan = {toggle}"))
+    result = await connection.execute(
+        text(f"EXPLAIN (ANALYZE, FORMAT JSON) {SEARCH_QUERY}"),
+        {"pattern": f"%{term}%", "term": term}
+    )
+    return result.scalar()[0]["Execution Time"]
+
+
+async def main():
+    """Main function to run the benchmark."""
+    sizes = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+
+    async with engine.begin() as connection:
+        result = await connection.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        )
+        if result.scalar() is None:
+            print("pg_trgm is not installed, run the migrations first.")
+            sys.exit(1)
+
+        await connection.execute(
+            text(
+                f"CREATE TABLE {TABLE_NAME} "
+                "(id serial PRIMARY KEY, name varchar(100) NOT NULL)"
+            )
+        )
+        await connection.execute(
+            text(
+                f"CREATE INDEX ix_{TABLE_NAME}_name_trgm ON {TABLE_NAME} "
+                "USING gin (name gin_trgm_ops)"
+            )
+        )
+
+        try:
+            print(f"{'rows':>10} {'seq scan ms':>12} {'trigram ms':>12}")
+            for rows in sizes:
+                term = await fill_table(connection, rows)
+                # Warm up the cache so both runs read the same pages
+                await time_search(connection, term, use_index=False)
+                seq_scan = await time_search(connection, term, use_index=False)
+                trigram = await time_search(connection, term, use_index=True)
+                print(f"{rows:>10} {seq_scan:>12.2f} {trigram:>12.2f}")
+        finally:
+            await connection.execute(text(f"DROP TABLE {TABLE_NAME}"))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,7 +5,14 @@ from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user_model import Users
-from app.core.security import create_refresh_token, hash_password
+from passlib.context import CryptContext
+from app.core.security import (
+    HashedPassword,
+    create_refresh_token,
+    hash_password,
+    pwd_context,
+    verify_password,
+)
 from tests.utils.model_test_utils import save_object
 
 
@@ -94,6 +101,33 @@ class TestLoginEndpoint:
         assert error["message"] == "Incorrect username or password"
         assert error["details"] is None
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_password_hash(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test a hash with outdated argon2 parameters is replaced on login"""
+        weak_context = CryptContext(
+            schemes=["argon2"],
+            argon2__rounds=1,
+            argon2__memory_cost=8192,
+            argon2__parallelism=1
+        )
+        self.test_user.password = HashedPassword(
+            weak_context.hash("testpassword123")
+        )
+        await db_session.commit()
+        assert pwd_context.needs_update(self.test_user.password)
+
+        response = await async_client.post(
+            "/api/v1/auth/login",
+            json={"username": "testuser", "password": "testpassword123"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        await db_session.refresh(self.test_user)
+        assert not pwd_context.needs_update(self.test_user.password)
+        assert verify_password("testpassword123", self.test_user.password)
+
     @pytest.mark.asyncio
     async def test_login_inactive_user(self, async_client: AsyncClient):
         """Test login with inactive user"""
@@ -203,6 +203,56 @@ class TestGetCategories:
             assert "full_path" in item
             assert "children" in item
 
+    async def test_get_categories_not_modified(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test a page is answered 304 while its ETag matches."""
+        await category_factory(name="Mobile Phones")
+
+        response = await async_client.get(
+            "/api/v1/categories/", headers=auth_headers_system
+        )
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        headers = {**auth_headers_system, "If-None-Match": etag}
+        response = await async_client.get("/api/v1/categories/", headers=headers)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        # The same data answers another query with another ETag
+        response = await async_client.get(
+            "/api/v1/categories/?limit=10", headers=headers
+        )
+        assert response.status_code == 200
+
+        await category_factory(name="Laptops")
+        response = await async_client.get("/api/v1/categories/", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()["data"]) == 2
+
+    async def test_get_categories_estimated_not_modified(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test estimated counts only take the version of a conditional GET."""
+        await category_factory(name="Mobile Phones")
+        url = "/api/v1/categories/?count=estimated"
+
+        response = await async_client.get(url, headers=auth_headers_system)
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+        headers = {**auth_headers_system, "If-None-Match": 'W/"stale"'}
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        headers = {**auth_headers_system, "If-None-Match": etag}
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 304
+
     async def test_get_categories_unauthenticated(
         self, async_client: AsyncClient
     ):
@@ -432,6 +482,68 @@ class TestGetCategory:
         assert data["full_path"][0]["name"] == "Mobile Phones"
         assert data["full_path"][1]["name"] == "Smartphones"
 
+    async def test_get_category_with_nested_children(
+        self, async_client: AsyncClient, category_factory, image_factory,
+        auth_headers_system
+    ):
+        """Test getting category with its whole subtree of children."""
+        root_category = await category_factory(name="Electronics")
+        phones = await category_factory(name="Mobile Phones", parent=root_category)
+        laptops = await category_factory(name="Laptops", parent=root_category)
+        smartphones = await category_factory(name="Smartphones", parent=phones)
+        await image_factory(
+            file="smartphones.jpg",
+            content_type="categories",
+            object_id=smartphones.id
+        )
+
+        response = await async_client.get(
+            f"/api/v1/categories/{root_category.id}", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [child["id"] for child in data["children"]] == [phones.id, laptops.id]
+
+        phones_data = data["children"][0]
+        assert phones_data["images"] == []
+        assert len(phones_data["children"]) == 1
+
+        smartphones_data = phones_data["children"][0]
+        assert smartphones_data["id"] == smartphones.id
+        assert smartphones_data["children"] == []
+        assert [image["file"] for image in smartphones_data["images"]] == [
+            "smartphones.jpg"
+        ]
+        assert [item["name"] for item in smartphones_data["full_path"]] == [
+            "Electronics", "Mobile Phones", "Smartphones"
+        ]
+
+        laptops_data = data["children"][1]
+        assert laptops_data["children"] == []
+
+    async def test_get_category_not_modified(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test a category is answered 304 until its subtree changes."""
+        category = await category_factory(name="Mobile Phones")
+        url = f"/api/v1/categories/{category.id}"
+
+        response = await async_client.get(url, headers=auth_headers_system)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        headers = {**auth_headers_system, "If-None-Match": etag}
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        await category_factory(name="Smartphones", parent=category)
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()["data"]["children"]) == 1
+
     async def test_get_category_not_found(
         self, async_client: AsyncClient, auth_headers_system
     ):
@@ -505,6 +617,67 @@ class TestUpdateCategory:
         assert data["slug"] == "mobile-phones-and-accessories"
         assert data["description"] == "Updated description"
 
+    async def test_update_category_images(
+        self, async_client: AsyncClient, category_factory, image_factory,
+        auth_headers_system
+    ):
+        """Test creating, updating and deleting images in one request."""
+        category = await category_factory(name="Mobile Phones")
+        kept = await image_factory(
+            file="phones/front.jpg", content_type="categories",
+            object_id=category.id
+        )
+        removed = await image_factory(
+            file="phones/back.jpg", content_type="categories",
+            object_id=category.id
+        )
+
+        update_data = {
+            "images_to_create": [{"file": "phones/side.jpg"}],
+            "images_to_update": [
+                {"id": kept.id, "title": "Front", "is_primary": True}
+            ],
+            "images_to_delete": [removed.id]
+        }
+        response = await async_client.put(
+            f"/api/v1/categories/{category.id}",
+            json=update_data,
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        images = sorted(response.json()["data"]["images"], key=lambda i: i["file"])
+        assert [image["file"] for image in images] == [
+            "phones/front.jpg", "phones/side.jpg"
+        ]
+        assert images[0]["title"] == "Front"
+        assert images[0]["is_primary"] is True
+
+    async def test_update_category_image_of_other_category(
+        self, async_client: AsyncClient, category_factory, image_factory,
+        auth_headers_system
+    ):
+        """Test images of another category cannot be deleted."""
+        category = await category_factory(name="Mobile Phones")
+        other = await category_factory(name="Laptops")
+        image = await image_factory(
+            file="laptops/front.jpg", content_type="categories",
+            object_id=other.id
+        )
+
+        response = await async_client.put(
+            f"/api/v1/categories/{category.id}",
+            json={"images_to_delete": [image.id]},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 400
+        error = response.json()["error"]
+        assert error["message"] == (
+            f"Image with id {image.id} does not belong to "
+            f"Categories with id {category.id}"
+        )
+
     async def test_update_category_not_found(
         self, async_client: AsyncClient, auth_headers_system
     ):
@@ -622,6 +795,59 @@ class TestUpdateCategory:
         )
         assert error["details"] is None
 
+    async def test_update_category_move_subtree(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test moving category rewrites the full path of its subtree."""
+        electronics = await category_factory(name="Electronics")
+        gadgets = await category_factory(name="Gadgets")
+        phones = await category_factory(name="Mobile Phones", parent=electronics)
+        smartphones = await category_factory(name="Smartphones", parent=phones)
+
+        response = await async_client.put(
+            f"/api/v1/categories/{phones.id}",
+            json={"parent_id": gadgets.id},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [item["name"] for item in data["full_path"]] == [
+            "Gadgets", "Mobile Phones"
+        ]
+        assert [item["name"] for item in data["children"][0]["full_path"]] == [
+            "Gadgets", "Mobile Phones", "Smartphones"
+        ]
+
+        response = await async_client.get(
+            f"/api/v1/categories/{smartphones.id}", headers=auth_headers_system
+        )
+        assert [item["slug"] for item in response.json()["data"]["full_path"]] == [
+            "gadgets", "mobile-phones", "smartphones"
+        ]
+
+    async def test_update_category_parent_descendant(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test moving category under its own descendant."""
+        root_category = await category_factory(name="Electronics")
+        parent_category = await category_factory(
+            name="Mobile Phones", parent=root_category
+        )
+        category = await category_factory(name="Smartphones", parent=parent_category)
+
+        response = await async_client.put(
+            f"/api/v1/categories/{parent_category.id}",
+            json={"parent_id": category.id},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 422
+        error = response.json()["error"]
+        assert error["message"] == (
+            "Category cannot be moved under its own descendant."
+        )
+
     async def test_update_category_category_type_not_exists(
         self, async_client: AsyncClient, category_factory, auth_headers_system
     ):
@@ -1,5 +1,9 @@
+import json
+
 from httpx import AsyncClient
 
+from app.core.config import settings
+
 
 class TestGetProducts:
     """Test cases for GET /products/ endpoint."""
@@ -49,6 +53,35 @@ class TestGetProducts:
         assert len(data) == 1
         assert data[0]["name"] == "iPhone 15 Pro Max"
 
+    async def test_get_products_filter_by_name_ranked(
+        self, async_client: AsyncClient, product_factory, auth_headers_system
+    ):
+        """Test name search results are ordered by relevance."""
+        await product_factory(name="Smartphone Stand")
+        await product_factory(name="Phone Case")
+        await product_factory(name="Laptop Sleeve")
+
+        response = await async_client.get(
+            "/api/v1/products/?name=phone&limit=2", headers=auth_headers_system
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["name"] for item in body["data"]] == [
+            "Phone Case", "Smartphone Stand"
+        ]
+        assert body["meta"]["total"] == 2
+        # Ranked pages are paged with skip only
+        assert body["meta"]["next_cursor"] is None
+
+        response = await async_client.get(
+            "/api/v1/products/?name=phone&cursor=WzAsMV0",
+            headers=auth_headers_system
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["message"] == (
+            "Cursor cannot be used with a ranked search"
+        )
+
     async def test_get_products_filter_by_slug(
         self, async_client: AsyncClient, product_factory, auth_headers_system
     ):
@@ -699,6 +732,232 @@ class TestGetProductSkus:
         assert error["details"] is None
 
 
+class TestImportProducts:
+    """Test cases for POST /products/import endpoint."""
+
+    @staticmethod
+    def ndjson(*lines):
+        """Encode objects (or raw strings) as an NDJSON body."""
+        return "\n".join(
+            line if isinstance(line, str) else json.dumps(line) for line in lines
+        ).encode()
+
+    async def test_import_products_with_skus(
+        self, async_client: AsyncClient, category_factory, supplier_factory,
+        pricelist_factory, attribute_factory, auth_headers_system
+    ):
+        """Test importing products with nested SKUs, images and prices."""
+        category = await category_factory(name="Apparel")
+        supplier = await supplier_factory(name="Textile Co")
+        pricelist = await pricelist_factory(name="Retail")
+        attribute = await attribute_factory(name="Size", data_type="TEXT")
+
+        def product(name):
+            return {
+                "name": name,
+                "category_id": category.id,
+                "supplier_id": supplier.id,
+                "images": [{"file": f"{name}.jpg", "is_primary": True}],
+                "skus": [
+                    {
+                        "name": f"{name} {size}",
+                        "price_details": [{
+                            "pricelist_id": pricelist.id,
+                            "price": 10,
+                            "minimum_quantity": 1
+                        }],
+                        "attribute_values": [
+                            {"attribute_id": attribute.id, "value": size}
+                        ]
+                    }
+                    for size in ("S", "M")
+                ]
+            }
+
+        body = self.ndjson(product("Polo"), "", product("Hoodie")) + b"\n"
+        response = await async_client.post(
+            "/api/v1/products/import",
+            content=body,
+            headers={**auth_headers_system, "Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data == {
+            "lines": 2,
+            "products_created": 2,
+            "skus_created": 4,
+            "failed": 0,
+            "chunks": 1,
+            "errors": [],
+            "errors_truncated": False
+        }
+
+        response = await async_client.get(
+            "/api/v1/products/?slug=hoodie", headers=auth_headers_system
+        )
+        hoodie = response.json()["data"][0]
+        assert hoodie["created_by"] == 1
+        assert [image["file"] for image in hoodie["images"]] == ["Hoodie.jpg"]
+
+        response = await async_client.get(
+            f"/api/v1/products/{hoodie['id']}/skus/", headers=auth_headers_system
+        )
+        skus = response.json()["data"]
+        assert [sku["name"] for sku in skus] == ["Hoodie S", "Hoodie M"]
+        assert skus[1]["sku_attribute_values"][0]["value"] == "M"
+        assert skus[1]["price_details"][0]["price"] == "10.00"
+
+    async def test_import_products_reports_invalid_lines(
+        self, async_client: AsyncClient, category_factory, supplier_factory,
+        product_factory, auth_headers_system
+    ):
+        """Test invalid lines are reported while valid ones are imported."""
+        category = await category_factory(name="Audio")
+        supplier = await supplier_factory(name="Sound Co")
+        await product_factory(
+            name="Speaker", category=category, supplier=supplier
+        )
+
+        def product(name, **kwargs):
+            return {
+                "name": name,
+                "category_id": category.id,
+                "supplier_id": supplier.id,
+                **kwargs
+            }
+
+        body = self.ndjson(
+            product("Headphones"),
+            "{not json",
+            product("Speaker"),
+            product("Microphone", category_id=999),
+            product("Amplifier", skus=[
+                {"name": "Amplifier 50W", "price_details": [],
+                 "attribute_values": [{"attribute_id": 999, "value": "x"}]}
+            ]),
+            {"name": "Mixer"},
+        )
+        response = await async_client.post(
+            "/api/v1/products/import", content=body, headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["lines"] == 6
+        assert data["products_created"] == 1
+        assert data["failed"] == 5
+        errors = {error["line"]: error["error"] for error in data["errors"]}
+        assert list(errors) == [2, 3, 4, 5, 6]
+        assert errors[2].startswith("Invalid JSON")
+        assert errors[3] == "Product with name 'Speaker' already exists"
+        assert errors[4] == "Categories with id 999 not found"
+        assert errors[5] == "skus.0: Attributes with IDs {999} not found"
+        assert "category_id: Field required" in errors[6]
+
+        response = await async_client.get(
+            "/api/v1/products/?name=amplifier", headers=auth_headers_system
+        )
+        assert response.json()["data"] == []
+
+    async def test_import_products_rejected_line_keeps_slug_free(
+        self, async_client: AsyncClient, category_factory, supplier_factory,
+        auth_headers_system
+    ):
+        """Test a rejected line does not block a later one with its slug."""
+        category = await category_factory(name="Audio")
+        supplier = await supplier_factory(name="Sound Co")
+
+        body = self.ndjson(
+            {"name": "Speaker", "category_id": 999, "supplier_id": supplier.id},
+            {"name": "speaker", "category_id": category.id,
+             "supplier_id": supplier.id},
+        )
+        response = await async_client.post(
+            "/api/v1/products/import", content=body, headers=auth_headers_system
+        )
+
+        data = response.json()["data"]
+        assert data["products_created"] == 1
+        assert [error["line"] for error in data["errors"]] == [1]
+
+        response = await async_client.get(
+            "/api/v1/products/?slug=speaker", headers=auth_headers_system
+        )
+        assert [product["name"] for product in response.json()["data"]] == [
+            "speaker"
+        ]
+
+    async def test_import_products_suffixes_taken_slugs(
+        self, async_client: AsyncClient, category_factory, supplier_factory,
+        product_factory, auth_headers_system
+    ):
+        """Test names whose slug is taken are imported with a suffixed slug."""
+        category = await category_factory(name="Audio")
+        supplier = await supplier_factory(name="Sound Co")
+        await product_factory(
+            name="Speaker", category=category, supplier=supplier
+        )
+
+        body = self.ndjson(*(
+            {"name": name, "category_id": category.id,
+             "supplier_id": supplier.id}
+            for name in ["speaker", "SPEAKER"]
+        ))
+        response = await async_client.post(
+            "/api/v1/products/import", content=body, headers=auth_headers_system
+        )
+
+        data = response.json()["data"]
+        assert data["products_created"] == 2
+        assert data["errors"] == []
+
+        response = await async_client.get(
+            "/api/v1/products/?name=speaker", headers=auth_headers_system
+        )
+        assert sorted(
+            product["slug"] for product in response.json()["data"]
+        ) == ["speaker", "speaker-2", "speaker-3"]
+
+    async def test_import_products_in_chunks(
+        self, async_client: AsyncClient, category_factory, supplier_factory,
+        auth_headers_system, monkeypatch
+    ):
+        """Test the body is imported chunk by chunk with limited errors."""
+        monkeypatch.setattr(settings, "IMPORT_CHUNK_SIZE", 2)
+        monkeypatch.setattr(settings, "IMPORT_MAX_REPORTED_ERRORS", 1)
+        category = await category_factory(name="Toys")
+        supplier = await supplier_factory(name="Toy Co")
+
+        body = self.ndjson(*(
+            {
+                "name": f"Puzzle {i}",
+                "category_id": category.id,
+                "supplier_id": supplier.id
+            }
+            for i in range(5)
+        ), "[]", "[]")
+        response = await async_client.post(
+            "/api/v1/products/import", content=body, headers=auth_headers_system
+        )
+
+        data = response.json()["data"]
+        assert data["products_created"] == 5
+        assert data["chunks"] == 4
+        assert data["failed"] == 2
+        assert [error["line"] for error in data["errors"]] == [6]
+        assert data["errors_truncated"] is True
+
+    async def test_import_products_forbidden_for_user(
+        self, async_client: AsyncClient, auth_headers_user
+    ):
+        """Test importing is limited to managers and admins."""
+        response = await async_client.post(
+            "/api/v1/products/import", content=b"", headers=auth_headers_user
+        )
+        assert response.status_code == 403
+
+
 class TestProductEndpointIntegration:
     """Integration tests for product endpoints."""
 
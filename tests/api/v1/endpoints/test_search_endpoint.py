@@ -0,0 +1,138 @@
+from httpx import AsyncClient
+
+
+class TestSearch:
+    """Test cases for GET /search/ endpoint."""
+
+    async def test_search_ranked_across_types(
+        self, async_client: AsyncClient, category_factory, product_factory,
+        sku_factory, attribute_factory, sku_attribute_value_factory,
+        auth_headers_system
+    ):
+        """Test hits of all types are ranked name > description > attribute."""
+        category = await category_factory(
+            name="Accessories", description="Cases and stands for every phone"
+        )
+        product = await product_factory(name="Phone Stand", category=category)
+        sku = await sku_factory(name="Desk Stand Black", product=product)
+        attribute = await attribute_factory(name="Compatibility", data_type="TEXT")
+        await sku_attribute_value_factory(
+            sku=sku, attribute=attribute, value="phone"
+        )
+        await category_factory(name="Furniture", description="Chairs")
+
+        response = await async_client.get(
+            "/api/v1/search/?q=phone", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [(hit["type"], hit["name"]) for hit in body["data"]] == [
+            ("product", "Phone Stand"),
+            ("category", "Accessories"),
+            ("sku", "Desk Stand Black"),
+        ]
+        ranks = [hit["rank"] for hit in body["data"]]
+        assert ranks == sorted(ranks, reverse=True)
+        assert body["meta"]["total"] == 3
+        assert body["meta"]["next_cursor"] is None
+
+        sku_hit = body["data"][2]
+        assert sku_hit["id"] == sku.id
+        assert sku_hit["sku_number"] == sku.sku_number
+        assert [item["type"] for item in sku_hit["full_path"]] == [
+            "Category", "Product", "SKU"
+        ]
+        assert sku_hit["full_path"][0]["name"] == "Accessories"
+        assert body["data"][1]["sku_number"] is None
+
+    async def test_search_filter_by_types(
+        self, async_client: AsyncClient, category_factory, product_factory,
+        auth_headers_system
+    ):
+        """Test restricting the search to some entity types."""
+        category = await category_factory(name="Laptop Bags")
+        await product_factory(name="Laptop Sleeve", category=category)
+
+        response = await async_client.get(
+            "/api/v1/search/?q=laptop&types=product", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [(hit["type"], hit["name"]) for hit in data] == [
+            ("product", "Laptop Sleeve")
+        ]
+
+    async def test_search_follows_sku_changes(
+        self, async_client: AsyncClient, sku_factory, attribute_factory,
+        sku_attribute_value_factory, db_session, auth_headers_system
+    ):
+        """Test the SKU search vector follows name and attribute value changes."""
+        sku = await sku_factory(name="Basic Tee")
+        attribute = await attribute_factory(name="Color", data_type="TEXT")
+
+        response = await async_client.get(
+            "/api/v1/search/?q=crimson", headers=auth_headers_system
+        )
+        assert response.json()["data"] == []
+
+        attribute_value = await sku_attribute_value_factory(
+            sku=sku, attribute=attribute, value="Crimson"
+        )
+        response = await async_client.get(
+            "/api/v1/search/?q=crimson", headers=auth_headers_system
+        )
+        assert [hit["id"] for hit in response.json()["data"]] == [sku.id]
+
+        sku.name = "Premium Tee"
+        await db_session.delete(attribute_value)
+        await db_session.commit()
+
+        response = await async_client.get(
+            "/api/v1/search/?q=crimson", headers=auth_headers_system
+        )
+        assert response.json()["data"] == []
+        response = await async_client.get(
+            "/api/v1/search/?q=premium", headers=auth_headers_system
+        )
+        assert [hit["id"] for hit in response.json()["data"]] == [sku.id]
+
+    async def test_search_pagination(
+        self, async_client: AsyncClient, category_factory, auth_headers_system
+    ):
+        """Test paging through search hits."""
+        for i in range(3):
+            await category_factory(name=f"Garden Tools {i}")
+
+        response = await async_client.get(
+            "/api/v1/search/?q=garden&skip=2&limit=2", headers=auth_headers_system
+        )
+        body = response.json()
+        assert len(body["data"]) == 1
+        assert body["meta"]["total"] == 3
+        assert body["meta"]["page"] == 2
+
+        response = await async_client.get(
+            "/api/v1/search/?q=garden&skip=4&limit=2", headers=auth_headers_system
+        )
+        body = response.json()
+        assert body["data"] == []
+        assert body["meta"]["total"] == 3
+
+    async def test_search_requires_query(
+        self, async_client: AsyncClient, auth_headers_system
+    ):
+        """Test the search terms are required."""
+        response = await async_client.get(
+            "/api/v1/search/", headers=auth_headers_system
+        )
+        assert response.status_code == 422
+
+    async def test_search_unauthenticated(self, async_client: AsyncClient):
+        """Test searching without authentication."""
+        response = await async_client.get("/api/v1/search/?q=phone")
+        assert response.status_code == 403
+        error = response.json()["error"]
+        assert error["code"] == "HTTP_ERROR_403"
+        assert error["message"] == "Not authenticated"
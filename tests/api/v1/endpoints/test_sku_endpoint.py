@@ -1,5 +1,12 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
 from httpx import AsyncClient
 
+from app.core.config import settings
+
 
 class TestGetSkus:
     """Test cases for GET /skus/ endpoint."""
@@ -68,6 +75,41 @@ class TestGetSkus:
             assert "price_details" in item
             assert "sku_attribute_values" in item
 
+    async def test_get_skus_full_path_across_categories(
+        self, async_client: AsyncClient, category_factory, product_factory,
+        sku_factory, auth_headers_system
+    ):
+        """Test full paths of SKUs that belong to different category chains."""
+        root = await category_factory(name="Beverages")
+        soft_drinks = await category_factory(name="Soft Drinks", parent=root)
+        sodas = await category_factory(name="Sodas", parent=soft_drinks)
+        juices = await category_factory(name="Juices", parent=root)
+        soda = await product_factory(name="Fanta", category=sodas)
+        juice = await product_factory(name="Orange Juice", category=juices)
+        await sku_factory(name="Fanta 1L", product=soda)
+        await sku_factory(name="Fanta 2L", product=soda)
+        await sku_factory(name="Orange Juice 1L", product=juice)
+
+        response = await async_client.get(
+            "/api/v1/skus/", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        paths = {
+            item["name"]: [path_item["name"] for path_item in item["full_path"]]
+            for item in response.json()["data"]
+        }
+        assert paths == {
+            "Fanta 1L": ["Beverages", "Soft Drinks", "Sodas", "Fanta", "Fanta 1L"],
+            "Fanta 2L": ["Beverages", "Soft Drinks", "Sodas", "Fanta", "Fanta 2L"],
+            "Orange Juice 1L": [
+                "Beverages", "Juices", "Orange Juice", "Orange Juice 1L"
+            ],
+        }
+        assert response.json()["data"][0]["full_path"][0]["category_type"] == (
+            "Test Category Type"
+        )
+
     async def test_get_skus_filter_by_name(
         self, async_client: AsyncClient, sku_factory, auth_headers_system
     ):
@@ -540,6 +582,289 @@ class TestCreateSku:
         assert error["details"] is None
 
 
+class TestBulkCreateSkus:
+    """Test cases for POST /skus/bulk endpoint."""
+
+    async def test_bulk_create_skus_success(
+        self, async_client: AsyncClient, product_factory, pricelist_factory,
+        attribute_factory, auth_headers_system
+    ):
+        """Test creating a batch of SKUs in one request."""
+        product = await product_factory(name="T-Shirt")
+        pricelist = await pricelist_factory(name="Retail")
+        attribute = await attribute_factory(name="Size", data_type="TEXT")
+
+        items = [
+            {
+                "name": f"T-Shirt {size}",
+                "description": f"Size {size}",
+                "product_id": product.id,
+                "price_details": [
+                    {"pricelist_id": pricelist.id, "price": 10, "minimum_quantity": 1},
+                    {"pricelist_id": pricelist.id, "price": 9, "minimum_quantity": 10}
+                ],
+                "attribute_values": [
+                    {"attribute_id": attribute.id, "value": f"{size}-fit"}
+                ]
+            }
+            for size in ("S", "M", "L")
+        ]
+
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": items},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 201
+        data = response.json()["data"]
+        assert data["created"] == 3
+        assert data["failed"] == 0
+        assert [item["index"] for item in data["items"]] == [0, 1, 2]
+        assert all(item["success"] for item in data["items"])
+        assert [item["slug"] for item in data["items"]] == [
+            "t-shirt-s", "t-shirt-m", "t-shirt-l"
+        ]
+        assert all(len(item["sku_number"]) == 10 for item in data["items"])
+
+        response = await async_client.get(
+            f"/api/v1/skus/{data['items'][1]['id']}", headers=auth_headers_system
+        )
+        sku = response.json()["data"]
+        assert sku["name"] == "T-Shirt M"
+        assert sku["created_by"] == 1
+        assert [pd["minimum_quantity"] for pd in sku["price_details"]] == [1, 10]
+        assert sku["sku_attribute_values"][0]["value"] == "M-fit"
+        assert [item["type"] for item in sku["full_path"]] == [
+            "Category", "Product", "SKU"
+        ]
+
+        # The search vector is filled although the ORM listeners did not run
+        response = await async_client.get(
+            "/api/v1/search/?q=shirt&types=sku", headers=auth_headers_system
+        )
+        assert response.json()["meta"]["total"] == 3
+        # and includes the attribute values, inserted after the SKUs
+        response = await async_client.get(
+            "/api/v1/search/?q=fit&types=sku", headers=auth_headers_system
+        )
+        assert response.json()["meta"]["total"] == 3
+
+    async def test_bulk_create_skus_reports_invalid_items(
+        self, async_client: AsyncClient, sku_factory, product_factory,
+        pricelist_factory, attribute_factory, auth_headers_system
+    ):
+        """Test invalid items are reported while valid ones are created."""
+        product = await product_factory(name="Laptop")
+        await sku_factory(name="Laptop 8GB", product=product)
+        pricelist = await pricelist_factory(name="Retail")
+        attribute = await attribute_factory(name="Weight", data_type="NUMBER")
+
+        def item(name, **kwargs):
+            return {
+                "name": name,
+                "product_id": product.id,
+                "price_details": [],
+                "attribute_values": [],
+                **kwargs
+            }
+
+        items = [
+            item("Laptop 16GB"),
+            item("Laptop 8GB"),
+            item("laptop 16gb"),
+            item("Laptop 32GB", product_id=999),
+            item("Laptop 64GB", attribute_values=[
+                {"attribute_id": attribute.id, "value": "heavy"}
+            ]),
+            item("Laptop 128GB", attribute_values=[
+                {"attribute_id": 999, "value": "1"}
+            ]),
+            item("Laptop 256GB", price_details=[
+                {"pricelist_id": 999, "price": 1, "minimum_quantity": 1}
+            ]),
+            item("Laptop 512GB", price_details=[
+                {"pricelist_id": pricelist.id, "price": 1, "minimum_quantity": 1},
+                {"pricelist_id": pricelist.id, "price": 2, "minimum_quantity": 1}
+            ]),
+        ]
+
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": items},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 201
+        data = response.json()["data"]
+        assert data["created"] == 2
+        assert data["failed"] == 6
+        results = data["items"]
+        assert [result["success"] for result in results[:3]] == [
+            True, False, True
+        ]
+        assert results[0]["slug"] == "laptop-16gb"
+        assert results[2]["slug"] == "laptop-16gb-2"
+        assert [result["error"] for result in results[1:]] == [
+            "SKU with name 'Laptop 8GB' already exists",
+            None,
+            "Products with id 999 not found",
+            "Invalid value 'heavy' for attribute 'Weight' (expected NUMBER)",
+            "Attributes with IDs {999} not found",
+            "Pricelists with IDs {999} not found",
+            "Price details must have distinct pricelist and minimum quantity "
+            "combinations",
+        ]
+        assert all(result["id"] is None for result in results[3:])
+
+        response = await async_client.get(
+            f"/api/v1/skus/?product_id={product.id}", headers=auth_headers_system
+        )
+        assert [sku["name"] for sku in response.json()["data"]] == [
+            "Laptop 8GB", "Laptop 16GB", "laptop 16gb"
+        ]
+
+    async def test_bulk_create_skus_rejected_item_keeps_slug_free(
+        self, async_client: AsyncClient, product_factory, auth_headers_system
+    ):
+        """Test a rejected item does not block a later one with its slug."""
+        product = await product_factory(name="Laptop")
+        items = [
+            {"name": name, "product_id": product_id, "price_details": [],
+             "attribute_values": []}
+            for name, product_id in [
+                ("Laptop 1TB", 999), ("laptop 1tb", product.id)
+            ]
+        ]
+
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": items},
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 201
+        results = response.json()["data"]["items"]
+        assert results[0]["error"] == "Products with id 999 not found"
+        assert results[1]["success"] is True
+        assert results[1]["slug"] == "laptop-1tb"
+
+    async def test_bulk_create_skus_validation_error(
+        self, async_client: AsyncClient, auth_headers_system
+    ):
+        """Test an empty batch is rejected."""
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": []}, headers=auth_headers_system
+        )
+        assert response.status_code == 422
+
+    async def test_bulk_create_skus_forbidden_for_user(
+        self, async_client: AsyncClient, auth_headers_user
+    ):
+        """Test bulk create is limited to managers and admins."""
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": []}, headers=auth_headers_user
+        )
+        assert response.status_code == 403
+
+
+class TestExportSkus:
+    """Test cases for GET /skus/export endpoint."""
+
+    async def test_export_skus_ndjson(
+        self, async_client: AsyncClient, product_factory, sku_factory,
+        price_detail_factory, pricelist_factory, attribute_factory,
+        sku_attribute_value_factory, auth_headers_system
+    ):
+        """Test exporting SKUs as NDJSON with their relationships."""
+        product = await product_factory(name="Monitor")
+        sku = await sku_factory(name="Monitor 24in", product=product)
+        await sku_factory(name="Monitor 27in", product=product)
+        pricelist = await pricelist_factory(name="Wholesale")
+        await price_detail_factory(
+            sku=sku, pricelist=pricelist, price=150, minimum_quantity=5
+        )
+        attribute = await attribute_factory(name="Panel", data_type="TEXT")
+        await sku_attribute_value_factory(sku=sku, attribute=attribute, value="IPS")
+
+        response = await async_client.get(
+            "/api/v1/skus/export", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="skus.ndjson"' in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["Monitor 24in", "Monitor 27in"]
+        row = rows[0]
+        assert row["id"] == sku.id
+        assert row["sku_number"] == sku.sku_number
+        assert row["product"] == {"id": product.id, "name": "Monitor"}
+        assert row["category"]["id"] == product.category_id
+        assert [item["type"] for item in row["full_path"]] == [
+            "Category", "Product", "SKU"
+        ]
+        assert row["price_details"] == [{
+            "pricelist_id": pricelist.id,
+            "pricelist": "Wholesale",
+            "price": "150.00",
+            "minimum_quantity": 5
+        }]
+        assert row["attribute_values"] == [
+            {"attribute_id": attribute.id, "attribute": "Panel", "value": "IPS"}
+        ]
+        assert rows[1]["price_details"] == []
+
+    async def test_export_skus_csv(
+        self, async_client: AsyncClient, sku_factory, auth_headers_system
+    ):
+        """Test exporting SKUs as CSV."""
+        sku = await sku_factory(name="Webcam HD")
+
+        response = await async_client.get(
+            "/api/v1/skus/export?format=csv", headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(sku.id)
+        assert rows[0]["name"] == "Webcam HD"
+        assert rows[0]["full_path"].endswith(" > Webcam HD")
+        assert json.loads(rows[0]["price_details"]) == []
+
+    async def test_export_skus_updated_since(
+        self, async_client: AsyncClient, product_factory, sku_factory,
+        db_session, auth_headers_system, monkeypatch
+    ):
+        """Test incremental exports in several cursor batches."""
+        monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+        product = await product_factory(name="Keyboard")
+        for i in range(3):
+            await sku_factory(name=f"Keyboard {i}", product=product)
+        old = await sku_factory(name="Keyboard Old", product=product)
+        old.updated_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        await db_session.commit()
+
+        response = await async_client.get(
+            "/api/v1/skus/export", headers=auth_headers_system
+        )
+        assert len(response.text.splitlines()) == 4
+
+        response = await async_client.get(
+            "/api/v1/skus/export",
+            params={"updated_since": "2021-01-01T00:00:00Z"},
+            headers=auth_headers_system
+        )
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == [
+            "Keyboard 0", "Keyboard 1", "Keyboard 2"
+        ]
+
+    async def test_export_skus_unauthenticated(self, async_client: AsyncClient):
+        """Test exporting without authentication."""
+        response = await async_client.get("/api/v1/skus/export")
+        assert response.status_code == 403
+
+
 class TestGetSku:
     """Test cases for GET /skus/{id} endpoint."""
 
@@ -563,6 +888,29 @@ class TestGetSku:
         assert data["price_details"] == []
         assert data["sku_attribute_values"] == []
 
+    async def test_get_sku_not_modified(
+        self, async_client: AsyncClient, sku_factory, price_detail_factory,
+        auth_headers_system
+    ):
+        """Test a SKU is answered 304 until one of its price details changes."""
+        sku = await sku_factory(name="iPhone 15 Pro")
+        url = f"/api/v1/skus/{sku.id}"
+
+        response = await async_client.get(url, headers=auth_headers_system)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        headers = {**auth_headers_system, "If-None-Match": etag}
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        await price_detail_factory(sku=sku)
+        response = await async_client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()["data"]["price_details"]) == 1
+
     async def test_get_sku_not_found(
         self, async_client: AsyncClient, auth_headers_system
     ):
@@ -577,6 +925,17 @@ class TestGetSku:
         assert error["message"] == "SKU with id 999 not found"
         assert error["details"] is None
 
+    async def test_get_sku_not_found_with_wildcard(
+        self, async_client: AsyncClient, auth_headers_system
+    ):
+        """Test If-None-Match: * does not hide a missing SKU behind a 304."""
+        response = await async_client.get(
+            "/api/v1/skus/999",
+            headers={**auth_headers_system, "If-None-Match": "*"}
+        )
+
+        assert response.status_code == 404
+
 
 class TestUpdateSku:
     """Test cases for PUT /skus/{id} endpoint."""
@@ -640,13 +999,15 @@ class TestUpdateSku:
         assert data["slug"] == "iphone-15-pro-max"
         assert data["sku_number"] == sku.sku_number
         assert len(data["full_path"]) == 3
+        # Price details are listed by (sequence, id): the updated one first
         assert len(data["price_details"]) == 2
-        assert data["price_details"][0]["price"] == '2500.00'
-        assert data["price_details"][0]["minimum_quantity"] == 3
+        assert data["price_details"][0]["id"] == price_detail.id
+        assert data["price_details"][0]["price"] == '1600.00'
+        assert data["price_details"][0]["minimum_quantity"] == 2
         assert data["price_details"][0]["pricelist"]["name"] == "Retail"
 
-        assert data["price_details"][1]["price"] == '1600.00'
-        assert data["price_details"][1]["minimum_quantity"] == 2
+        assert data["price_details"][1]["price"] == '2500.00'
+        assert data["price_details"][1]["minimum_quantity"] == 3
         assert data["price_details"][1]["pricelist"]["name"] == "Retail"
 
         assert data["sku_attribute_values"][0]["value"] == "Black"
@@ -925,6 +1286,39 @@ class TestUpdateSku:
         )
         assert error["details"] is None
 
+    async def test_update_sku_many_price_details(
+        self, async_client: AsyncClient, sku_factory, pricelist_factory,
+        price_detail_factory, auth_headers_system
+    ):
+        """Test updating and deleting many price details in one request."""
+        pricelist = await pricelist_factory(name="Retail")
+        sku = await sku_factory(name="iPhone 15 Pro")
+        price_details = [
+            await price_detail_factory(
+                sku=sku, pricelist=pricelist, price=100 + i, minimum_quantity=i
+            )
+            for i in range(1, 11)
+        ]
+
+        update_data = {
+            "price_details_to_update": [
+                {"id": price_detail.id, "price": 1000 + i}
+                for i, price_detail in enumerate(price_details[:5])
+            ],
+            "price_details_to_delete": [
+                price_detail.id for price_detail in price_details[5:]
+            ]
+        }
+        response = await async_client.put(
+            f"/api/v1/skus/{sku.id}", json=update_data, headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert sorted(
+            (pd["minimum_quantity"], pd["price"]) for pd in data["price_details"]
+        ) == [(i + 1, f"{1000 + i}.00") for i in range(5)]
+
     async def test_update_sku_by_user(
         self, async_client: AsyncClient, sku_factory, auth_headers_user
     ):
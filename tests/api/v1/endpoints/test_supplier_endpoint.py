@@ -847,6 +847,50 @@ class TestGetSupplierProducts:
             assert "full_path" in item
             assert item["supplier_id"] == supplier.id
 
+    async def test_get_supplier_products_across_category_hierarchies(
+        self, async_client: AsyncClient, supplier_factory, category_factory,
+        category_type_factory, product_factory, auth_headers_system
+    ):
+        """Test full paths of supplier products placed in different hierarchies."""
+        supplier = await supplier_factory(name="PT Electronics")
+        electronics = await category_factory(
+            name="Electronics",
+            category_type=await category_type_factory(name="Gadget")
+        )
+        phones = await category_factory(name="Mobile Phones", parent=electronics)
+        smartphones = await category_factory(name="Smartphones", parent=phones)
+        food = await category_factory(
+            name="Food",
+            category_type=await category_type_factory(name="Grocery")
+        )
+        await product_factory(
+            name="Smartphone", category=smartphones, supplier=supplier
+        )
+        await product_factory(name="Rice", category=food, supplier=supplier)
+
+        response = await async_client.get(
+            f"/api/v1/suppliers/{supplier.id}/products/",
+            headers=auth_headers_system
+        )
+
+        assert response.status_code == 200
+        paths = {
+            item["name"]: [
+                (path_item["name"], path_item.get("category_type"))
+                for path_item in item["full_path"]
+            ]
+            for item in response.json()["data"]
+        }
+        assert paths == {
+            "Smartphone": [
+                ("Electronics", "Gadget"),
+                ("Mobile Phones", None),
+                ("Smartphones", None),
+                ("Smartphone", None),
+            ],
+            "Rice": [("Food", "Grocery"), ("Rice", None)],
+        }
+
     async def test_get_supplier_products_not_found(
         self, async_client: AsyncClient, auth_headers_system
     ):
@@ -1,6 +1,7 @@
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.dependencies.auth import principal_cache
 from app.models.user_model import Users
 from tests.utils.model_test_utils import save_object
 
@@ -243,6 +244,13 @@ class TestCreateUser:
         # Password should not be returned
         assert "password" not in data
 
+        # The password was hashed exactly once
+        response = await async_client.post(
+            "/api/v1/auth/login",
+            json={"username": "newuser", "password": "newpassword123"}
+        )
+        assert response.status_code == 200
+
     async def test_create_user_duplicate_username(
         self, async_client: AsyncClient, auth_headers_admin, db_session: AsyncSession
     ):
@@ -495,6 +503,45 @@ class TestUpdateUser:
         assert data["email"] == "updated@example.com"
         assert data["username"] == "updatetestuser"  # Unchanged
 
+    async def test_update_user_refreshes_cached_principal(
+        self, async_client: AsyncClient, auth_headers_admin, auth_headers_user
+    ):
+        """Test role and status changes apply to the user's next request."""
+        principal_cache.clear()
+        response = await async_client.get(
+            "/api/v1/profile/me", headers=auth_headers_user
+        )
+        user_id = response.json()["data"]["id"]
+        await async_client.get("/api/v1/profile/me", headers=auth_headers_user)
+        assert principal_cache.stats()["hits"] >= 1
+
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": []}, headers=auth_headers_user
+        )
+        assert response.status_code == 403
+
+        response = await async_client.put(
+            f"/api/v1/users/{user_id}",
+            json={"role": "MANAGER"},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 200
+        response = await async_client.post(
+            "/api/v1/skus/bulk", json={"items": []}, headers=auth_headers_user
+        )
+        assert response.status_code == 422
+
+        response = await async_client.put(
+            f"/api/v1/users/{user_id}",
+            json={"is_active": False},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 200
+        response = await async_client.get(
+            "/api/v1/profile/me", headers=auth_headers_user
+        )
+        assert response.status_code == 401
+
     async def test_update_user_not_found(
         self, async_client: AsyncClient, auth_headers_admin
     ):
@@ -5,7 +5,7 @@ from sqlalchemy import Column, String, Integer, Text, event
 
 from app.core.base import Base
 from app.core.config import settings
-from app.core.listeners import _validate_all_types_on_save
+from app.core.listeners import _get_validation_plan, _validate_all_types_on_save
 from tests.utils.model_test_utils import save_object
 
 
@@ -360,3 +360,14 @@ class TestBaseModel:
             SampleModelBase,
             'before_delete',
             _validate_all_types_on_save)
+
+    def test_validation_plan_is_compiled_once(self):
+        """Test a model's validation plan is compiled once and then reused."""
+        from app.models import Users
+
+        plan = _get_validation_plan(Users)
+
+        assert _get_validation_plan(Users) is plan
+        column_keys = [column_key for column_key, _, _ in plan]
+        assert 'password' not in column_keys
+        assert {'id', 'username', 'email', 'is_active'} <= set(column_keys)
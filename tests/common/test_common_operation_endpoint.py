@@ -7,6 +7,12 @@ that can be applied to any endpoint following the same patterns.
 
 import asyncio
 from httpx import AsyncClient
+from sqlalchemy import select, text
+
+from app.models import CategoryTypes
+from app.repositories.base import _Explain, _table_row_estimates
+from app.repositories.category_type_repository import category_type_repository
+from app.utils.pagination import encode_cursor
 
 
 class TestGetAllModel:
@@ -29,7 +35,9 @@ class TestGetAllModel:
                 "page": 1,
                 "limit": 100,
                 "total": 0,
-                "pages": 0
+                "pages": 0,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -77,8 +85,10 @@ class TestGetAllModel:
             "meta": {
                 "page": 1,
                 "limit": 2,
-                "total": 2,
-                "pages": 1
+                "total": 5,
+                "pages": 3,
+                "cursor": None,
+                "next_cursor": encode_cursor(0, 2)
             },
             "error": None
         }
@@ -118,8 +128,10 @@ class TestGetAllModel:
             "meta": {
                 "page": 2,
                 "limit": 2,
-                "total": 2,
-                "pages": 1
+                "total": 5,
+                "pages": 3,
+                "cursor": None,
+                "next_cursor": encode_cursor(0, 4)
             },
             "error": None
         }
@@ -148,8 +160,10 @@ class TestGetAllModel:
             "meta": {
                 "page": 3,
                 "limit": 2,
-                "total": 1,
-                "pages": 1
+                "total": 5,
+                "pages": 3,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -174,8 +188,10 @@ class TestGetAllModel:
             "meta": {
                 "page": 1,
                 "limit": 100,
-                "total": 0,
-                "pages": 0
+                "total": 3,
+                "pages": 1,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -227,7 +243,9 @@ class TestGetAllModel:
                 "page": 1,
                 "limit": 100,
                 "total": 3,
-                "pages": 1
+                "pages": 1,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -293,6 +311,137 @@ class TestGetAllModel:
             }
         }
 
+    async def test_get_simple_model_total_with_filter(
+        self, async_client: AsyncClient, category_type_factory, auth_headers_system
+    ):
+        """Test total counts all filtered records, not only the current page."""
+        for i in range(5):
+            await category_type_factory(name=f"Category Type {i}")
+        await category_type_factory(name="Other Type")
+
+        response = await async_client.get(
+            "/api/v1/category-types/?name=Category&skip=2&limit=2",
+            headers=auth_headers_system
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["data"]] == [
+            "Category Type 2", "Category Type 3"
+        ]
+        assert data["meta"] == {
+            "page": 2,
+            "limit": 2,
+            "total": 5,
+            "pages": 3,
+            "cursor": None,
+            "next_cursor": encode_cursor(0, 4)
+        }
+
+    async def test_get_simple_model_estimated_total(
+        self, async_client: AsyncClient, category_type_factory, db_session,
+        auth_headers_system
+    ):
+        """Test total estimated from the table statistics."""
+        for i in range(5):
+            await category_type_factory(name=f"Category Type {i}")
+        await db_session.execute(text("ANALYZE category_types"))
+        _table_row_estimates.clear()
+
+        response = await async_client.get(
+            "/api/v1/category-types/?limit=2&count=estimated",
+            headers=auth_headers_system
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["data"]) == 2
+        assert data["meta"] == {
+            "page": 1,
+            "limit": 2,
+            "total": 5,
+            "pages": 3,
+            "cursor": None,
+            "next_cursor": encode_cursor(0, 2)
+        }
+
+        # Filtered queries are estimated from the query plan
+        response = await async_client.get(
+            "/api/v1/category-types/?name=Category&limit=2&count=estimated",
+            headers=auth_headers_system
+        )
+        assert response.status_code == 200
+        assert response.json()["meta"]["total"] >= 2
+
+        # Filter values are bound as parameters, not rendered into the SQL
+        query = select(CategoryTypes).where(CategoryTypes.name == "it's")
+        assert "it's" not in str(_Explain(query).compile(db_session.bind))
+        estimate = await category_type_repository.estimate_count(
+            db_session, query
+        )
+        assert isinstance(estimate, int)
+
+        # The last page always reports the exact total
+        response = await async_client.get(
+            "/api/v1/category-types/?skip=4&limit=2&count=estimated",
+            headers=auth_headers_system
+        )
+        assert response.status_code == 200
+        assert response.json()["meta"]["total"] == 5
+
+        response = await async_client.get(
+            "/api/v1/category-types/?count=invalid", headers=auth_headers_system
+        )
+        assert response.status_code == 422
+
+    async def test_get_simple_model_with_cursor(
+        self, async_client: AsyncClient, category_type_factory, auth_headers_system
+    ):
+        """Test walking through the pages with the cursor of each page."""
+        for i in range(4):
+            await category_type_factory(name=f"Category Type {i}", sequence=1)
+        # Sequence comes before id in the pagination order
+        await category_type_factory(name="First Type", sequence=0)
+        await category_type_factory(name="Last Type", sequence=5)
+
+        names = []
+        cursor = None
+        url = "/api/v1/category-types/?limit=4"
+        for _ in range(2):
+            response = await async_client.get(url, headers=auth_headers_system)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["meta"]["cursor"] == cursor
+            assert data["meta"]["total"] == 6
+            names.extend(item["name"] for item in data["data"])
+            cursor = data["meta"]["next_cursor"]
+            url = f"/api/v1/category-types/?limit=4&cursor={cursor}"
+
+        assert names == [
+            "First Type",
+            "Category Type 0",
+            "Category Type 1",
+            "Category Type 2",
+            "Category Type 3",
+            "Last Type"
+        ]
+        assert cursor is None
+
+        # The cursor takes precedence over skip
+        response = await async_client.get(
+            f"/api/v1/category-types/?skip=3&limit=4&cursor={encode_cursor(1, 3)}",
+            headers=auth_headers_system
+        )
+        assert [item["name"] for item in response.json()["data"]] == [
+            "Category Type 3", "Last Type"
+        ]
+
+        response = await async_client.get(
+            "/api/v1/category-types/?cursor=invalid", headers=auth_headers_system
+        )
+        assert response.status_code == 400
+        error = response.json()["error"]
+        assert error["code"] == "HTTP_ERROR_400"
+        assert error["message"] == "Invalid cursor"
+
     async def test_get_simple_model_with_images(
         self, async_client: AsyncClient, category_factory, image_factory,
         auth_headers_system
@@ -385,7 +534,9 @@ class TestGetAllModel:
                 "page": 1,
                 "limit": 100,
                 "total": 2,
-                "pages": 1
+                "pages": 1,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -988,17 +1139,17 @@ class TestUpdateModel:
                     }
                 ],
                 "images": [
-                    {
-                        "id": 3,
-                        "file": "test_folder/test3.jpg",
-                        "title": "Test Image 3",
-                        "is_primary": True
-                    },
                     {
                         "id": 2,
                         "file": "test_folder/test8.jpg",
                         "title": "Test Image 2",
                         "is_primary": False
+                    },
+                    {
+                        "id": 3,
+                        "file": "test_folder/test3.jpg",
+                        "title": "Test Image 3",
+                        "is_primary": True
                     }
                 ],
                 "created_at": data["data"]["created_at"],
@@ -1423,7 +1574,9 @@ class TestGetChildrenByModel:
                 "page": 1,
                 "limit": 100,
                 "total": 0,
-                "pages": 0
+                "pages": 0,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -1504,8 +1657,10 @@ class TestGetChildrenByModel:
             "meta": {
                 "page": 1,
                 "limit": 2,
-                "total": 2,
-                "pages": 1
+                "total": 5,
+                "pages": 3,
+                "cursor": None,
+                "next_cursor": encode_cursor(0, 2)
             },
             "error": None
         }
@@ -1571,8 +1726,10 @@ class TestGetChildrenByModel:
             "meta": {
                 "page": 2,
                 "limit": 2,
-                "total": 2,
-                "pages": 1
+                "total": 5,
+                "pages": 3,
+                "cursor": None,
+                "next_cursor": encode_cursor(0, 4)
             },
             "error": None
         }
@@ -1604,8 +1761,10 @@ class TestGetChildrenByModel:
             "meta": {
                 "page": 1,
                 "limit": 100,
-                "total": 0,
-                "pages": 0
+                "total": 3,
+                "pages": 1,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -1697,7 +1856,9 @@ class TestGetChildrenByModel:
                 "page": 1,
                 "limit": 100,
                 "total": 3,
-                "pages": 1
+                "pages": 1,
+                "cursor": None,
+                "next_cursor": None
             },
             "error": None
         }
@@ -13,6 +13,7 @@ from app.core.config import settings
 from app.core.base import Base
 from app.models.user_model import Users
 from app.core.session import get_db
+from app.api.v1.dependencies.auth import principal_cache
 from app.main import app
 
 # Import all factory fixtures to make them available to tests
@@ -160,6 +161,8 @@ async def async_client(db_engine) -> AsyncGenerator:
 
     # Apply the override
     app.dependency_overrides[get_db] = override_get_db
+    # User ids are reused by every test database
+    principal_cache.clear()
 
     # Create a client using ASGITransport for newer httpx versions
     async with AsyncClient(
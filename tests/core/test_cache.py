@@ -0,0 +1,64 @@
+from app.core import cache
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for the TTL + LRU cache."""
+
+    def test_get_and_set(self):
+        """Test cached values are returned and counted as hits."""
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+        assert ttl_cache.get("a") is None
+        ttl_cache.set("a", 1)
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the least recently used entry is dropped when full."""
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")
+        ttl_cache.set("c", 3)
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("c") == 3
+        assert len(ttl_cache) == 2
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are missed once their time to live has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        ttl_cache = TTLCache(maxsize=2, ttl=30)
+        ttl_cache.set("a", 1)
+        now[0] += 29
+        assert ttl_cache.get("a") == 1
+        now[0] += 1
+        assert ttl_cache.get("a") is None
+        assert len(ttl_cache) == 0
+
+    def test_invalid_entries_are_missed(self):
+        """Test entries failing the validity check are dropped as misses."""
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+        ttl_cache.set("a", 1)
+        assert ttl_cache.get("a", lambda value: value == 1) == 1
+        assert ttl_cache.get("a", lambda value: value == 2) is None
+        assert ttl_cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+    def test_invalidate_and_clear(self):
+        """Test entries can be dropped one by one or all at once."""
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.invalidate("a")
+        ttl_cache.invalidate("missing")
+        assert ttl_cache.get("a") is None
+        assert ttl_cache.get("b") == 2
+        ttl_cache.clear()
+        assert ttl_cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+    def test_disabled_cache(self):
+        """Test a cache without room stores nothing."""
+        ttl_cache = TTLCache(maxsize=0, ttl=60)
+        ttl_cache.set("a", 1)
+        assert ttl_cache.get("a") is None
@@ -0,0 +1,195 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.core.listeners import DateTimeValidator, prepare_rows_for_insert
+from app.core.security import verify_password
+from app.models import (
+    Attributes, Categories, CategoryTypes, Images, Suppliers, Users
+)
+from app.repositories import (
+    category_repository, category_type_repository, user_repository
+)
+from app.schemas.category_schema import CategoryCreate
+from app.schemas.user_schema import UserCreate
+
+
+def parse_with_strptime(value):
+    """Parse a value by trying every format with strptime, in order."""
+    for fmt in DateTimeValidator.FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class TestDateTimeParsing:
+    """Test cases for parsing datetime strings in DateTimeValidator."""
+
+    @pytest.mark.parametrize("value", [
+        "2025-06-02 23:20:35.661597+08:00",
+        "2025-06-02 23:20:35.661597++0800",
+        "2025-06-02 23:20:35.661597",
+        "2023-12-25 14:30:00",
+        "2023-12-25T14:30:00",
+        "2023-12-25T14:30:00Z",
+        "2023-12-25T14:30:00.123456",
+        "2023-12-25T14:30:00.123",
+        "2023-12-25T14:30:00.123456Z",
+        "2023-12-25T14:30:00.123456+01:00",
+        "2023-12-25T14:30:00+01:00",
+        "2023-12-25T14:30:00-0530",
+        "2023-12-25",
+        "2023-1-5",
+        "2023-12-25t14:30:00z",
+        "2023-12-25   14:30:00",
+        "2023-12-25 14:30:00+01:00",
+        "2023-12-25 14:30:00.123456+01:60",
+        "2023-12-25T14:30:00.1234567",
+        "2023-02-30",
+        "2023-12-25 24:00:00",
+        "2023-12-25 14:30:60",
+        "2025-06-02 23:20:35+08",
+        "05-06-2025",
+        "test",
+    ])
+    def test_parse_matches_strptime(self, value):
+        """Test values are parsed exactly as by trying every format."""
+        expected = parse_with_strptime(value)
+        parsed = DateTimeValidator.parse(value)
+
+        assert parsed == expected
+        if expected is not None:
+            assert parsed.utcoffset() == expected.utcoffset()
+
+    def test_parse_results(self):
+        """Test the parsed values of common formats."""
+        assert DateTimeValidator.parse("2023-12-25") == datetime(2023, 12, 25)
+        assert DateTimeValidator.parse(
+            "2023-12-25T14:30:00.123456+01:00"
+        ) == datetime(
+            2023, 12, 25, 14, 30, 0, 123456,
+            tzinfo=timezone(timedelta(hours=1))
+        )
+        # A literal Z is accepted without making the value timezone aware
+        assert DateTimeValidator.parse("2023-12-25T14:30:00Z").tzinfo is None
+        assert DateTimeValidator.parse("2023-12-25 14:30") is None
+
+
+class TestPrepareRowsForInsert:
+    """Test cases for preparing rows of Core inserts."""
+
+    def test_rows_are_validated_and_derived(self):
+        """Test rows get the values the ORM listeners would set."""
+        rows = prepare_rows_for_insert(Suppliers, [
+            {
+                'name': '  Supplier One ',
+                'slug': 'ignored',
+                'company_type': 'PT',
+                'contact': '081234567890',
+                'email': 'ONE@Example.com'
+            },
+            {
+                'name': 'Supplier Two',
+                'company_type': 'CV',
+                'contact': '081234567891',
+                'email': 'two@example.com'
+            }
+        ])
+
+        assert [row['name'] for row in rows] == ['Supplier One', 'Supplier Two']
+        assert [row['slug'] for row in rows] == ['supplier-one', 'supplier-two']
+        assert rows[0]['email'] == 'one@example.com'
+
+        rows = prepare_rows_for_insert(Attributes, [{'name': 'Screen size'}])
+        assert rows[0]['code'] == 'SCREEN-SIZE'
+
+        rows = prepare_rows_for_insert(Images, [{'file': ' image.jpg '}])
+        assert rows[0]['file'] == 'image.jpg'
+
+        rows = prepare_rows_for_insert(Users, [{'password': 'secret123'}])
+        assert verify_password('secret123', rows[0]['password'])
+
+    def test_invalid_row_raises(self):
+        """Test invalid values raise the errors of the ORM listeners."""
+        with pytest.raises(
+            ValueError, match="Column 'contact' must contain only digits"
+        ):
+            prepare_rows_for_insert(Suppliers, [
+                {'name': 'Supplier', 'contact': '0812-3456'}
+            ])
+
+
+class TestBulkInsert:
+    """Test cases for the Core bulk insert of repositories."""
+
+    async def test_create_bulk_categories(
+        self, db_session, category_type_factory, category_factory
+    ):
+        """Test bulk inserted categories get their slug and path."""
+        category_type = await category_type_factory(name="Goods")
+        parent = await category_factory(
+            name="Electronics", category_type_id=category_type.id
+        )
+
+        created = await category_repository.create_bulk(
+            db_session,
+            [
+                CategoryCreate(name=" Phones ", parent_id=parent.id),
+                {'name': 'Furniture', 'category_type_id': category_type.id}
+            ],
+            created_by=1
+        )
+
+        result = await db_session.execute(
+            select(Categories)
+            .where(Categories.id.in_([row.id for row in created]))
+            .order_by(Categories.id)
+        )
+        phones, furniture = result.scalars().all()
+        assert phones.name == "Phones"
+        assert phones.slug == "phones"
+        assert phones.ancestor_ids == [parent.id]
+        assert phones.ancestor_slugs == ["electronics"]
+        assert phones.root_category_type == "Goods"
+        assert furniture.ancestor_ids == []
+        assert furniture.root_category_type == "Goods"
+
+    async def test_create_bulk_suffixes_slug_collisions(
+        self, db_session, category_type_factory
+    ):
+        """Test colliding slugs are suffixed instead of failing the insert."""
+        await category_type_factory(name="Goods")
+
+        created = await category_type_repository.create_bulk(
+            db_session,
+            [{'name': 'goods'}, {'name': 'Goods '}],
+            created_by=1,
+            returning=[CategoryTypes.slug]
+        )
+
+        assert [row.slug for row in created] == ["goods-2", "goods-3"]
+
+    async def test_create_bulk_users(self, db_session):
+        """Test bulk inserted users get hashed passwords."""
+        created = await user_repository.create_bulk(
+            db_session,
+            [
+                UserCreate(
+                    username=f"bulkuser{i}",
+                    email=f"bulkuser{i}@example.com",
+                    name=f"Bulk User {i}",
+                    password="secret123"
+                )
+                for i in range(3)
+            ],
+            created_by=1,
+            returning=[Users.password]
+        )
+
+        assert len(created) == 3
+        for row in created:
+            assert row.password != "secret123"
+            assert verify_password("secret123", row.password)
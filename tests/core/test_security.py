@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+from app.core import cache
+from app.core.security import (
+    HashedPassword,
+    PasswordHasherPool,
+    create_access_token,
+    create_refresh_token,
+    hash_password_async,
+    password_hasher_pool,
+    token_cache,
+    verify_password,
+    verify_password_async,
+    verify_refresh_token,
+    verify_token,
+)
+
+
+class TestTokenCache:
+    """Test cases for the verified token cache."""
+
+    def setup_method(self):
+        token_cache.clear()
+
+    def test_verified_token_is_cached(self):
+        """Test a token is verified once and then served from the cache."""
+        token = create_access_token(subject=42)
+
+        assert verify_token(token) == "42"
+        assert verify_token(token) == "42"
+        assert token_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+        refresh_token = create_refresh_token(subject=42)
+        assert verify_refresh_token(refresh_token) == "42"
+        # An access token is still not accepted as a refresh token
+        assert verify_refresh_token(token) is None
+
+    def test_invalid_token_is_not_cached(self):
+        """Test tampered tokens are rejected and never cached."""
+        token = create_access_token(subject=42)
+        tampered = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+
+        assert verify_token(tampered) is None
+        assert verify_token("not-a-token") is None
+        assert len(token_cache) == 0
+
+    def test_cached_token_expires_with_token(self, monkeypatch):
+        """Test a cached token is dropped when the token expires."""
+        token = create_access_token(
+            subject=42, expires_delta=timedelta(seconds=60)
+        )
+        assert verify_token(token) == "42"
+
+        monotonic = cache.time.monotonic()
+        monkeypatch.setattr(cache.time, "monotonic", lambda: monotonic + 50)
+        assert verify_token(token) == "42"
+        assert token_cache.stats()["hits"] == 1
+
+        monkeypatch.setattr(cache.time, "monotonic", lambda: monotonic + 61)
+        verify_token(token)
+        assert token_cache.stats()["hits"] == 1
+        assert token_cache.stats()["misses"] == 2
+
+
+class TestPasswordHasherPool:
+    """Test cases for hashing passwords off the event loop."""
+
+    async def test_hash_and_verify_in_pool(self):
+        """Test passwords are hashed and verified in the pool."""
+        tasks = password_hasher_pool.tasks
+
+        hashed = await hash_password_async("secret123")
+
+        assert isinstance(hashed, HashedPassword)
+        assert verify_password("secret123", hashed)
+        assert await verify_password_async("secret123", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+        assert password_hasher_pool.tasks == tasks + 3
+
+    async def test_event_loop_runs_while_hashing(self):
+        """Test the event loop keeps running while the pool works."""
+        pool = PasswordHasherPool(max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.gather(*(
+            pool.run(verify_password, "secret", hashed)
+            for hashed in [await hash_password_async("secret")] * 3
+        ))
+        ticker_task.cancel()
+
+        assert ticks > 3
+        stats = pool.stats()
+        assert stats["tasks"] == 3
+        assert stats["in_flight"] == 0
+        # With one worker the later calls had to wait for the first one
+        assert stats["queue_seconds_max"] > 0
+        assert stats["run_seconds_avg"] > 0
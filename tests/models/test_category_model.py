@@ -1,4 +1,6 @@
-from sqlalchemy import String, event, Text, Integer, CheckConstraint, select
+from sqlalchemy import (
+    String, event, Text, Integer, CheckConstraint, Index, select
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
@@ -68,14 +70,14 @@ class TestCategory:
         """Test that the table has the expected table args"""
         table_args = Categories.__table_args__
 
-        # Check that we have exactly 2 constraints
-        assert len(table_args) == 2
+        # Check that we have exactly 2 constraints and 3 indexes
+        assert len(table_args) == 5
 
-        # Check that both are CheckConstraints
-        assert all(isinstance(arg, CheckConstraint) for arg in table_args)
+        # Check that the first two are CheckConstraints
+        assert all(isinstance(arg, CheckConstraint) for arg in table_args[:2])
 
         # Check constraint names and order
-        constraint_names = [arg.name for arg in table_args]
+        constraint_names = [arg.name for arg in table_args[:2]]
         expected_names = [
             'check_category_hierarchy_rule',
             'check_category_no_self_reference'
@@ -92,6 +94,24 @@ class TestCategory:
         )
         assert str(self_ref_constraint.sqltext) == 'id <> parent_id'
 
+        # Check the GIN index used to find the descendants of a category
+        ancestor_index = table_args[2]
+        assert isinstance(ancestor_index, Index)
+        assert ancestor_index.name == 'ix_categories_ancestor_ids'
+        assert ancestor_index.dialect_options['postgresql']['using'] == 'gin'
+
+        # Check the index used for keyset pagination
+        keyset_index = table_args[3]
+        assert isinstance(keyset_index, Index)
+        assert keyset_index.name == 'ix_categories_sequence_id'
+        assert [column.name for column in keyset_index.columns] == ['sequence', 'id']
+
+        # Check the GIN index used for full-text search
+        search_index = table_args[4]
+        assert isinstance(search_index, Index)
+        assert search_index.name == 'ix_categories_search_vector'
+        assert search_index.dialect_options['postgresql']['using'] == 'gin'
+
     def test_name_field_properties(self):
         """Test the properties of the name field"""
         name_column = Categories.__table__.columns.get('name')
@@ -807,6 +827,124 @@ class TestCategoryCategoryRelationship:
         assert category.parent == another_parent
         assert category.parent.name == "another parent category"
 
+    @pytest.mark.asyncio
+    async def test_materialized_path_on_create(self, db_session: AsyncSession):
+        """Test that the materialized path is set when a category is created"""
+        level3_category = Categories(
+            name="level 3 category",
+            parent_id=self.test_category2.id
+        )
+        await save_object(db_session, level3_category)
+
+        assert level3_category.ancestor_ids == [
+            self.test_category1.id, self.test_category2.id
+        ]
+        assert level3_category.ancestor_names == [
+            "Test Category 1", "Test Category 2"
+        ]
+        assert level3_category.ancestor_slugs == [
+            "test-category-1", "test-category-2"
+        ]
+        assert level3_category.root_category_type == "Test Category Type"
+        assert self.test_category1.ancestor_ids == []
+        assert self.test_category1.root_category_type == "Test Category Type"
+
+    @pytest.mark.asyncio
+    async def test_materialized_path_on_move_subtree(
+        self, db_session: AsyncSession
+    ):
+        """Test that moving a category rewrites the path of its whole subtree"""
+        another_type = CategoryTypes(name="Another Category Type")
+        await save_object(db_session, another_type)
+        another_parent = Categories(
+            name="another parent category",
+            category_type_id=another_type.id
+        )
+        await save_object(db_session, another_parent)
+        level3_category = Categories(
+            name="level 3 category",
+            parent_id=self.test_category2.id
+        )
+        await save_object(db_session, level3_category)
+        level4_category = Categories(
+            name="level 4 category",
+            parent_id=level3_category.id
+        )
+        await save_object(db_session, level4_category)
+
+        # Move the level 2 category (and its subtree) under another parent
+        self.test_category2.parent_id = another_parent.id
+        await save_object(db_session, self.test_category2)
+
+        await db_session.refresh(level4_category)
+        assert [item['name'] for item in level4_category.full_path] == [
+            "another parent category",
+            "Test Category 2",
+            "level 3 category",
+            "level 4 category"
+        ]
+        assert level4_category.full_path[0]['category_type'] == (
+            "Another Category Type"
+        )
+
+        retrieved_category = level4_category
+        assert retrieved_category.ancestor_ids == [
+            another_parent.id, self.test_category2.id, level3_category.id
+        ]
+        assert retrieved_category.ancestor_slugs == [
+            "another-parent-category", "test-category-2", "level-3-category"
+        ]
+        assert retrieved_category.root_category_type == "Another Category Type"
+
+    @pytest.mark.asyncio
+    async def test_materialized_path_on_rename(self, db_session: AsyncSession):
+        """Test that renaming a category or its type updates the descendants"""
+        category = await get_object_by_id(
+            db_session, Categories, self.test_category1.id
+        )
+        category.name = "Renamed Category"
+        await save_object(db_session, category)
+        category_type = await get_object_by_id(
+            db_session, CategoryTypes, self.test_category_type.id
+        )
+        category_type.name = "Renamed Category Type"
+        await save_object(db_session, category_type)
+
+        retrieved_category = await get_object_by_id(
+            db_session, Categories, self.test_category2.id
+        )
+        await db_session.refresh(retrieved_category)
+        assert retrieved_category.full_path == [
+            {
+                'name': 'Renamed Category',
+                'slug': 'renamed-category',
+                'category_type': 'Renamed Category Type',
+                'type': 'Category'
+            },
+            {
+                'name': 'Test Category 2',
+                'slug': 'test-category-2',
+                'category_type': None,
+                'type': 'Category'
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_move_category_under_own_descendant_fails(
+        self, db_session: AsyncSession
+    ):
+        """Test that a category cannot be moved under its own descendant"""
+        level3_category = Categories(
+            name="level 3 category",
+            parent_id=self.test_category2.id
+        )
+        await save_object(db_session, level3_category)
+
+        self.test_category2.parent_id = level3_category.id
+        with pytest.raises(ValueError, match="its own descendant"):
+            await save_object(db_session, self.test_category2)
+        await db_session.rollback()
+
     @pytest.mark.asyncio
     async def test_create_category_with_invalid_parent_id(
         self, db_session: AsyncSession
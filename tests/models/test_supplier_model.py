@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text, event, select, Enum
+from sqlalchemy import String, Text, event, select, update, Enum
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
@@ -413,6 +413,47 @@ class TestSupplierValidationApplication:
                 await save_object(db_session, supplier)
             await db_session.rollback()
 
+    @pytest.mark.asyncio
+    async def test_update_skips_unchanged_columns(self, db_session: AsyncSession):
+        """Test an update only validates the columns it changes"""
+        supplier = Suppliers(
+            name="Legacy Supplier",
+            company_type="PT",
+            address="test address",
+            contact="081234567894",
+            email="legacy@example.com"
+        )
+        await save_object(db_session, supplier)
+
+        # Legacy values stored before the model normalized them
+        await db_session.execute(
+            update(Suppliers.__table__)
+            .where(Suppliers.__table__.c.id == supplier.id)
+            .values(address="  legacy address  ", email="LEGACY@EXAMPLE.COM")
+        )
+        await db_session.commit()
+        await db_session.refresh(supplier)
+
+        supplier.company_type = "CV"
+        await save_object(db_session, supplier)
+        assert supplier.company_type == "CV"
+        assert supplier.address == "  legacy address  "
+        assert supplier.email == "LEGACY@EXAMPLE.COM"
+
+        # Changed columns are still validated
+        supplier.email = "NEW@EXAMPLE.COM"
+        await save_object(db_session, supplier)
+        assert supplier.email == "new@example.com"
+        assert supplier.address == "  legacy address  "
+
+        supplier.contact = "0812-345-679"
+        with pytest.raises(
+            ValueError,
+            match="Column 'contact' must contain only digits"
+        ):
+            await save_object(db_session, supplier)
+        await db_session.rollback()
+
 
 class TestSupplierProductRelationship:
     """Test suite for Supplier model relationships with Product model"""
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.exceptions import NotModifiedException
+from app.utils.etag import ConditionalRequest, etag_matches, make_etag
+
+
+class TestMakeEtag:
+    """Test cases for entity tags of versions."""
+
+    def test_weak_and_stable(self):
+        """Test the same version always gets the same weak tag."""
+        version = (2, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        etag = make_etag(version)
+
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert make_etag(version) == etag
+
+    def test_changes_with_version(self):
+        """Test a newer updated_at or another count changes the tag."""
+        updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        assert make_etag((2, updated_at)) != make_etag((2, later))
+        assert make_etag((2, updated_at)) != make_etag((1, updated_at))
+
+
+class TestEtagMatches:
+    """Test cases for If-None-Match comparison."""
+
+    def test_weak_comparison(self):
+        """Test tags match with or without the weak prefix."""
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('"abc"', 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+
+    def test_list_and_wildcard(self):
+        """Test any tag of a list or '*' matches."""
+        assert etag_matches('W/"xyz", W/"abc"', 'W/"abc"')
+        assert etag_matches('*', 'W/"abc"')
+
+    def test_wildcard_needs_existing_data(self):
+        """Test '*' does not match when there is no current data."""
+        assert not etag_matches('*', 'W/"abc"', exists=False)
+        assert etag_matches('W/"abc"', 'W/"abc"', exists=False)
+
+    def test_missing_header(self):
+        """Test a request without If-None-Match never matches."""
+        assert not etag_matches(None, 'W/"abc"')
+        assert not etag_matches('', 'W/"abc"')
+
+
+class TestConditionalRequest:
+    """Test cases for checking conditional requests."""
+
+    def test_check_sets_etag(self):
+        """Test a request without a matching tag gets the current one."""
+        conditional = ConditionalRequest(None, ('/api/v1/skus/1', ()))
+
+        conditional.check((1, None))
+
+        assert conditional.etag == make_etag((('/api/v1/skus/1', ()), (1, None)))
+
+    def test_check_raises_not_modified(self):
+        """Test a request with the current tag is not modified."""
+        scope = ('/api/v1/skus/1', ())
+        etag = make_etag((scope, (1, None)))
+
+        with pytest.raises(NotModifiedException) as exc_info:
+            ConditionalRequest(etag, scope).check((1, None))
+
+        assert exc_info.value.etag == etag
+
+    def test_wildcard_only_matches_existing_rows(self):
+        """Test '*' matches a version with rows but not an empty one."""
+        scope = ('/api/v1/skus/1', ())
+
+        with pytest.raises(NotModifiedException):
+            ConditionalRequest('*', scope).check((1, None))
+        ConditionalRequest('*', scope).check((0, None))
+
+    def test_scope_is_part_of_tag(self):
+        """Test the same version answers other URLs with other tags."""
+        first = ConditionalRequest(None, ('/api/v1/skus/', (('limit', '10'),)))
+        second = ConditionalRequest(None, ('/api/v1/skus/', (('limit', '20'),)))
+
+        first.check((5, None))
+        second.check((5, None))
+
+        assert first.etag != second.etag
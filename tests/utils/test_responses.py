@@ -0,0 +1,24 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.utils.responses import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """Test cases for the orjson response class."""
+
+    def test_renders_like_json_mode(self):
+        """Test decimals and datetimes are written like pydantic writes them."""
+        response = FastJSONResponse({
+            "price": Decimal("1999.90"),
+            "updated_at": datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            "name": "Café"
+        })
+
+        assert json.loads(response.body) == {
+            "price": "1999.90",
+            "updated_at": "2024-01-01T12:30:00Z",
+            "name": "Café"
+        }
+        assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from app.core.cache import TTLCache
+from app.utils.serialization import FragmentSerializer
+
+
+class ItemResponse(BaseModel):
+    id: int
+    name: str
+    updated_at: datetime
+
+
+def make_serializer() -> FragmentSerializer:
+    return FragmentSerializer(
+        ItemResponse,
+        lambda item: item.updated_at,
+        TTLCache(maxsize=10, ttl=60)
+    )
+
+
+class TestFragmentSerializer:
+    """Test cases for cached response fragments."""
+
+    def test_fragment_is_json_ready(self):
+        """Test fragments are dumped in JSON mode."""
+        item = SimpleNamespace(
+            id=1, name="Phone",
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        fragment = make_serializer().serialize(item)
+        assert fragment == {
+            "id": 1, "name": "Phone", "updated_at": "2024-01-01T00:00:00Z"
+        }
+
+    def test_fragment_is_reused_until_the_version_changes(self):
+        """Test the cached fragment is only served for the same version."""
+        serializer = make_serializer()
+        item = SimpleNamespace(
+            id=1, name="Phone",
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        first = serializer.serialize(item)
+        item.name = "Tablet"
+        assert serializer.serialize(item) is first
+
+        item.updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert serializer.serialize(item)["name"] == "Tablet"
+        stats = serializer.cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
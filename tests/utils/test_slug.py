@@ -0,0 +1,55 @@
+from app.utils.slug import (
+    allocate_slugs, make_code, make_slug, make_slugs, slug_prefixes
+)
+
+
+class TestSlugGeneration:
+    """Test cases for memoised slug and code generation."""
+
+    def test_make_slug_and_code(self):
+        """Test slugs and codes are derived from names."""
+        assert make_slug("Screen Size") == "screen-size"
+        assert make_code("Screen Size") == "SCREEN-SIZE"
+
+    def test_make_slug_is_memoised(self):
+        """Test repeated names are served from the cache."""
+        make_slug.cache_clear()
+        make_slug("Laptop Pro")
+        make_slug("Laptop Pro")
+        info = make_slug.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_make_slugs(self):
+        """Test batch slugs keep the input order."""
+        assert make_slugs(["Phone A", "Phone B", "Phone A"]) == [
+            "phone-a", "phone-b", "phone-a"
+        ]
+
+
+class TestSlugAllocation:
+    """Test cases for allocating unique slugs."""
+
+    def test_collisions_are_suffixed(self):
+        """Test taken and repeated slugs get the next free suffix."""
+        allocated = allocate_slugs(
+            ["phone", "phone", "laptop", "phone"],
+            taken=["phone", "phone-2"],
+            max_length=100
+        )
+        assert allocated == ["phone-3", "phone-4", "laptop", "phone-5"]
+
+    def test_suffixed_slugs_fit_the_column(self):
+        """Test suffixed slugs are truncated to the column length."""
+        slug = "a" * 10
+        allocated = allocate_slugs([slug, slug], taken=[], max_length=10)
+        assert allocated == [slug, "a" * 8 + "-2"]
+
+    def test_prefixes_cover_suffixed_slugs(self):
+        """Test every suffixed variant starts with a looked up prefix."""
+        slug = "b" * 100
+        prefixes = slug_prefixes([slug], max_length=100)
+        allocated = allocate_slugs([slug] * 3, taken=[], max_length=100)
+        assert all(
+            any(candidate.startswith(prefix) for prefix in prefixes)
+            for candidate in allocated
+        )